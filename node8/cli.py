@@ -1,34 +1,528 @@
 """CLI entry point of Node8 linter."""
 
 import argparse
+import sys
+import time
+from collections.abc import Iterable
+from contextlib import ExitStack
 from pathlib import Path
+from typing import Any, Final
 
 from node8.core.config import Config
+from node8.models.errors import SceneError, ScriptError
+from node8.models.references import SceneReferences
+from node8.models.results import SceneErrorRecord
+from node8.models.symbols import ScriptSymbols
 from node8.services import gdscript, scenes
-from node8.services.format import print_errors
+from node8.services.baseline import (
+    DEFAULT_BASELINE,
+    BaselineFilter,
+    write_baseline,
+)
+from node8.services.format import (
+    STATISTICS_TOP,
+    print_baseline,
+    print_errors,
+    print_profile,
+    print_runs,
+    print_statistics,
+)
+from node8.services.patterns import validate_rules
+from node8.services.references import ReferenceIndex
+from node8.services.results import (
+    dump_results,
+    from_scene_record,
+    load_results,
+    to_scene_record,
+)
+from node8.services.runs import (
+    append_run,
+    create_run,
+    find_regressions,
+    get_runs_path,
+    load_runs,
+)
+from node8.services.schedule import History
+from node8.services.shard import parse_shard, select_shard
+from node8.services.spool import RecordStore, Spool
+from node8.services.statistics import collect_statistics
+from node8.services.symbols import SymbolIndex
+
+MERGE_COMMAND: Final[str] = "merge"
+STATS_COMMAND: Final[str] = "stats"
+STATS_LAST: Final[int] = 20
+EXIT_CODE_ERRORS: Final[int] = 1
+
+STATISTICS_TABLE: Final[str] = "table"
+STATISTICS_JSON: Final[str] = "json"
+
+Spools = tuple[Spool[ScriptError], Spool[SceneErrorRecord]]
 
 
 def check() -> None:
     """CLI entry point.
 
-    Accepts paths and runs linter.
+    Accepts paths and runs linter. Dispatches to `merge` and `stats`
+    commands when given as the first argument.
     """
+    argv = sys.argv[1:]
+    if argv[:1] == [MERGE_COMMAND]:
+        merge(argv[1:])
+        return
+
+    if argv[:1] == [STATS_COMMAND]:
+        stats(argv[1:])
+        return
+
+    started = time.time()
     parser = _argparser_init()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     path = Path(args.path)
     config = Config.from_toml(path)
+    try:
+        validate_rules(config.bans)
+    except ValueError as error:
+        parser.error(f"invalid ban: {error}")
+    baseline = _load_baseline(parser, args, path)
+    history = History.load(path, config=config)
+
+    script_paths: list[Path] | None = None
+    scene_paths: list[Path] | None = None
+    output: Path | None = args.output
+    if args.shard is not None:
+        index, count = args.shard
+        script_paths = list(path.rglob("*.gd"))
+        scene_paths = list(path.rglob("*.tscn"))
+        selected = set(
+            select_shard([*script_paths, *scene_paths], index, count, path),
+        )
+        script_paths = [p for p in script_paths if p in selected]
+        scene_paths = [p for p in scene_paths if p in selected]
+        output = output or Path(f"node8-shard-{index}-of-{count}.json")
+
+    spools: Spools | None = None
+    if args.low_memory:
+        spools = (
+            Spool(ScriptError, _script_error_key, config.spill_threshold),
+            Spool(SceneErrorRecord, _scene_error_key, config.spill_threshold),
+        )
+    with ExitStack() as stores:
+        references = _load_indexes(
+            path,
+            config,
+            stores,
+            low_memory=args.low_memory,
+        )
+        script_errors, scene_errors = _lint(
+            path,
+            args,
+            config,
+            history,
+            references,
+            (script_paths, scene_paths),
+            baseline,
+            spools,
+        )
+
+        history.save()
+        references.symbols.save()
+
+    if spools is None:
+        _sort_errors(script_errors, scene_errors)
+        if args.record:
+            _record_run(
+                path,
+                config,
+                started,
+                history,
+                (
+                    script_errors,
+                    scene_errors,
+                ),
+            )
+        _output(
+            path,
+            args,
+            output,
+            config,
+            (script_errors, scene_errors),
+            total=len(script_errors) + len(scene_errors),
+        )
+    else:
+        with spools[0] as script_spool, spools[1] as scene_spool:
+            script_spool.extend(script_errors)
+            scene_spool.extend(map(to_scene_record, scene_errors))
+            del script_errors, scene_errors
+            if args.record:
+                _record_run(
+                    path,
+                    config,
+                    started,
+                    history,
+                    (
+                        script_spool,
+                        map(from_scene_record, scene_spool),
+                    ),
+                )
+            _output(
+                path,
+                args,
+                output,
+                config,
+                (script_spool, map(from_scene_record, scene_spool)),
+                total=len(script_spool) + len(scene_spool),
+            )
+    if args.profile:
+        print_profile(history, config=config)
+
+
+def _load_indexes(
+    path: Path,
+    config: Config,
+    stores: ExitStack,
+    *,
+    low_memory: bool = False,
+) -> ReferenceIndex:
+    """Load symbol index and create cross-reference index using it.
+
+    In low memory mode, script symbols and scene references are kept in
+    record stores closed with given stack instead of in memory.
+
+    :param path: Linted directory.
+    :param config: Linter configuration.
+    :param stores: Stack to close record stores with.
+    :param low_memory: Keep indexes in record stores.
+    :returns: Cross-reference index with loaded symbol index.
+    """
+    if not low_memory:
+        return ReferenceIndex(path, SymbolIndex.load(path, config=config))
+    symbols = SymbolIndex.load(
+        path,
+        config=config,
+        scripts=stores.enter_context(RecordStore(ScriptSymbols)),
+    )
+    return ReferenceIndex(
+        path,
+        symbols,
+        scenes=stores.enter_context(RecordStore(SceneReferences)),
+    )
+
+
+def _record_run(
+    path: Path,
+    config: Config,
+    started: float,
+    history: History,
+    errors: tuple[Iterable[ScriptError], Iterable[SceneError]],
+) -> None:
+    """Append metrics of this run to run history.
+
+    :param path: Linted directory.
+    :param config: Linter configuration.
+    :param started: Run start as Unix timestamp.
+    :param history: Run history with recorded files and phases.
+    :param errors: Script errors and scene errors found.
+    """
+    append_run(
+        get_runs_path(path, config=config),
+        create_run(started, history, errors),
+    )
+
+
+def _output(  # noqa: WPS211
+    path: Path,
+    args: argparse.Namespace,
+    output: Path | None,
+    config: Config,
+    errors: tuple[Iterable[ScriptError], Iterable[SceneError]],
+    total: int,
+) -> None:
+    """Write baseline or result file, or report sorted errors.
+
+    :param path: Linted directory.
+    :param args: Parsed CLI arguments.
+    :param output: Result file path, None to report errors.
+    :param config: Linter configuration.
+    :param errors: Sorted script errors and scene errors, may be lazy.
+    :param total: Amount of errors.
+    """
+    script_errors, scene_errors = errors
+    if args.write_baseline is not None:
+        write_baseline(args.write_baseline, path, script_errors, scene_errors)
+        print_baseline(args.write_baseline, total, config=config)
+    elif output is not None:
+        dump_results(output, script_errors, scene_errors, path)
+    elif args.statistics is not None:
+        _report_statistics(path, args, (script_errors, scene_errors), config)
+    else:
+        _report(script_errors, scene_errors, config=config)
+
+
+def _load_baseline(
+    parser: argparse.ArgumentParser,
+    args: argparse.Namespace,
+    path: Path,
+) -> BaselineFilter | None:
+    """Load baseline file given in CLI arguments.
+
+    Exits with usage error if baseline file can not be loaded.
+
+    :param parser: CLI argparser.
+    :param args: Parsed CLI arguments.
+    :param path: Directory to check.
+    :returns: Baseline filter, None if no baseline is used.
+    """
+    if args.baseline is None or args.write_baseline is not None:
+        return None
+    try:
+        return BaselineFilter.load(args.baseline, path)
+    except (OSError, ValueError) as error:
+        parser.error(f"can not load baseline {args.baseline}: {error}")
+
+
+def _lint(  # noqa: WPS211
+    path: Path,
+    args: argparse.Namespace,
+    config: Config,
+    history: History,
+    references: ReferenceIndex,
+    paths: tuple[list[Path] | None, list[Path] | None],
+    baseline: BaselineFilter | None = None,
+    spools: Spools | None = None,
+) -> tuple[list[ScriptError], list[SceneError]]:
+    """Lint scripts, scenes and cross-references between them.
 
-    script_errors = gdscript.check(path, config=config)
-    script_errors.sort(key=lambda error: error.error.codename)
+    Errors accepted by baseline are dropped as soon as they are found,
+    so they are never counted towards maximal amount of errors. Without
+    maximal amount of errors, errors found are moved to given spools as
+    soon as every file is checked.
 
-    scene_errors = scenes.check(path, config=config)
-    scene_errors.sort(key=lambda error: error.error.codename)
+    :param path: Directory to check.
+    :param args: Parsed CLI arguments.
+    :param config: Linter configuration.
+    :param history: Durations of previous runs, updated with this run.
+    :param references: Cross-reference index with symbol index of
+        previous runs.
+    :param paths: Scripts and scenes to check, all in directory if None.
+    :param baseline: Filter dropping errors accepted by baseline.
+    :param spools: Spools to move script errors and scene errors to.
+    :returns: Script errors and scene errors not moved to spools.
+    """
+    script_paths, scene_paths = paths
+    script_spool, scene_spool = spools or (None, None)
+    max_errors: int | None = args.max_errors
+    if args.fail_fast:
+        max_errors = 1
+    if args.write_baseline is not None:
+        max_errors = None
+
+    script_errors = gdscript.check(
+        path,
+        config=config,
+        jobs=args.jobs,
+        history=history,
+        paths=script_paths,
+        max_errors=max_errors,
+        index=references.symbols,
+        baseline=baseline,
+        spool=script_spool,
+    )
+    scene_errors: list[SceneError] = []
+    if max_errors is None or len(script_errors) < max_errors:
+        scene_errors = scenes.check(
+            path,
+            config=config,
+            history=history,
+            paths=scene_paths,
+            max_errors=(
+                None if max_errors is None else max_errors - len(script_errors)
+            ),
+            references=references,
+            baseline=baseline,
+            spool=scene_spool,
+        )
+    if max_errors is None or len(script_errors) + len(scene_errors) < (
+        max_errors
+    ):
+        script_errors.extend(
+            gdscript.check_references(
+                path,
+                references,
+                config=config,
+                paths=script_paths,
+                baseline=baseline,
+            ),
+        )
+        if max_errors is not None:
+            del script_errors[max_errors - len(scene_errors) :]
+    return script_errors, scene_errors
+
+
+def merge(argv: list[str]) -> None:
+    """CLI `merge` command entry point.
+
+    Combines result files of sharded runs into a single report. Paths
+    stored relative to linted directory are resolved against current
+    directory. Exits with usage error if a result file can not be loaded.
+
+    :param argv: Command arguments.
+    """
+    parser = _merge_argparser_init()
+    args = parser.parse_args(argv)
+    config = Config.from_toml(Path.cwd())
+
+    try:
+        script_errors, scene_errors = load_results(
+            map(Path, args.results),
+            Path.cwd(),
+        )
+    except (OSError, ValueError) as error:
+        parser.error(f"can not load results: {error}")
+    if args.statistics is not None:
+        _report_statistics(
+            Path.cwd(),
+            args,
+            (script_errors, scene_errors),
+            config,
+        )
+        return
+    _sort_errors(script_errors, scene_errors)
+
+    _report(script_errors, scene_errors, config=config)
+
+
+def stats(argv: list[str]) -> None:
+    """CLI `stats` command entry point.
+
+    Prints metrics of recorded runs and flags runs whose throughput
+    dropped below the rolling baseline. Exits with failure if the latest
+    run is flagged.
+
+    :param argv: Command arguments.
+    """
+    parser = _stats_argparser_init()
+    args = parser.parse_args(argv)
+    path = Path(args.path)
+    config = Config.from_toml(path)
+
+    runs = load_runs(get_runs_path(path, config=config))
+    drops = find_regressions(
+        runs,
+        window=config.regression_window,
+        threshold=config.regression_threshold,
+    )
+    print_runs(runs[-args.last :], drops[-args.last :], config=config)
+    if drops and drops[-1] is not None:
+        sys.exit(EXIT_CODE_ERRORS)
+
+
+def _sort_errors(
+    script_errors: list[ScriptError],
+    scene_errors: list[SceneError],
+) -> None:
+    """Sort errors in place to the order they are reported in.
+
+    :param script_errors: Script errors to sort.
+    :param scene_errors: Scene errors to sort.
+    """
+    script_errors.sort(key=_script_error_key)
+    scene_errors.sort(key=_scene_error_key)
+
+
+def _script_error_key(error: ScriptError) -> tuple[Any, ...]:
+    """Get sort key of script error.
+
+    :param error: Script error.
+    :returns: Codename, path and location of error.
+    """
+    return (error.error.codename, error.path, error.line, error.column)
+
+
+def _scene_error_key(error: SceneError | SceneErrorRecord) -> tuple[Any, ...]:
+    """Get sort key of scene error or scene error record.
+
+    :param error: Scene error or scene error record.
+    :returns: Codename and path of error.
+    """
+    return (error.error.codename, error.path)
 
-    print_errors(
+
+def _report(
+    script_errors: Iterable[ScriptError],
+    scene_errors: Iterable[SceneError],
+    config: Config | None = None,
+) -> None:
+    """Print errors and exit with failure if any error was found.
+
+    :param script_errors: Script errors to report.
+    :param scene_errors: Scene errors to report.
+    :param config: Linter configuration.
+    """
+    total = print_errors(
         script_errors=script_errors,
         scene_errors=scene_errors,
         config=config,
     )
+    if total:
+        sys.exit(EXIT_CODE_ERRORS)
+
+
+def _report_statistics(
+    path: Path,
+    args: argparse.Namespace,
+    errors: tuple[Iterable[ScriptError], Iterable[SceneError]],
+    config: Config,
+) -> None:
+    """Print error statistics and exit with failure if any error was found.
+
+    :param path: Directory paths are printed relative to.
+    :param args: Parsed CLI arguments.
+    :param errors: Script errors and scene errors to count.
+    :param config: Linter configuration.
+    """
+    statistics = collect_statistics(path, *errors)
+    if args.statistics == STATISTICS_JSON:
+        sys.stdout.write(f"{statistics.model_dump_json(indent=1)}\n")
+    else:
+        print_statistics(statistics, top=args.top, config=config)
+    if statistics.total:
+        sys.exit(EXIT_CODE_ERRORS)
+
+
+def _add_statistics_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add statistics mode arguments to argparser.
+
+    :param parser: Argparser to add arguments to.
+    """
+    parser.add_argument(
+        "--statistics",
+        choices=(STATISTICS_TABLE, STATISTICS_JSON),
+        default=None,
+        nargs="?",
+        const=STATISTICS_TABLE,
+        help="only print amounts of errors by codename, file and directory",
+    )
+    parser.add_argument(
+        "--top",
+        type=_positive_int,
+        default=STATISTICS_TOP,
+        metavar="N",
+        help=f"files and directories to print statistics of ({STATISTICS_TOP})",
+    )
+
+
+def _positive_int(value: str) -> int:
+    """Parse positive integer argument.
+
+    :param value: Argument value.
+    :returns: Parsed integer.
+    :raises ValueError: If value is not a positive integer.
+    """
+    number = int(value)
+    if number < 1:
+        msg: str = f"not a positive integer: {value}"
+        raise ValueError(msg)
+    return number
 
 
 def _argparser_init() -> argparse.ArgumentParser:
@@ -43,4 +537,107 @@ def _argparser_init() -> argparse.ArgumentParser:
         default=str(Path.cwd()),
         nargs="?",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="amount of worker processes to check scripts with",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="print predicted and actual wall time of linting phases",
+    )
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        default=None,
+        metavar="INDEX/COUNT",
+        help="only check files of given shard, e.g. `3/8`",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=None,
+        help="write errors to result file instead of printing them",
+    )
+    parser.add_argument(
+        "--max-errors",
+        type=_positive_int,
+        default=None,
+        metavar="N",
+        help="stop checking once N errors are found",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="stop checking once the first error is found",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=None,
+        metavar="FILE",
+        help="only report errors not accepted in baseline file",
+    )
+    parser.add_argument(
+        "--write-baseline",
+        type=Path,
+        default=None,
+        nargs="?",
+        const=Path(DEFAULT_BASELINE),
+        metavar="FILE",
+        help=f"accept all current errors in baseline file ({DEFAULT_BASELINE})",
+    )
+    parser.add_argument(
+        "--low-memory",
+        action="store_true",
+        help="keep indexes and errors on disk instead of in memory",
+    )
+    parser.add_argument(
+        "--record",
+        action="store_true",
+        help="append metrics of this run to run history",
+    )
+    _add_statistics_arguments(parser)
+    return parser
+
+
+def _merge_argparser_init() -> argparse.ArgumentParser:
+    """Initialize and retrieve `merge` command argparser.
+
+    :returns: Initialized argparser.
+    """
+    parser = argparse.ArgumentParser(prog=f"node8 {MERGE_COMMAND}")
+    parser.add_argument(
+        "results",
+        type=str,
+        nargs="+",
+        help="result files of sharded runs",
+    )
+    _add_statistics_arguments(parser)
+    return parser
+
+
+def _stats_argparser_init() -> argparse.ArgumentParser:
+    """Initialize and retrieve `stats` command argparser.
+
+    :returns: Initialized argparser.
+    """
+    parser = argparse.ArgumentParser(prog=f"node8 {STATS_COMMAND}")
+    parser.add_argument(
+        "path",
+        type=str,
+        default=str(Path.cwd()),
+        nargs="?",
+    )
+    parser.add_argument(
+        "--last",
+        type=_positive_int,
+        default=STATS_LAST,
+        metavar="N",
+        help=f"amount of latest runs to print ({STATS_LAST})",
+    )
     return parser
@@ -7,6 +7,8 @@ from typing import Final
 from pydantic import BaseModel, Field, field_validator
 from rich.color import Color, ColorParseError
 
+from node8.models.patterns import PatternRule
+
 CONFIG_FILENAME: Final[str] = "gdproject.toml"
 CONFIG_TOML_PATH: Final[str] = "node8"
 
@@ -16,6 +18,13 @@ LINES_SHOW_AFTER: Final[int] = 2
 
 MAX_SCENE_INDENT: Final[int] = 3
 
+CACHE_DIR: Final[str] = ".node8_cache"
+
+SPILL_THRESHOLD: Final[int] = 10_000
+
+REGRESSION_THRESHOLD: Final[float] = 0.2
+REGRESSION_WINDOW: Final[int] = 10
+
 MAIN_COLOR: Final[str] = "blue"
 ACCENT_COLOR: Final[str] = "red"
 
@@ -33,6 +42,18 @@ class Config(BaseModel):
     accent_color: str = ACCENT_COLOR
 
     ignores: list[str] = Field(default_factory=list)
+    scene_ignores: dict[str, list[str]] = Field(default_factory=dict)
+    bans: list[PatternRule] = Field(default_factory=list)
+
+    cache_dir: str = CACHE_DIR
+    engine_api: str | None = None
+
+    time_budget: float | None = None
+    memory_cap: int | None = None
+    spill_threshold: int = SPILL_THRESHOLD
+
+    regression_threshold: float = REGRESSION_THRESHOLD
+    regression_window: int = REGRESSION_WINDOW
 
     @field_validator("main_color", "accent_color")
     @classmethod
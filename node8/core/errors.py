@@ -1 +1,21 @@
 """Provide base exception classes for project error handling."""
+
+
+class Node8Error(Exception):
+    """Base Node8 exception class."""
+
+
+class IsolationError(Node8Error):
+    """Isolated file processing failed."""
+
+
+class TimeBudgetExceededError(IsolationError):
+    """Isolated file processing took longer than its time budget."""
+
+
+class MemoryCapExceededError(IsolationError):
+    """Isolated file processing allocated more memory than its cap."""
+
+
+class WorkerCrashedError(IsolationError):
+    """Isolated worker process exited while processing a file."""
@@ -0,0 +1,13 @@
+"""Baseline model classes to store fingerprints of accepted errors."""
+
+from pydantic import BaseModel
+
+
+class Baseline(BaseModel):
+    """Baseline of accepted lint errors.
+
+    Stores amount of accepted errors by error fingerprint.
+    """
+
+    version: int
+    fingerprints: dict[str, int] = {}
@@ -0,0 +1,22 @@
+"""Pattern rule model classes to declare tree-pattern rules."""
+
+from typing import Final
+
+from pydantic import BaseModel, ConfigDict
+
+PATTERN_RULE_CODENAME: Final[str] = "B001"
+
+
+class PatternRule(BaseModel):
+    """Declarative rule flagging syntax tree nodes matching a pattern.
+
+    Message and help message may refer to pattern captures as `$name`.
+    Pattern syntax is validated when rules are compiled.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    pattern: str
+    message: str
+    codename: str = PATTERN_RULE_CODENAME
+    help_message: str | None = None
@@ -0,0 +1,15 @@
+"""Cross-reference model classes to represent scene node paths."""
+
+from pydantic import BaseModel, Field
+
+
+class SceneReferences(BaseModel):
+    """Node paths and script attachments of a single scene.
+
+    Node paths are relative to scene root, root itself is `.`.
+    """
+
+    nodes: set[str] = Field(default_factory=set)
+    unique_nodes: dict[str, str] = Field(default_factory=dict)
+    instances: dict[str, str] = Field(default_factory=dict)
+    scripts: dict[str, list[str]] = Field(default_factory=dict)
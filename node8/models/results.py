@@ -0,0 +1,26 @@
+"""Result file model classes to store lint errors between runs."""
+
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from node8.models.errors import Error, ScriptError
+from node8.services.scene_tree import SceneMeta
+
+
+class SceneErrorRecord(BaseModel):
+    """Godot scene lint error record.
+
+    Stores scene nodes from scene root to errored node instead of trees.
+    """
+
+    error: Error
+    path: Path
+    node_path: list[SceneMeta]
+
+
+class Results(BaseModel):
+    """Lint results of a single run."""
+
+    script_errors: list[ScriptError] = []
+    scene_errors: list[SceneErrorRecord] = []
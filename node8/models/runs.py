@@ -0,0 +1,21 @@
+"""Run model classes to store metrics of linting runs."""
+
+from pydantic import BaseModel
+
+
+class RunRecord(BaseModel):
+    """Metrics of a single linting run.
+
+    Durations are in seconds, peak memory is in kilobytes and is None
+    where it is not supported.
+    """
+
+    started: float
+    duration: float
+    phases: dict[str, float] = {}
+    rules: dict[str, float] = {}
+    files: int = 0
+    files_per_second: float = 0.0
+    peak_memory: int | None = None
+    errors: int = 0
+    codenames: dict[str, int] = {}
@@ -0,0 +1,17 @@
+"""Statistics model classes to summarize lint errors."""
+
+from pydantic import BaseModel
+
+
+class Statistics(BaseModel):
+    """Amounts of lint errors of a single run.
+
+    Amounts are keyed by codename, by file and by directory, files and
+    directories are relative to linted directory. Every mapping is
+    ordered from the most errors to the least.
+    """
+
+    total: int = 0
+    codenames: dict[str, int] = {}
+    files: dict[str, int] = {}
+    directories: dict[str, int] = {}
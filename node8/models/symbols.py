@@ -0,0 +1,50 @@
+"""Symbol model classes to represent project-wide script declarations."""
+
+from pydantic import BaseModel, Field
+
+from node8.models.noqa import NoqaIgnore
+
+
+class Symbol(BaseModel):
+    """Declared or referenced script symbol with its location."""
+
+    name: str
+    line: int
+    column: int
+    end_column: int
+
+
+class ScriptSymbols(BaseModel):
+    """Symbols declared and referenced by a single script.
+
+    Names of inner classes and of their enums and constants are qualified
+    with their outer classes, e.g. `Inner.Deep`. Unique node paths are
+    prefixed with `%`.
+    """
+
+    digest: str
+    class_name: Symbol | None = None
+    extends: str | None = None
+    classes: list[Symbol] = Field(default_factory=list)
+    types: list[Symbol] = Field(default_factory=list)
+    signals: list[Symbol] = Field(default_factory=list)
+    functions: list[Symbol] = Field(default_factory=list)
+    type_references: list[Symbol] = Field(default_factory=list)
+    node_paths: list[Symbol] = Field(default_factory=list)
+    noqa_ignores: list[NoqaIgnore] = Field(default_factory=list)
+
+
+class SymbolIndexHeader(BaseModel):
+    """First line of persisted project symbol index."""
+
+    version: int
+
+
+class IndexedScript(BaseModel):
+    """Persisted symbols of a single script, one per index line.
+
+    Scripts are keyed by path relative to linted directory.
+    """
+
+    key: str
+    symbols: ScriptSymbols
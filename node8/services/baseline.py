@@ -0,0 +1,224 @@
+"""Provide baseline functions to only report errors not accepted before.
+
+Errors are identified by fingerprints of their codename, file path and
+normalized content of errored line, so baselines survive lines shifting
+around in edited files.
+"""
+
+import hashlib
+from collections import Counter, OrderedDict
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Final
+
+from node8.models.baseline import Baseline
+from node8.models.errors import SceneError, ScriptError
+from node8.services.results import to_scene_record
+
+BASELINE_VERSION: Final[int] = 1
+DEFAULT_BASELINE: Final[str] = "node8-baseline.json"
+FINGERPRINT_SEPARATOR: Final[str] = "\0"
+LINE_CACHE_SIZE: Final[int] = 64
+
+
+class _LineCache:
+    """Normalized script lines of recently fingerprinted scripts.
+
+    Errors come grouped by script, so only the least recently used
+    scripts are dropped and every script is still read about once.
+    """
+
+    def __init__(self, size: int = LINE_CACHE_SIZE) -> None:
+        """Initialize empty _LineCache.
+
+        :param size: Amount of scripts to keep lines of.
+        """
+        self.size = size
+        self.lines: OrderedDict[Path, list[str]] = OrderedDict()
+
+    def get(self, path: Path, line: int) -> str:
+        """Get normalized content of script line.
+
+        :param path: Script file path.
+        :param line: Line number, starting at 1.
+        :returns: Line with collapsed whitespace, empty if unreadable.
+        """
+        lines = self.lines.get(path)
+        if lines is None:
+            try:
+                with path.open(mode="r", encoding="utf-8") as script:
+                    lines = script.readlines()
+            except (OSError, UnicodeDecodeError):
+                lines = []
+            self.lines[path] = lines
+            if len(self.lines) > self.size:
+                self.lines.popitem(last=False)
+        else:
+            self.lines.move_to_end(path)
+        if 0 < line <= len(lines):
+            return " ".join(lines[line - 1].split())
+        return ""
+
+
+def _relative(path: Path, root: Path) -> str:
+    """Get path relative to linted directory.
+
+    :param path: File path.
+    :param root: Linted directory.
+    :returns: Relative posix path, path itself if not in directory.
+    """
+    if path.is_relative_to(root):
+        return path.relative_to(root).as_posix()
+    return path.as_posix()
+
+
+def _digest(*parts: str) -> str:
+    """Get fingerprint of given parts.
+
+    :param parts: Fingerprinted strings.
+    :returns: Hexadecimal fingerprint.
+    """
+    joined = FINGERPRINT_SEPARATOR.join(parts)
+    return hashlib.blake2b(joined.encode(), digest_size=16).hexdigest()
+
+
+def _script_fingerprint(
+    error: ScriptError,
+    root: Path,
+    lines: _LineCache,
+) -> str:
+    """Get fingerprint of script error.
+
+    :param error: Script error.
+    :param root: Linted directory.
+    :param lines: Script line cache.
+    :returns: Error fingerprint.
+    """
+    return _digest(
+        error.error.codename,
+        _relative(error.path, root),
+        lines.get(error.path, error.line),
+    )
+
+
+def _scene_fingerprint(error: SceneError, root: Path) -> str:
+    """Get fingerprint of scene error.
+
+    :param error: Scene error.
+    :param root: Linted directory.
+    :returns: Error fingerprint.
+    """
+    node_path = "/".join(meta.name for meta in to_scene_record(error).node_path)
+    return _digest(error.error.codename, _relative(error.path, root), node_path)
+
+
+def write_baseline(
+    path: Path,
+    root: Path,
+    script_errors: Iterable[ScriptError],
+    scene_errors: Iterable[SceneError],
+) -> None:
+    """Write fingerprints of given errors to baseline file.
+
+    :param path: Baseline file path.
+    :param root: Linted directory.
+    :param script_errors: Script errors to accept.
+    :param scene_errors: Scene errors to accept.
+    """
+    lines = _LineCache()
+    fingerprints = Counter(
+        _script_fingerprint(error, root, lines) for error in script_errors
+    )
+    fingerprints.update(
+        _scene_fingerprint(error, root) for error in scene_errors
+    )
+    baseline = Baseline(
+        version=BASELINE_VERSION,
+        fingerprints=dict(sorted(fingerprints.items())),
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open(mode="w", encoding="utf-8") as baseline_file:
+        baseline_file.write(baseline.model_dump_json(indent=1))
+
+
+def load_baseline(path: Path) -> Counter[str]:
+    """Read fingerprints of accepted errors from baseline file.
+
+    :param path: Baseline file path.
+    :returns: Amount of accepted errors by fingerprint.
+    :raises OSError: If baseline file can not be read.
+    :raises ValueError: If baseline file is not a valid baseline.
+    """
+    with path.open(mode="r", encoding="utf-8") as baseline_file:
+        baseline = Baseline.model_validate_json(baseline_file.read())
+    return Counter(baseline.fingerprints)
+
+
+class BaselineFilter:
+    """Filter dropping errors accepted by baseline.
+
+    Every accepted fingerprint matches as many errors as were accepted,
+    so new copies of an accepted error are still reported.
+    """
+
+    def __init__(self, fingerprints: Counter[str], root: Path) -> None:
+        """Initialize BaselineFilter class.
+
+        :param fingerprints: Amount of accepted errors by fingerprint.
+        :param root: Linted directory.
+        """
+        self.remaining = fingerprints.copy()
+        self.root = root
+        self.lines = _LineCache()
+
+    @classmethod
+    def load(cls, path: Path, root: Path) -> "BaselineFilter":
+        """Load baseline file.
+
+        :param path: Baseline file path.
+        :param root: Linted directory.
+        :returns: BaselineFilter instance.
+        :raises OSError: If baseline file can not be read.
+        :raises ValueError: If baseline file is not a valid baseline.
+        """
+        return cls(load_baseline(path), root)
+
+    def _accept(self, fingerprint: str) -> bool:
+        """Match fingerprint against remaining accepted errors.
+
+        :param fingerprint: Error fingerprint.
+        :returns: True if error is accepted, False if it is new.
+        """
+        if self.remaining[fingerprint] <= 0:
+            return False
+        self.remaining[fingerprint] -= 1
+        return True
+
+    def filter_script_errors(
+        self,
+        errors: list[ScriptError],
+    ) -> list[ScriptError]:
+        """Drop script errors accepted by baseline.
+
+        :param errors: Script errors to filter.
+        :returns: Array of new script errors.
+        """
+        return [
+            error
+            for error in errors
+            if not self._accept(
+                _script_fingerprint(error, self.root, self.lines),
+            )
+        ]
+
+    def filter_scene_errors(self, errors: list[SceneError]) -> list[SceneError]:
+        """Drop scene errors accepted by baseline.
+
+        :param errors: Scene errors to filter.
+        :returns: Array of new scene errors.
+        """
+        return [
+            error
+            for error in errors
+            if not self._accept(_scene_fingerprint(error, self.root))
+        ]
@@ -1,15 +1,26 @@
 """Provide error formatting and printing functions."""
 
+from collections.abc import Iterable
+from datetime import datetime
+from pathlib import Path
 from typing import Final
 
 import rich
+from rich.table import Table
 
 from node8.core.config import Config
 from node8.models.errors import SceneError, ScriptError
+from node8.models.runs import RunRecord
+from node8.models.statistics import Statistics
 from node8.services.scene_tree import SceneTree, get_subtree_path
+from node8.services.schedule import History
 
 MIN_LINE: Final[int] = 1
 LINE_NUMBER_OFFSET: Final[int] = 1
+STATISTICS_TOP: Final[int] = 10
+KILOBYTES_IN_MEGABYTE: Final[int] = 1024
+RUN_TIME_FORMAT: Final[str] = "%m-%d %H:%M"
+MILLISECONDS_IN_SECOND: Final[int] = 1000
 TREE_DEFAULT_INDENT: Final[str] = "└── "
 
 
@@ -47,8 +58,11 @@ def _print_script_error_body(  # noqa: WPS210
     """
     config = config or Config()
 
-    with error.path.open(mode="r", encoding="utf-8") as script:
-        script_lines = script.readlines()
+    try:
+        with error.path.open(mode="r", encoding="utf-8") as script:
+            script_lines = script.readlines()
+    except (OSError, UnicodeDecodeError):
+        return
 
     start_line = max(error.line - config.lines_show_before, MIN_LINE)
     end_line = min(error.line + config.lines_show_after, len(script_lines))
@@ -169,25 +183,162 @@ def print_scene_error(
 
 
 def print_errors(
-    script_errors: list[ScriptError],
-    scene_errors: list[SceneError],
+    script_errors: Iterable[ScriptError],
+    scene_errors: Iterable[SceneError],
     config: Config | None = None,
-) -> None:
+) -> int:
     """Print formatted script errors.
 
+    Errors are printed as they are iterated over, so they may be read
+    lazily from a spool.
+
     :param errors: Script errors to print.
     :param config: Linter configuration.
+    :returns: Amount of printed errors.
     """
     config = config or Config()
 
-    total = len(script_errors) + len(scene_errors)
+    total = 0
 
     for error in script_errors:
         print_script_error(error, config=config)
-    for error in scene_errors:
-        print_scene_error(error, config=config)
+        total += 1
+    for scene_error in scene_errors:
+        print_scene_error(scene_error, config=config)
+        total += 1
 
     if total > 0:
         rich.print(f"[bold white]Found {total} errors.[/]")
     else:
         rich.print("[bold white]No errors found![/]")
+    return total
+
+
+def print_profile(
+    history: History,
+    config: Config | None = None,
+) -> None:
+    """Print predicted and actual wall time of linting phases.
+
+    :param history: Run history with recorded phases.
+    :param config: Linter configuration.
+    """
+    config = config or Config()
+
+    rich.print("[bold white]Profile:[/]")
+    for phase, (predicted, actual) in history.makespans.items():
+        rich.print(
+            f"[bold {config.main_color}] {phase}:[/] "
+            f"[white]predicted {predicted:.3f}s, actual {actual:.3f}s[/]",
+        )
+
+
+def print_baseline(
+    path: Path,
+    total: int,
+    config: Config | None = None,
+) -> None:
+    """Print summary of written baseline.
+
+    :param path: Baseline file path.
+    :param total: Amount of accepted errors.
+    :param config: Linter configuration.
+    """
+    config = config or Config()
+
+    rich.print(
+        f"[bold white]Accepted {total} errors in[/] "
+        f"[bold {config.main_color}]{path}[/]",
+    )
+
+
+def print_statistics(
+    statistics: Statistics,
+    top: int = STATISTICS_TOP,
+    config: Config | None = None,
+) -> None:
+    """Print error amounts by codename, file and directory.
+
+    :param statistics: Error statistics to print.
+    :param top: Amount of files and directories with most errors to print.
+    :param config: Linter configuration.
+    """
+    config = config or Config()
+
+    sections = (
+        ("Codename", statistics.codenames, len(statistics.codenames)),
+        ("File", statistics.files, top),
+        ("Directory", statistics.directories, top),
+    )
+    for title, amounts, limit in sections:
+        if not amounts:
+            continue
+        table = Table(header_style=f"bold {config.main_color}")
+        table.add_column(title)
+        table.add_column("Errors", justify="right", style=config.accent_color)
+        for key, amount in list(amounts.items())[:limit]:
+            table.add_row(key, str(amount))
+        rich.print(table)
+
+    if statistics.total > 0:
+        rich.print(f"[bold white]Found {statistics.total} errors.[/]")
+    else:
+        rich.print("[bold white]No errors found![/]")
+
+
+def print_runs(
+    runs: list[RunRecord],
+    drops: list[float | None],
+    config: Config | None = None,
+) -> None:
+    """Print metrics of recorded runs and rule durations of the latest.
+
+    :param runs: Run records, oldest first.
+    :param drops: Throughput drops of flagged runs, None for other runs.
+    :param config: Linter configuration.
+    """
+    config = config or Config()
+
+    if not runs:
+        rich.print("[bold white]No runs recorded![/]")
+        return
+
+    phases = sorted({phase for run in runs for phase in run.phases})
+    table = Table(header_style=f"bold {config.main_color}")
+    table.add_column("Started", no_wrap=True)
+    table.add_column("Time", justify="right")
+    for phase in phases:
+        table.add_column(phase.capitalize(), justify="right")
+    table.add_column("Files", justify="right")
+    table.add_column("Files/s", justify="right")
+    table.add_column("MB", justify="right")
+    table.add_column("Errors", justify="right")
+    table.add_column("Drop", justify="right", style=config.accent_color)
+    for run, drop in zip(runs, drops, strict=True):
+        peak = "-"
+        if run.peak_memory is not None:
+            peak = f"{run.peak_memory / KILOBYTES_IN_MEGABYTE:.1f}"
+        table.add_row(
+            datetime.fromtimestamp(run.started).strftime(RUN_TIME_FORMAT),  # noqa: DTZ006
+            f"{run.duration:.2f}s",
+            *(f"{run.phases.get(phase, 0.0):.2f}s" for phase in phases),
+            str(run.files),
+            f"{run.files_per_second:.1f}",
+            peak,
+            str(run.errors),
+            "" if drop is None else f"-{drop:.0%}",
+        )
+    rich.print(table)
+
+    rules = Table(header_style=f"bold {config.main_color}")
+    rules.add_column("Rule")
+    rules.add_column("Time", justify="right")
+    latest = runs[-1].rules
+    for rule, duration in sorted(
+        latest.items(),
+        key=lambda item: item[1],
+        reverse=True,
+    ):
+        rules.add_row(rule, f"{duration * MILLISECONDS_IN_SECOND:.1f}ms")
+    if latest:
+        rich.print(rules)
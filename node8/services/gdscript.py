@@ -1,20 +1,66 @@
 """Provide GDScript linting functions to check for rule violations."""
 
+import time
+from collections.abc import Generator, Iterable
+from contextlib import closing
+from functools import partial
+from itertools import tee
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
 
 from gdtoolkit.parser import parser  # type: ignore[import-untyped]
-from lark import Tree
+from lark import Token, Tree
+from lark.exceptions import LarkError
 
 from node8.core.config import Config
+from node8.core.errors import IsolationError, TimeBudgetExceededError
 from node8.models.errors import ScriptError
 from node8.models.noqa import NoqaIgnore
+from node8.models.symbols import ScriptSymbols
+from node8.services import lexer
+from node8.services.baseline import BaselineFilter
+from node8.services.isolation import IsolatedPool
+from node8.services.metrics import PATTERNS_TIMER, timed
 from node8.services.noqa import get_ignores_tree
-from node8.services.rules.anti_patterns import GetNodeFound
+from node8.services.patterns import PatternTable, compile_rules
+from node8.services.readahead import ReadResult, read_ahead, try_read_text
+from node8.services.references import ReferenceIndex
+from node8.services.rules import failures
+from node8.services.rules.anti_patterns import PATTERN_RULES, GetNodeFound
+from node8.services.rules.naming import (
+    ClassNameCase,
+    DuplicateClassName,
+    FunctionNameCase,
+    SignalNameCase,
+    UnknownType,
+)
+from node8.services.rules.node_paths import BrokenNodePath
 from node8.services.rules.style_violations import (
     FunctionMissingDocstring,
     LineTooLong,
 )
+from node8.services.schedule import History, predict_makespan
+from node8.services.spool import Spool
+from node8.services.symbols import SymbolIndex, collect_symbols, get_digest
+from node8.services.visitors import (
+    SceneReferenceRule,
+    SymbolIndexRule,
+    TokenVisitor,
+    Visitor,
+)
+
+TOKEN_RULES: Final[tuple[type[TokenVisitor], ...]] = (GetNodeFound,)
+TREE_RULES: Final[tuple[type[Visitor], ...]] = (FunctionMissingDocstring,)
+INDEX_RULES: Final[tuple[type[SymbolIndexRule], ...]] = (
+    DuplicateClassName,
+    UnknownType,
+    ClassNameCase,
+    FunctionNameCase,
+    SignalNameCase,
+)
+REFERENCE_RULES: Final[tuple[type[SceneReferenceRule], ...]] = (BrokenNodePath,)
+
+SCRIPTS_PHASE: Final[str] = "scripts"
 
 
 def _is_valid_error(
@@ -41,68 +87,446 @@ def _is_valid_error(
     return True
 
 
-def _check_script(  # noqa: WPS210
+def _check_script(
     path: Path,
     config: Config | None = None,
-) -> list[ScriptError]:
-    """Check given script and return errors.
+    contents: ReadResult | None = None,
+) -> tuple[list[ScriptError], ScriptSymbols | None]:
+    """Check given script and return errors with script symbols.
 
-    Will only check `.gd` scripts.
+    Will only check `.gd` scripts. Scripts that can not be read or parsed
+    are reported as errors.
 
     :param path: Path to script.
     :param config: Linter configuration.
+    :param contents: Script contents or read error if already read.
+    :returns: Array of script errors and symbols, None if not collected.
+    """
+    config = config or Config()
+
+    errors: list[ScriptError] = []
+
+    if contents is None:
+        contents = try_read_text(path)
+    if not isinstance(contents, str):
+        errors.append(failures.read_error(path, contents))
+        return [
+            error for error in errors if _is_valid_error(error, [], config)
+        ], None
+
+    return _check_contents(path, contents, config=config)
+
+
+def check_contents(
+    path: Path,
+    script_contents: str,
+    config: Config | None = None,
+) -> list[ScriptError]:
+    """Check given script contents and return errors.
+
+    Scripts that can not be parsed are reported as errors. Cross-file
+    rules are not checked.
+
+    :param path: Path to report errors with.
+    :param script_contents: Script contents to check.
+    :param config: Linter configuration.
     :returns: Array of script errors.
     """
+    errors, _ = _check_contents(
+        path,
+        script_contents,
+        config=config,
+        with_symbols=False,
+    )
+    return errors
+
+
+def _check_contents(
+    path: Path,
+    script_contents: str,
+    config: Config | None = None,
+    *,
+    with_symbols: bool = True,
+) -> tuple[list[ScriptError], ScriptSymbols | None]:
+    """Check given script contents and collect script symbols.
+
+    Scripts that can not be parsed are reported as E999 errors, scripts
+    failing while symbols are collected or rules are checked, e.g. nested
+    too deep, as E905 errors, the same way isolated scripts are. Running
+    out of memory is left to isolation to report as exceeded memory cap.
+
+    :param path: Path to report errors with.
+    :param script_contents: Script contents to check.
+    :param config: Linter configuration.
+    :param with_symbols: Collect script symbols.
+    :returns: Array of script errors and symbols, None if not collected.
+    :raises MemoryError: If memory runs out while checking.
+    """
     config = config or Config()
 
+    try:
+        return _check_parsed(
+            path,
+            script_contents,
+            config,
+            with_symbols=with_symbols,
+        )
+    except LarkError as error:
+        failure = failures.parse_error(path, error)
+    except MemoryError:
+        raise
+    except Exception as error:  # noqa: BLE001
+        failure = failures.check_error(path, error)
+    return [
+        error for error in (failure,) if _is_valid_error(error, [], config)
+    ], None
+
+
+def _check_parsed(  # noqa: WPS210
+    path: Path,
+    script_contents: str,
+    config: Config,
+    *,
+    with_symbols: bool,
+) -> tuple[list[ScriptError], ScriptSymbols | None]:
+    """Parse given script contents, check rules and collect symbols.
+
+    Symbols are collected from the same syntax tree tree rules visit,
+    only when any cross-file rule is enabled. Scripts are only tokenized
+    when no tree rule is enabled, no pattern can match and no symbols are
+    collected. Cross-file rules and D001 are enabled by default, so by
+    default every script is still parsed.
+
+    :param path: Path to report errors with.
+    :param script_contents: Script contents to check.
+    :param config: Linter configuration.
+    :param with_symbols: Collect script symbols.
+    :returns: Array of script errors and symbols, None if not collected.
+    :raises LarkError: If script can not be parsed.
+    """
     errors: list[ScriptError] = []
 
-    with path.open(mode="r", encoding="utf-8") as script:
-        script_contents = script.read()
+    token_rules = [
+        rule for rule in TOKEN_RULES if rule.codename not in config.ignores
+    ]
+    tree_rules = [
+        rule for rule in TREE_RULES if rule.codename not in config.ignores
+    ]
+    pattern_table = _get_pattern_table(config)
+    with_symbols = with_symbols and _has_index_rules(config)
 
-    syntax_tree: Tree[Any] = parser.parse(script_contents, gather_metadata=True)
+    syntax_tree: Tree[Any] | None = None
+    symbols: ScriptSymbols | None = None
+    tokens: list[Token] = []
     comment_tree: Tree[Any] = parser.parse_comments(script_contents)
+    if tree_rules or with_symbols or pattern_table.may_match(script_contents):
+        syntax_tree, tokens = lexer.parse(script_contents)
+    elif token_rules:
+        tokens = lexer.tokenize(script_contents)
     noqa_ignores = get_ignores_tree(comment_tree)
 
-    errors.extend(
-        GetNodeFound.check(
-            path,
+    if syntax_tree is not None and with_symbols:
+        symbols = collect_symbols(
             syntax_tree,
             comment_tree,
-            config=config,
-        ),
-    )
-    errors.extend(
-        FunctionMissingDocstring.check(
-            path,
-            syntax_tree,
-            comment_tree,
-            config=config,
-        ),
-    )
-    errors.extend(LineTooLong.check(path, config=config))
+            get_digest(script_contents),
+        )
+
+    if syntax_tree is not None:
+        for tree_rule in tree_rules:
+            with timed(tree_rule.codename):
+                errors.extend(
+                    tree_rule.check(
+                        path,
+                        syntax_tree,
+                        comment_tree,
+                        config=config,
+                    ),
+                )
+        with timed(PATTERNS_TIMER):
+            errors.extend(pattern_table.check(path, syntax_tree))
+
+    for token_rule in token_rules:
+        with timed(token_rule.codename):
+            errors.extend(token_rule.check(path, tokens, config=config))
+
+    if LineTooLong.codename not in config.ignores:
+        with timed(LineTooLong.codename):
+            errors.extend(
+                LineTooLong.check(
+                    path,
+                    config=config,
+                    contents=script_contents,
+                ),
+            )
 
     return [
         error
         for error in errors
         if _is_valid_error(error, noqa_ignores, config=config)
-    ]
+    ], symbols
+
+
+def _get_pattern_table(config: Config) -> PatternTable:
+    """Get compiled table of enabled built-in and configured pattern rules.
+
+    :param config: Linter configuration.
+    :returns: Compiled pattern table.
+    """
+    return compile_rules(
+        tuple(
+            rule
+            for rule in (*PATTERN_RULES, *config.bans)
+            if rule.codename not in config.ignores
+        ),
+        lexer.get_tree_types(),
+    )
+
+
+def _has_index_rules(config: Config) -> bool:
+    """Check if any cross-file rule is enabled.
+
+    :param config: Linter configuration.
+    :returns: True if any cross-file rule is not ignored, False otherwise.
+    """
+    return any(
+        rule.codename not in config.ignores for rule in INDEX_RULES
+    ) or any(rule.codename not in config.ignores for rule in REFERENCE_RULES)
+
+
+def _check_script_timed(
+    path: Path,
+    config: Config | None = None,
+    contents: ReadResult | None = None,
+) -> tuple[list[ScriptError], ScriptSymbols | None, float]:
+    """Check given script and measure how long it took.
+
+    :param path: Path to script.
+    :param config: Linter configuration.
+    :param contents: Script contents or read error if already read.
+    :returns: Array of script errors, symbols and duration in seconds.
+    """
+    start = time.perf_counter()
+    errors, symbols = _check_script(path, config=config, contents=contents)
+    return errors, symbols, time.perf_counter() - start
+
+
+def _check_scripts(
+    paths: Iterable[Path],
+    config: Config,
+    jobs: int = 1,
+) -> Generator[tuple[Path, list[ScriptError], ScriptSymbols | None, float]]:
+    """Check given scripts, isolated in worker processes if needed.
+
+    Scripts are isolated when more than one job is given or when time
+    budget or memory cap is configured. Scripts failing in isolation are
+    reported as errors. Scripts checked in this process are read ahead
+    while previous ones are checked. Results are yielded in order of
+    given paths, which are taken only once a worker can check them.
+    Closing the iterator cancels scripts still being checked and stops
+    taking paths.
+
+    :param paths: Paths to scripts.
+    :param config: Linter configuration.
+    :param jobs: Amount of worker processes.
+    :returns: Iterator over script paths, errors, symbols and durations.
+    """
+    check_script = partial(_check_script_timed, config=config)
+    if jobs <= 1 and config.time_budget is None and config.memory_cap is None:
+        with closing(read_ahead(paths)) as scripts:
+            for script_path, contents in scripts:
+                yield script_path, *check_script(script_path, contents=contents)
+        return
+
+    paths, submitted = tee(paths)
+    pool = IsolatedPool(
+        check_script,
+        workers=jobs,
+        time_budget=config.time_budget,
+        memory_cap=config.memory_cap,
+        initializer=lexer.warm_up,
+    )
+    for script_path, result in zip(paths, pool.map(submitted), strict=True):
+        if not isinstance(result, IsolationError):
+            yield script_path, *result
+            continue
+        duration = 0.0
+        if isinstance(result, TimeBudgetExceededError):
+            duration = config.time_budget or duration
+        errors = [failures.isolation_error(script_path, result)]
+        yield (
+            script_path,
+            [error for error in errors if _is_valid_error(error, [], config)],
+            None,
+            duration,
+        )
 
 
 def check(
     path: Path,
     config: Config | None = None,
+    jobs: int = 1,
+    history: History | None = None,
+    paths: Iterable[Path] | None = None,
+    max_errors: int | None = None,
+    index: SymbolIndex | None = None,
+    baseline: BaselineFilter | None = None,
+    spool: Spool[ScriptError] | None = None,
 ) -> list[ScriptError]:
     """Lint given paths and return errors.
 
+    Scripts are checked longest first according to given history. When
+    maximal amount of errors is given, scripts are discovered lazily and
+    checked in discovery order until the amount is reached. Cross-file
+    rules are checked once all scripts are, using symbol index. Scripts
+    that failed are left out of the index rather than parsed again
+    without isolation limits. When spool is given without maximal amount
+    of errors, errors of every script are moved to the spool as soon as
+    the script is checked.
+
     :param path: Directory to check.
     :param config: Linter configuration.
-    :returns: Array of script errors.
+    :param jobs: Amount of worker processes.
+    :param history: Durations of previous runs, updated with this run.
+    :param paths: Scripts to check, all scripts in directory if None.
+    :param max_errors: Amount of errors to stop checking at, None for all.
+    :param index: Symbol index of previous runs, updated with this run.
+    :param baseline: Filter of accepted errors, not counted or returned.
+    :param spool: Spool to move script errors to.
+    :returns: Array of script errors not moved to spool.
     """
     config = config or Config()
+    history = history or History(path)
+    index = index or SymbolIndex(path, config=config)
+    if paths is None:
+        paths = path.rglob("*.gd")
+
+    predicted = 0.0
+    if max_errors is None:
+        scheduled = history.order(paths)
+        paths = [script_path for script_path, _ in scheduled]
+        predicted = predict_makespan((cost for _, cost in scheduled), jobs)
+    start = time.perf_counter()
+
+    spool = spool if max_errors is None else None
+    with_index = _has_index_rules(config)
+    errors: list[ScriptError] = []
+    checked: list[Path] = []
+    updated: list[Path] = []
+    with closing(_check_scripts(paths, config, jobs=jobs)) as results:
+        for script_path, found, symbols, duration in results:
+            history.record(script_path, duration)
+            checked.append(script_path)
+            if with_index:
+                index.update(script_path, symbols)
+                updated.append(script_path)
+            script_errors = found
+            if baseline is not None:
+                script_errors = baseline.filter_script_errors(found)
+            errors.extend(script_errors)
+            if max_errors is not None and len(errors) >= max_errors:
+                break
+            if spool is not None:
+                spool.extend(errors)
+                errors.clear()
+
+    if with_index and (max_errors is None or len(errors) < max_errors):
+        index.refresh(path.rglob("*.gd"), updated=updated)
+        errors.extend(_check_index(index, checked, config, baseline=baseline))
+
+    history.record_makespan(
+        SCRIPTS_PHASE,
+        predicted,
+        time.perf_counter() - start,
+    )
+    if max_errors is not None:
+        del errors[max_errors:]
+    return errors
+
+
+def _check_index(
+    index: SymbolIndex,
+    paths: list[Path],
+    config: Config,
+    baseline: BaselineFilter | None = None,
+) -> list[ScriptError]:
+    """Check cross-file rules of given scripts using symbol index.
 
+    :param index: Up to date project symbol index.
+    :param paths: Scripts to report errors in.
+    :param config: Linter configuration.
+    :param baseline: Filter of accepted errors, not returned.
+    :returns: Array of script errors.
+    """
     errors: list[ScriptError] = []
-    for script_path in path.rglob("*.gd"):
-        errors.extend(_check_script(script_path, config=config))
+    for rule in INDEX_RULES:
+        if rule.codename not in config.ignores:
+            with timed(rule.codename):
+                errors.extend(rule.check(index, paths, config=config))
+    errors = _filter_index_errors(index, errors, config)
+    if baseline is not None:
+        errors = baseline.filter_script_errors(errors)
+    return errors
+
+
+def _filter_index_errors(
+    index: SymbolIndex,
+    errors: list[ScriptError],
+    config: Config,
+) -> list[ScriptError]:
+    """Filter cross-file errors ignored by `noqa` or config.
+
+    :param index: Project symbol index with script noqa ignores.
+    :param errors: Errors to filter.
+    :param config: Linter configuration.
+    :returns: Array of errors not ignored.
+    """
+    valid_errors: list[ScriptError] = []
+    for error in errors:
+        symbols = index.get(error.path)
+        noqa_ignores = symbols.noqa_ignores if symbols else []
+        if _is_valid_error(error, noqa_ignores, config=config):
+            valid_errors.append(error)
+    return valid_errors
 
+
+def check_references(
+    path: Path,
+    references: ReferenceIndex,
+    config: Config | None = None,
+    paths: Iterable[Path] | None = None,
+    baseline: BaselineFilter | None = None,
+) -> list[ScriptError]:
+    """Validate node paths of given scripts against scenes using them.
+
+    Scripts not indexed during this run are indexed first, and so are
+    scenes of the whole Godot project, even outside of given directory.
+
+    :param path: Directory to check.
+    :param references: Cross-reference index, scenes of this run added.
+    :param config: Linter configuration.
+    :param paths: Scripts to report errors in, all scripts if None.
+    :param baseline: Filter of accepted errors, not returned.
+    :returns: Array of script errors.
+    """
+    config = config or Config()
+    rules = [
+        rule for rule in REFERENCE_RULES if rule.codename not in config.ignores
+    ]
+    if not rules:
+        return []
+    if not references.symbols.refreshed:
+        references.symbols.refresh(path.rglob("*.gd"))
+    references.refresh(references.root.rglob("*.tscn"))
+
+    script_paths = list(path.rglob("*.gd") if paths is None else paths)
+    errors: list[ScriptError] = []
+    for rule in rules:
+        with timed(rule.codename):
+            errors.extend(
+                rule.check(references, script_paths, config=config),
+            )
+    errors = _filter_index_errors(references.symbols, errors, config)
+    if baseline is not None:
+        errors = baseline.filter_script_errors(errors)
     return errors
@@ -0,0 +1,239 @@
+"""Provide function-level incremental script linting for long sessions.
+
+Scripts are split into top-level blocks (functions, classes and class
+body statements). Only blocks whose contents changed since the previous
+check are parsed and visited again, errors of other blocks are reused and
+shifted to their new lines.
+
+CLI runs check every script once, so they have no earlier blocks to reuse
+and do not use incremental linting. It is meant for editor integrations
+and other processes checking the same scripts over and over.
+"""
+
+import hashlib
+import io
+import re
+from pathlib import Path
+from typing import Final
+
+from node8.core.config import Config
+from node8.models.errors import ScriptError
+from node8.services import gdscript
+from node8.services.rules.failures import PARSE_ERROR_CODENAME
+
+FIRST_LINE: Final[int] = 1
+COMMENT_PREFIX: Final[str] = "#"
+LINE_CONTINUATION: Final[str] = "\\"
+LONG_QUOTES: Final[frozenset[str]] = frozenset(('"""', "'''"))
+OPEN_BRACKETS: Final[frozenset[str]] = frozenset("([{")
+CLOSE_BRACKETS: Final[frozenset[str]] = frozenset(")]}")
+SCAN_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"\"\"\"|'''|\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*'|#.*|[()\[\]{}]",
+)
+
+
+class Block:
+    """Top-level script block.
+
+    Errors are stored with lines relative to block start.
+    """
+
+    def __init__(self, start: int, contents: str) -> None:
+        """Initialize Block class.
+
+        :param start: Script line block starts at.
+        :param contents: Block contents.
+        """
+        self.start = start
+        self.contents = contents
+        self.digest = hashlib.blake2b(contents.encode()).digest()
+
+
+def _scan_line(
+    line: str,
+    depth: int,
+    long_quote: str | None,
+) -> tuple[int, str | None]:
+    """Update bracket depth and long string state with script line.
+
+    :param line: Script line.
+    :param depth: Bracket depth at line start.
+    :param long_quote: Quote of long string open at line start, if any.
+    :returns: Bracket depth and open long string quote at line end.
+    """
+    position = 0
+    while position < len(line):
+        if long_quote is not None:
+            end = line.find(long_quote, position)
+            if end < 0:
+                return depth, long_quote
+            position = end + len(long_quote)
+            long_quote = None
+            continue
+        match = SCAN_PATTERN.search(line, position)
+        if match is None:
+            break
+        lexeme = match.group()
+        position = match.end()
+        if lexeme in LONG_QUOTES:
+            long_quote = lexeme
+        elif lexeme in OPEN_BRACKETS:
+            depth += 1
+        elif lexeme in CLOSE_BRACKETS:
+            depth = max(depth - 1, 0)
+    return depth, long_quote
+
+
+def _get_block_starts(lines: list[str]) -> list[int]:
+    """Find script lines starting top-level blocks.
+
+    Block starts at an unindented line outside of brackets, long strings
+    and line continuations. Comments right above the block, such as
+    documentation comments, belong to it.
+
+    :param lines: Script lines.
+    :returns: Array of block start lines, always starting with first line.
+    """
+    starts: list[int] = [FIRST_LINE]
+    depth = 0
+    long_quote: str | None = None
+    continued = False
+    for line_number, line in enumerate(lines, start=FIRST_LINE):
+        if (
+            depth == 0
+            and long_quote is None
+            and not continued
+            and line_number > FIRST_LINE
+            and line[:1].strip()
+            and not line.startswith(COMMENT_PREFIX)
+        ):
+            start = line_number
+            while start - 1 > starts[-1] and lines[start - 2].startswith(
+                COMMENT_PREFIX,
+            ):
+                start -= 1
+            starts.append(start)
+        depth, long_quote = _scan_line(line, depth, long_quote)
+        continued = long_quote is None and line.rstrip().endswith(
+            LINE_CONTINUATION,
+        )
+    return starts
+
+
+def split_blocks(contents: str) -> list[Block]:
+    """Split script into top-level blocks.
+
+    :param contents: Script contents.
+    :returns: Array of blocks in script order.
+    """
+    lines = io.StringIO(contents).readlines()
+    starts = _get_block_starts(lines)
+    ends = [*starts[1:], len(lines) + 1]
+    return [
+        Block(start, "".join(lines[start - 1 : end - 1]))
+        for start, end in zip(starts, ends, strict=True)
+    ]
+
+
+def _shift(errors: list[ScriptError], offset: int) -> list[ScriptError]:
+    """Shift lines of given errors.
+
+    :param errors: Errors to shift.
+    :param offset: Amount of lines to shift by.
+    :returns: Array of shifted errors.
+    """
+    if offset == 0:
+        return list(errors)
+    return [
+        error.model_copy(update={"line": error.line + offset})
+        for error in errors
+    ]
+
+
+class IncrementalLinter:
+    """Script linter keeping block errors between checks.
+
+    Meant to be kept alive for the whole editor or watch session.
+    """
+
+    def __init__(self, config: Config | None = None) -> None:
+        """Initialize IncrementalLinter class.
+
+        :param config: Linter configuration.
+        """
+        self.config = config or Config()
+        self.block_config = self.config.model_copy(
+            update={
+                "ignores": [
+                    codename
+                    for codename in self.config.ignores
+                    if codename != PARSE_ERROR_CODENAME
+                ],
+            },
+        )
+        self.blocks: dict[Path, dict[bytes, list[ScriptError]]] = {}
+
+    def _check_block(self, path: Path, block: Block) -> list[ScriptError]:
+        """Check a single block.
+
+        Parse errors are reported even if ignored, so they can be told
+        apart from blocks without errors.
+
+        :param path: Script file path.
+        :param block: Block to check.
+        :returns: Array of errors with lines relative to block start.
+        """
+        return gdscript.check_contents(
+            path,
+            block.contents,
+            self.block_config,
+        )
+
+    def check(self, path: Path, contents: str) -> list[ScriptError]:
+        """Check script, only checking blocks changed since last check.
+
+        Falls back to checking whole script when a block can not be parsed
+        on its own.
+
+        :param path: Script file path.
+        :param contents: Current script contents.
+        :returns: Array of script errors.
+        """
+        cached = self.blocks.get(path, {})
+        blocks = split_blocks(contents)
+
+        checked: dict[bytes, list[ScriptError]] = {}
+        errors: list[ScriptError] = []
+        for block in blocks:
+            block_errors = checked.get(block.digest, cached.get(block.digest))
+            if block_errors is None:
+                block_errors = self._check_block(path, block)
+                if any(
+                    error.error.codename == PARSE_ERROR_CODENAME
+                    for error in block_errors
+                ):
+                    return self._check_whole(path, contents)
+            checked[block.digest] = block_errors
+            errors.extend(_shift(block_errors, block.start - FIRST_LINE))
+
+        self.blocks[path] = checked
+        return errors
+
+    def _check_whole(self, path: Path, contents: str) -> list[ScriptError]:
+        """Check whole script as a single block.
+
+        :param path: Script file path.
+        :param contents: Current script contents.
+        :returns: Array of script errors.
+        """
+        block = Block(FIRST_LINE, contents)
+        errors = gdscript.check_contents(path, contents, self.config)
+        self.blocks[path] = {block.digest: errors}
+        return errors
+
+    def forget(self, path: Path) -> None:
+        """Drop cached blocks of given script.
+
+        :param path: Script file path.
+        """
+        self.blocks.pop(path, None)
@@ -0,0 +1,327 @@
+"""Provide isolated per-file processing with time budget and memory cap.
+
+Every file is processed in a worker process. A worker exceeding its time
+budget is killed and replaced, so a single pathological file never stalls
+or aborts the rest of the run.
+"""
+
+import multiprocessing
+import sys
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from multiprocessing.connection import Connection, wait
+from multiprocessing.process import BaseProcess
+from typing import Any, Final, Generic, TypeVar
+
+from node8.core.errors import (
+    IsolationError,
+    MemoryCapExceededError,
+    TimeBudgetExceededError,
+    WorkerCrashedError,
+)
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+BYTES_IN_MEGABYTE: Final[int] = 1024 * 1024
+TERMINATE_TIMEOUT: Final[float] = 1.0
+
+RESULT_READY: Final[str] = "ready"
+RESULT_OK: Final[str] = "ok"
+RESULT_MEMORY: Final[str] = "memory"
+RESULT_FAILED: Final[str] = "failed"
+
+
+def _limit_memory(memory_cap: int | None) -> None:
+    """Limit address space of current process.
+
+    Memory cap is not supported on Windows and is ignored there.
+
+    :param memory_cap: Memory cap in megabytes, None for no cap.
+    """
+    if memory_cap is None or sys.platform == "win32":
+        return
+    import resource  # noqa: PLC0415
+
+    limit = memory_cap * BYTES_IN_MEGABYTE
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _work(
+    func: Callable[[Any], Any],
+    connection: Connection,
+    memory_cap: int | None,
+    initializer: Callable[[], None] | None,
+) -> None:
+    """Worker process loop processing received items one by one.
+
+    Worker reports readiness once initialized, so initialization is not
+    counted against time budget of the first item. Running out of memory
+    while sending a result is reported the same way as while processing.
+
+    :param func: Function to process items with.
+    :param connection: Connection to receive items and send results with.
+    :param memory_cap: Memory cap in megabytes, None for no cap.
+    :param initializer: Function to call once before processing items.
+    """
+    _limit_memory(memory_cap)
+    if initializer is not None:
+        initializer()
+    connection.send((RESULT_READY, None))
+    while True:
+        try:
+            item = connection.recv()
+        except EOFError:
+            return
+        try:
+            connection.send((RESULT_OK, func(item)))
+        except MemoryError:
+            connection.send((RESULT_MEMORY, None))
+        except Exception as error:  # noqa: BLE001
+            connection.send((RESULT_FAILED, f"{type(error).__name__}: {error}"))
+
+
+class _Worker:
+    """Worker process handle with its current task."""
+
+    def __init__(
+        self,
+        func: Callable[[Any], Any],
+        memory_cap: int | None,
+        initializer: Callable[[], None] | None,
+    ) -> None:
+        """Initialize and start worker process.
+
+        :param func: Function to process items with.
+        :param memory_cap: Memory cap in megabytes, None for no cap.
+        :param initializer: Function to call once before processing items.
+        """
+        self.func = func
+        self.memory_cap = memory_cap
+        self.initializer = initializer
+        self.ready = False
+        self.task: tuple[int, float] | None = None
+        self.process: BaseProcess
+        self.connection: Connection
+        self.start()
+
+    def start(self) -> None:
+        """Start a new worker process."""
+        connection, child_connection = multiprocessing.Pipe()
+        self.process = multiprocessing.get_context().Process(
+            target=_work,
+            args=(
+                self.func,
+                child_connection,
+                self.memory_cap,
+                self.initializer,
+            ),
+            daemon=True,
+        )
+        self.process.start()
+        child_connection.close()
+        self.connection = connection
+        self.ready = False
+        self.task = None
+
+    def stop(self) -> None:
+        """Kill worker process."""
+        self.connection.close()
+        self.process.terminate()
+        self.process.join(TERMINATE_TIMEOUT)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+
+    def restart(self) -> None:
+        """Kill worker process and start a new one."""
+        self.stop()
+        self.start()
+
+    def submit(self, index: int, item: object) -> None:
+        """Send item to worker process.
+
+        :param index: Index of item.
+        :param item: Item to process.
+        """
+        self.connection.send(item)
+        self.task = (index, time.perf_counter())
+
+
+class IsolatedPool(Generic[ItemT, ResultT]):  # noqa: UP046
+    """Pool of worker processes isolating every processed item.
+
+    Failed items produce isolation exceptions instead of results.
+    """
+
+    def __init__(
+        self,
+        func: Callable[[ItemT], ResultT],
+        workers: int = 1,
+        time_budget: float | None = None,
+        memory_cap: int | None = None,
+        initializer: Callable[[], None] | None = None,
+    ) -> None:
+        """Initialize IsolatedPool class.
+
+        :param func: Picklable function to process items with.
+        :param workers: Amount of worker processes.
+        :param time_budget: Time budget per item in seconds, None for none.
+        :param memory_cap: Memory cap per worker in megabytes.
+        :param initializer: Picklable function to initialize workers with.
+        """
+        self.func = func
+        self.workers = max(workers, 1)
+        self.time_budget = time_budget
+        self.memory_cap = memory_cap
+        self.initializer = initializer
+
+    def _receive(self, worker: _Worker) -> ResultT | IsolationError | None:
+        """Receive result of finished worker task.
+
+        :param worker: Worker with finished task or finished initialization.
+        :returns: Result or isolation exception, None if worker got ready.
+        """
+        try:
+            status, payload = worker.connection.recv()
+        except (EOFError, OSError):
+            worker.restart()
+            return WorkerCrashedError("worker process exited")
+        if status == RESULT_READY:
+            worker.ready = True
+            return None
+        if status == RESULT_OK:
+            return payload  # type: ignore[no-any-return]
+        if status == RESULT_MEMORY:
+            worker.restart()
+            return MemoryCapExceededError(f"{self.memory_cap} MB")
+        return IsolationError(payload)
+
+    def _expired(self, worker: _Worker, now: float) -> bool:
+        """Check if worker task exceeded time budget.
+
+        :param worker: Busy worker.
+        :param now: Current time.
+        :returns: True if time budget is exceeded, False otherwise.
+        """
+        if self.time_budget is None or worker.task is None:
+            return False
+        return now - worker.task[1] >= self.time_budget
+
+    def _wait_timeout(self, waited: list[_Worker]) -> float | None:
+        """Get time until the first busy worker exceeds time budget.
+
+        :param waited: Busy and initializing workers.
+        :returns: Timeout in seconds, None to wait indefinitely.
+        """
+        starts = [worker.task[1] for worker in waited if worker.task]
+        if self.time_budget is None or not starts:
+            return None
+        return max(min(starts) + self.time_budget - time.perf_counter(), 0)
+
+    def _poll(
+        self,
+        workers: list[_Worker],
+        pending: deque[tuple[int, ItemT]],
+        results: dict[int, ResultT | IsolationError],
+    ) -> None:
+        """Submit pending items to idle workers and collect finished ones.
+
+        :param workers: Pool workers.
+        :param pending: Indexed items waiting to be submitted.
+        :param results: Indexed results to add collected results to.
+        """
+        for worker in workers:
+            if worker.ready and worker.task is None and pending:
+                worker.submit(*pending.popleft())
+        waited = [
+            worker
+            for worker in workers
+            if worker.task is not None or not worker.ready
+        ]
+        ready = wait(
+            [worker.connection for worker in waited],
+            timeout=self._wait_timeout(waited),
+        )
+        now = time.perf_counter()
+        for worker in waited:
+            task = worker.task
+            if worker.connection not in ready:
+                if task is not None and self._expired(worker, now):
+                    worker.restart()
+                    results[task[0]] = TimeBudgetExceededError(
+                        f"{self.time_budget} s",
+                    )
+                continue
+            result = self._receive(worker)
+            if result is None:
+                continue
+            if task is None and pending:
+                # worker failed to initialize, fail next item instead
+                # of restarting workers indefinitely
+                task = (pending.popleft()[0], now)
+            if task is not None:
+                results[task[0]] = result
+                worker.task = None
+
+    def _take(
+        self,
+        items: Iterator[tuple[int, ItemT]],
+        workers: list[_Worker],
+        pending: deque[tuple[int, ItemT]],
+    ) -> bool:
+        """Take items while workers can take them, starting workers as needed.
+
+        :param items: Indexed items to take from.
+        :param workers: Pool workers, new workers added to.
+        :param pending: Indexed items waiting to be submitted.
+        :returns: False if items are exhausted, True otherwise.
+        """
+        busy = sum(worker.task is not None for worker in workers)
+        while busy + len(pending) < self.workers:
+            item = next(items, None)
+            if item is None:
+                return False
+            pending.append(item)
+            if len(workers) < busy + len(pending):
+                workers.append(
+                    _Worker(self.func, self.memory_cap, self.initializer),
+                )
+        return True
+
+    def map(
+        self,
+        items: Iterable[ItemT],
+    ) -> Iterator[ResultT | IsolationError]:
+        """Process items and yield results in order of items.
+
+        Items are taken only once a worker can process them, so closing
+        the iterator stops taking items from a lazily produced iterable.
+
+        :param items: Items to process.
+        :returns: Iterator over results or isolation exceptions.
+        """
+        indexed = enumerate(items)
+        pending: deque[tuple[int, ItemT]] = deque()
+        results: dict[int, ResultT | IsolationError] = {}
+        workers: list[_Worker] = []
+        next_index = 0
+        exhausted = False
+        try:
+            while True:
+                exhausted = exhausted or not self._take(
+                    indexed,
+                    workers,
+                    pending,
+                )
+                busy = any(worker.task is not None for worker in workers)
+                if exhausted and not pending and not busy:
+                    return
+                self._poll(workers, pending, results)
+                while next_index in results:
+                    yield results.pop(next_index)
+                    next_index += 1
+        finally:
+            for worker in workers:
+                worker.stop()
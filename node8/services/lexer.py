@@ -0,0 +1,145 @@
+"""Provide GDScript tokenization functions for lexical linting rules.
+
+Token stream is either produced by lexer alone or recorded while
+parsing, so a script is never tokenized twice.
+"""
+
+from collections.abc import Iterator
+from functools import cache
+from typing import Any, Final
+
+from gdtoolkit.parser import parser  # type: ignore[import-untyped]
+from lark import Lark, Token, Tree
+
+NAME_TYPE: Final[str] = "NAME"
+DOT_TYPE: Final[str] = "DOT"
+DOTTED_NAME_TYPE: Final[str] = "TYPE_HINT"
+DOTTED_NAME_SEPARATOR: Final[str] = "."
+INDENTER_TYPES: Final[frozenset[str]] = frozenset(("_INDENT", "_DEDENT"))
+
+WARM_UP_SCRIPT: Final[str] = """extends Node
+class_name WarmUp
+
+signal done(value: int)
+enum State { IDLE, RUN = 2 }
+const LIMIT: int = 10
+@export var speed: float = 1.0
+var items := [1, 2.0, "three", {"key": null}]
+@onready var label: Label = $Path/Label
+
+
+## Documentation comment.
+func run(value: int, other = 0) -> void:
+    var total := value + other * 2  # comment
+    if total > LIMIT and not is_inside_tree():
+        return
+    elif total == 0:
+        pass
+    else:
+        for item in items:
+            while false:
+                break
+    match total:
+        1, 2:
+            total -= 1
+        _:
+            total = -total
+    done.emit(get_node("A").get_child(0).name)
+    var callback := func(x): return x is Node
+    await get_tree().process_frame
+"""
+
+
+def _get_lark_parser() -> Lark:
+    """Get gdtoolkit lark parser gathering metadata.
+
+    :returns: Cached lark parser.
+    """
+    return parser._parser_with_metadata  # type: ignore[no-any-return] # noqa: SLF001
+
+
+@cache
+def get_tree_types() -> frozenset[str]:
+    """Get types syntax tree nodes of parsed scripts can have.
+
+    :returns: Grammar rule names and aliases.
+    """
+    return frozenset(
+        str(name)
+        for rule in _get_lark_parser().rules
+        for name in (rule.origin.name, rule.alias)
+        if name
+    )
+
+
+def _split_dotted_name(token: Token) -> Iterator[Token]:
+    """Split standalone lexer dotted name into name and dot tokens.
+
+    Standalone lexer has no parser state to tell names from type hints,
+    so `position.x` is lexed as a single type hint token.
+
+    :param token: Dotted name token to split.
+    :returns: Iterator over name and dot tokens.
+    """
+    column: int = token.column or 0
+    start_pos: int = token.start_pos or 0
+    for index, name in enumerate(str(token).split(DOTTED_NAME_SEPARATOR)):
+        if index > 0:
+            yield Token(
+                DOT_TYPE,
+                DOTTED_NAME_SEPARATOR,
+                start_pos=start_pos,
+                line=token.line,
+                column=column,
+                end_line=token.line,
+                end_column=column + 1,
+                end_pos=start_pos + 1,
+            )
+            column += 1
+            start_pos += 1
+        yield Token(
+            NAME_TYPE,
+            name,
+            start_pos=start_pos,
+            line=token.line,
+            column=column,
+            end_line=token.line,
+            end_column=column + len(name),
+            end_pos=start_pos + len(name),
+        )
+        column += len(name)
+        start_pos += len(name)
+
+
+def tokenize(code: str) -> list[Token]:
+    """Tokenize given script without parsing it.
+
+    :param code: Script contents.
+    :returns: Array of script tokens.
+    """
+    tokens: list[Token] = []
+    for token in _get_lark_parser().lex(code + "\n"):
+        if token.type in INDENTER_TYPES:
+            continue
+        if token.type == DOTTED_NAME_TYPE:
+            tokens.extend(_split_dotted_name(token))
+        else:
+            tokens.append(token)
+    return tokens
+
+
+def parse(code: str) -> tuple[Tree[Any], list[Token]]:
+    """Parse given script and retrieve tokens consumed by the parser.
+
+    :param code: Script contents.
+    :returns: Syntax tree with metadata and array of script tokens.
+    """
+    syntax_tree: Tree[Any] = parser.parse(code, gather_metadata=True)
+    indenter: Any = _get_lark_parser().options.postlex
+    return syntax_tree, list(indenter.processed_tokens)
+
+
+def warm_up() -> None:
+    """Build cached parsers and lexer states before the first script."""
+    parser.parse_comments(WARM_UP_SCRIPT)
+    parser.parse(WARM_UP_SCRIPT, gather_metadata=True)
@@ -0,0 +1,51 @@
+"""Provide run metrics collected while linting.
+
+Rule durations are accumulated per process, so rules checked in isolated
+worker processes are not accounted for.
+"""
+
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Final
+
+PATTERNS_TIMER: Final[str] = "patterns"
+BYTES_IN_KILOBYTE: Final[int] = 1024
+
+rule_durations: defaultdict[str, float] = defaultdict(float)
+
+
+@contextmanager
+def timed(name: str) -> Iterator[None]:
+    """Add duration of the block to rule durations.
+
+    :param name: Rule codename or timer name.
+    :returns: Context manager timing the block.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        rule_durations[name] += time.perf_counter() - start
+
+
+def get_peak_memory() -> int | None:
+    """Get peak resident memory of this process and its workers.
+
+    Peak memory is not supported on Windows.
+
+    :returns: Peak resident memory in kilobytes, None if not supported.
+    """
+    if sys.platform == "win32":
+        return None
+    import resource  # noqa: PLC0415
+
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    if sys.platform == "darwin":
+        return peak // BYTES_IN_KILOBYTE
+    return peak
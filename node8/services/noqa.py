@@ -1,13 +1,25 @@
-"""Provide ignore tools for 'noqa' to silence specified linter errors."""
+"""Provide ignore tools for 'noqa' to silence specified linter errors.
 
+Scripts are silenced with `# noqa` comments. Scene files have no
+comments, so scenes are silenced as a whole with `noqa` metadata of any
+of their nodes, e.g. `metadata/noqa = "SC001"` or `metadata/noqa = true`.
+"""
+
+import re
 from pathlib import Path
-from typing import Any
+from typing import Any, Final
 
 from gdtoolkit.parser import parser  # type: ignore[import-untyped]
 from lark import Token, Tree
 
 from node8.models.noqa import NoqaIgnore
 
+SCENE_NOQA_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r'^metadata/noqa = (?:(true)|"([^"]*)")$',
+    re.MULTILINE,
+)
+CODENAMES_SEPARATOR: Final[re.Pattern[str]] = re.compile(r"[\s,]+")
+
 
 def _get_ignore_token(comment: Token) -> NoqaIgnore | None:
     """Parse comment token for `noqa` keyword.
@@ -65,3 +77,28 @@ def get_ignores_path(path: Path) -> list[NoqaIgnore]:
         script_contents = script.read()
     tree: Tree[Any] = parser.parse_comments(script_contents)
     return get_ignores_tree(tree)
+
+
+def get_ignores_scene(scene_contents: str) -> NoqaIgnore | None:
+    """Get scene-wide noqa ignore from scene file contents.
+
+    Contents are searched as text, so scenes do not need to be parsed.
+
+    :param scene_contents: Scene file contents.
+    :returns: None if scene has no `noqa` metadata, noqa ignore otherwise.
+    """
+    match = SCENE_NOQA_PATTERN.search(scene_contents)
+    if match is None:
+        return None
+    line = scene_contents.count("\n", 0, match.start()) + 1
+    ignore_all, codenames = match.groups()
+    if ignore_all is not None:
+        return NoqaIgnore(line=line, ignore_all=True)
+    return NoqaIgnore(
+        line=line,
+        ignores=[
+            codename
+            for codename in CODENAMES_SEPARATOR.split(codenames)
+            if codename
+        ],
+    )
@@ -0,0 +1,303 @@
+"""Provide declarative tree-pattern rules compiled into a dispatch table.
+
+A pattern is a syntax tree node type optionally followed by constraints
+on its children, e.g. `getattr_call(0.0=OS, 0.2=get_ticks_msec)`:
+
+- `0.2=value` requires the third child of the first child to be a token
+  with given value, or a tree of given type;
+- `0=print|prints` accepts any of the alternatives;
+- `0=$name` captures the child, so messages can refer to it as `$name`,
+  a child can be both constrained and captured.
+
+Child indices may be negative to count from the last child. Patterns are
+compiled once into per-node-type tables keyed by their most selective
+child, so a node is only checked against patterns that could match it.
+"""
+
+import re
+from collections import Counter
+from collections.abc import Collection, Iterable, Iterator
+from functools import lru_cache
+from pathlib import Path
+from string import Template
+from typing import Any, Final
+
+from lark import Token, Tree
+
+from node8.models.errors import Error, ScriptError
+from node8.models.patterns import PatternRule
+
+PATTERN_REGEX: Final[re.Pattern[str]] = re.compile(
+    r"\s*(\w+)\s*(?:\((.*)\))?\s*",
+)
+CONSTRAINT_REGEX: Final[re.Pattern[str]] = re.compile(
+    r"\s*(-?\d+(?:\.-?\d+)*)\s*=\s*([^\s|,()](?:[^,()]*[^\s,()])?)\s*",
+)
+CONSTRAINT_SEPARATOR: Final[str] = ","
+ALTERNATIVE_SEPARATOR: Final[str] = "|"
+PATH_SEPARATOR: Final[str] = "."
+CAPTURE_PREFIX: Final[str] = "$"
+
+ChildPath = tuple[int, ...]
+
+
+class Pattern:
+    """Parsed tree pattern."""
+
+    def __init__(
+        self,
+        node_type: str,
+        constraints: dict[ChildPath, frozenset[str]],
+        captures: dict[str, ChildPath],
+    ) -> None:
+        """Initialize Pattern class.
+
+        :param node_type: Type of matched tree nodes.
+        :param constraints: Accepted child values by child path.
+        :param captures: Captured child paths by capture name.
+        """
+        self.node_type = node_type
+        self.constraints = constraints
+        self.captures = captures
+
+
+def parse_pattern(pattern: str) -> Pattern:
+    """Parse tree pattern.
+
+    :param pattern: Pattern source.
+    :returns: Parsed pattern.
+    :raises ValueError: If pattern is not valid.
+    """
+    match = PATTERN_REGEX.fullmatch(pattern)
+    if match is None:
+        msg: str = f"invalid pattern: {pattern}"
+        raise ValueError(msg)
+    node_type, body = match.groups()
+
+    constraints: dict[ChildPath, frozenset[str]] = {}
+    captures: dict[str, ChildPath] = {}
+    if body is None or not body.strip():
+        return Pattern(node_type, constraints, captures)
+    for constraint in body.split(CONSTRAINT_SEPARATOR):
+        constraint_match = CONSTRAINT_REGEX.fullmatch(constraint)
+        if constraint_match is None:
+            msg = f"invalid constraint `{constraint.strip()}` in: {pattern}"
+            raise ValueError(msg)
+        path_source, value = constraint_match.groups()
+        path = tuple(map(int, path_source.split(PATH_SEPARATOR)))
+        if value.startswith(CAPTURE_PREFIX):
+            captures[value.removeprefix(CAPTURE_PREFIX)] = path
+        else:
+            constraints[path] = frozenset(
+                alternative.strip()
+                for alternative in value.split(ALTERNATIVE_SEPARATOR)
+            )
+    return Pattern(node_type, constraints, captures)
+
+
+def _get_child(tree: Tree[Any], path: ChildPath) -> str | None:
+    """Get value of nested child of given tree.
+
+    :param tree: Matched tree.
+    :param path: Child indices from given tree down to the child.
+    :returns: Token value or tree type, None if there is no such child.
+    """
+    node: Tree[Any] | Token = tree
+    for index in path:
+        if not isinstance(node, Tree) or not (
+            -len(node.children) <= index < len(node.children)
+        ):
+            return None
+        node = node.children[index]
+    if isinstance(node, Tree):
+        return str(node.data)
+    return str(node)
+
+
+class _NodeTypeTable:
+    """Patterns of a single node type keyed by their most common child."""
+
+    def __init__(self, entries: list[tuple[Pattern, PatternRule]]) -> None:
+        """Initialize _NodeTypeTable class.
+
+        :param entries: Parsed patterns with their rules.
+        """
+        paths = Counter(
+            path for pattern, _ in entries for path in pattern.constraints
+        )
+        self.key_path: ChildPath | None = None
+        if paths:
+            self.key_path = paths.most_common(1)[0][0]
+        self.keyed: dict[str, list[tuple[Pattern, PatternRule]]] = {}
+        self.unkeyed: list[tuple[Pattern, PatternRule]] = []
+        for pattern, rule in entries:
+            values = pattern.constraints.get(self.key_path or ())
+            if self.key_path is None or values is None:
+                self.unkeyed.append((pattern, rule))
+                continue
+            for value in values:
+                self.keyed.setdefault(value, []).append((pattern, rule))
+
+    def candidates(
+        self,
+        tree: Tree[Any],
+    ) -> Iterator[tuple[Pattern, PatternRule]]:
+        """Iterate over patterns that could match given tree.
+
+        :param tree: Tree of table node type.
+        :returns: Iterator over patterns with their rules.
+        """
+        if self.key_path is not None:
+            key = _get_child(tree, self.key_path)
+            if key is not None:
+                yield from self.keyed.get(key, ())
+        yield from self.unkeyed
+
+
+def validate_rules(rules: Iterable[PatternRule]) -> None:
+    """Validate pattern syntax of given rules.
+
+    :param rules: Pattern rules to validate.
+    :raises ValueError: If any pattern is not valid.
+    """
+    for rule in rules:
+        parse_pattern(rule.pattern)
+
+
+class PatternTable:
+    """Dispatch table of compiled pattern rules."""
+
+    def __init__(
+        self,
+        rules: Iterable[PatternRule],
+        tree_types: Collection[str] | None = None,
+    ) -> None:
+        """Compile given pattern rules.
+
+        :param rules: Pattern rules to compile.
+        :param tree_types: Syntax tree node types of the grammar, other
+            accepted child values are token values. Unknown if None.
+        :raises ValueError: If any pattern is not valid.
+        """
+        entries: dict[str, list[tuple[Pattern, PatternRule]]] = {}
+        for rule in rules:
+            pattern = parse_pattern(rule.pattern)
+            entries.setdefault(pattern.node_type, []).append((pattern, rule))
+        self.tables = {
+            node_type: _NodeTypeTable(node_entries)
+            for node_type, node_entries in entries.items()
+        }
+        self.token_constraints: list[list[frozenset[str]]] | None = None
+        if tree_types is not None:
+            self.token_constraints = [
+                [
+                    values
+                    for values in pattern.constraints.values()
+                    if values.isdisjoint(tree_types)
+                ]
+                for node_entries in entries.values()
+                for pattern, _ in node_entries
+            ]
+
+    def __bool__(self) -> bool:
+        """Check if table has any pattern.
+
+        :returns: True if any pattern was compiled, False otherwise.
+        """
+        return bool(self.tables)
+
+    def may_match(self, contents: str) -> bool:
+        """Check if any pattern may match syntax tree of given script.
+
+        Token values required by a pattern are part of script contents,
+        so scripts missing any of them do not need to be parsed for it.
+        Constraints accepting tree types are not checked.
+
+        :param contents: Script contents.
+        :returns: False if no pattern can match, True otherwise.
+        """
+        if self.token_constraints is None:
+            return bool(self)
+        return any(
+            all(
+                any(value in contents for value in values)
+                for values in constraints
+            )
+            for constraints in self.token_constraints
+        )
+
+    def match(
+        self,
+        tree: Tree[Any],
+    ) -> Iterator[tuple[PatternRule, Tree[Any], dict[str, str]]]:
+        """Find tree nodes matching compiled patterns.
+
+        :param tree: Syntax tree to match.
+        :returns: Iterator over rules, matched nodes and their captures.
+        """
+        subtrees = tree.iter_subtrees_topdown()  # type: ignore[no-untyped-call]
+        for subtree in subtrees:
+            table = self.tables.get(subtree.data)
+            if table is None:
+                continue
+            for pattern, rule in table.candidates(subtree):
+                if any(
+                    _get_child(subtree, path) not in values
+                    for path, values in pattern.constraints.items()
+                ):
+                    continue
+                captures = {
+                    name: _get_child(subtree, path) or ""
+                    for name, path in pattern.captures.items()
+                }
+                yield rule, subtree, captures
+
+    def check(self, path: Path, tree: Tree[Any]) -> list[ScriptError]:
+        """Check syntax tree for nodes matching compiled patterns.
+
+        :param path: Script file path.
+        :param tree: Script syntax tree.
+        :returns: List of errors found.
+        """
+        errors: list[ScriptError] = []
+        for rule, subtree, captures in self.match(tree):
+            if subtree.meta.empty:
+                continue
+            meta = subtree.meta
+            end_column = meta.column + 1
+            if meta.end_line == meta.line:
+                end_column = meta.end_column
+            help_message = rule.help_message
+            if help_message is not None:
+                help_message = Template(help_message).safe_substitute(captures)
+            errors.append(
+                ScriptError(
+                    error=Error(
+                        codename=rule.codename,
+                        message=Template(rule.message).safe_substitute(
+                            captures,
+                        ),
+                        help_message=help_message,
+                    ),
+                    path=path,
+                    line=meta.line,
+                    column=meta.column,
+                    end_column=end_column,
+                ),
+            )
+        return errors
+
+
+@lru_cache
+def compile_rules(
+    rules: tuple[PatternRule, ...],
+    tree_types: frozenset[str] | None = None,
+) -> PatternTable:
+    """Compile pattern rules once per process.
+
+    :param rules: Pattern rules to compile.
+    :param tree_types: Syntax tree node types of the grammar.
+    :returns: Compiled pattern table.
+    :raises ValueError: If any pattern is not valid.
+    """
+    return PatternTable(rules, tree_types)
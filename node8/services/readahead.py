@@ -0,0 +1,215 @@
+"""Provide read-ahead file reading to overlap disk reads with parsing.
+
+Upcoming files are opened and announced to the kernel with
+`posix_fadvise` while the current file is being checked, so checks do
+not wait on cold caches one file after another. Platforms without it
+read upcoming files on a small thread pool instead. Large files are
+memory mapped and every file is decoded once, straight from its bytes.
+"""
+
+import codecs
+import mmap
+import os
+from collections import deque
+from collections.abc import Generator, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
+from pathlib import Path
+from typing import BinaryIO, Final
+
+READ_WORKERS: Final[int] = 4
+READ_AHEAD_DEPTH: Final[int] = 16
+MMAP_THRESHOLD: Final[int] = 1024 * 1024
+
+ENCODING: Final[str] = "utf-8"
+CARRIAGE_RETURN: Final[str] = "\r"
+WINDOWS_NEWLINE: Final[str] = "\r\n"
+NEWLINE: Final[str] = "\n"
+
+ReadResult = str | OSError | UnicodeDecodeError
+
+
+def decode(data: bytes | mmap.mmap) -> str:
+    """Decode UTF-8 file contents the way text mode reading would.
+
+    Byte order mark is skipped without copying and newlines are only
+    translated when contents have any carriage return. Views of given
+    contents are released before returning or raising, so a memory map
+    can be closed even if decoding fails.
+
+    :param data: File contents.
+    :returns: Decoded contents with line feed newlines.
+    :raises UnicodeDecodeError: If contents are not valid UTF-8.
+    """
+    start = 0
+    if data[: len(codecs.BOM_UTF8)] == codecs.BOM_UTF8:
+        start = len(codecs.BOM_UTF8)
+    with memoryview(data) as view, view[start:] as body:
+        text = str(body, ENCODING)
+    if CARRIAGE_RETURN in text:
+        text = text.replace(WINDOWS_NEWLINE, NEWLINE).replace(
+            CARRIAGE_RETURN,
+            NEWLINE,
+        )
+    return text
+
+
+def read_text(path: Path) -> str:
+    """Read and decode UTF-8 file, memory mapping large files.
+
+    :param path: File path.
+    :returns: Decoded file contents.
+    :raises OSError: If file can not be read.
+    :raises UnicodeDecodeError: If file is not valid UTF-8.
+    """
+    with path.open(mode="rb") as file:
+        return _read_file(file)
+
+
+def _read_file(file: BinaryIO) -> str:
+    """Read and decode opened UTF-8 file, memory mapping large files.
+
+    :param file: Opened binary file.
+    :returns: Decoded file contents.
+    :raises OSError: If file can not be read.
+    :raises UnicodeDecodeError: If file is not valid UTF-8.
+    """
+    size = os.fstat(file.fileno()).st_size
+    if size < MMAP_THRESHOLD:
+        return decode(file.read())
+    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        return decode(mapped)
+
+
+def try_read_text(path: Path) -> ReadResult:
+    """Read file, returning read errors instead of raising them.
+
+    :param path: File path.
+    :returns: Decoded file contents or read error.
+    """
+    try:
+        return read_text(path)
+    except (OSError, UnicodeDecodeError) as error:
+        return error
+
+
+def read_ahead(
+    paths: Iterable[Path],
+    workers: int = READ_WORKERS,
+    depth: int = READ_AHEAD_DEPTH,
+) -> Generator[tuple[Path, ReadResult]]:
+    """Read files ahead of their use.
+
+    Files are yielded in order of given paths, at most `depth` files are
+    read ahead. Given paths are consumed lazily. Where `posix_fadvise`
+    is available, upcoming files are only prefetched by the kernel and
+    read by the caller, since reading threads would compete with checks
+    for the interpreter lock.
+
+    :param paths: Files to read.
+    :param workers: Amount of reading threads without `posix_fadvise`.
+    :param depth: Amount of files to read ahead.
+    :returns: Iterator over file paths and their contents or read errors.
+    """
+    if hasattr(os, "posix_fadvise"):
+        return _prefetch_ahead(paths, depth)
+    return _read_on_threads(paths, workers, depth)
+
+
+def _prefetch_ahead(
+    paths: Iterable[Path],
+    depth: int,
+) -> Generator[tuple[Path, ReadResult]]:
+    """Prefetch files with `posix_fadvise` ahead of reading them.
+
+    Closing the iterator closes files not read yet.
+
+    :param paths: Files to read.
+    :param depth: Amount of files to prefetch.
+    :returns: Iterator over file paths and their contents or read errors.
+    """
+    pending: deque[tuple[Path, int | OSError]] = deque()
+    try:
+        for path in paths:
+            pending.append((path, _prefetch(path)))
+            if len(pending) >= depth:
+                yield _read_prefetched(pending)
+        while pending:
+            yield _read_prefetched(pending)
+    finally:
+        for _, descriptor in pending:
+            if not isinstance(descriptor, OSError):
+                os.close(descriptor)
+
+
+def _prefetch(path: Path) -> int | OSError:
+    """Open file and ask the kernel to load it into page cache.
+
+    :param path: File path.
+    :returns: Opened file descriptor or open error.
+    """
+    try:
+        descriptor = os.open(path, os.O_RDONLY)
+    except OSError as error:
+        return error
+    with suppress(OSError):
+        os.posix_fadvise(descriptor, 0, 0, os.POSIX_FADV_WILLNEED)
+    return descriptor
+
+
+def _read_prefetched(
+    pending: deque[tuple[Path, int | OSError]],
+) -> tuple[Path, ReadResult]:
+    """Read the oldest prefetched file.
+
+    :param pending: Prefetched files in order of their paths.
+    :returns: File path and its contents or read error.
+    """
+    path, descriptor = pending.popleft()
+    if isinstance(descriptor, OSError):
+        return path, descriptor
+    try:
+        with os.fdopen(descriptor, mode="rb") as file:
+            return path, _read_file(file)
+    except (OSError, UnicodeDecodeError) as error:
+        return path, error
+
+
+def _read_on_threads(
+    paths: Iterable[Path],
+    workers: int,
+    depth: int,
+) -> Generator[tuple[Path, ReadResult]]:
+    """Read files ahead of their use on a thread pool.
+
+    Closing the iterator cancels reads not started yet.
+
+    :param paths: Files to read.
+    :param workers: Amount of reading threads.
+    :param depth: Amount of files to read ahead.
+    :returns: Iterator over file paths and their contents or read errors.
+    """
+    pending: deque[tuple[Path, Future[ReadResult]]] = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            for path in paths:
+                pending.append((path, executor.submit(try_read_text, path)))
+                if len(pending) >= depth:
+                    yield _pop_result(pending)
+            while pending:
+                yield _pop_result(pending)
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+
+def _pop_result(
+    pending: deque[tuple[Path, Future[ReadResult]]],
+) -> tuple[Path, ReadResult]:
+    """Wait for the oldest pending read.
+
+    :param pending: Pending reads in order of their paths.
+    :returns: File path and its contents or read error.
+    """
+    path, future = pending.popleft()
+    return path, future.result()
@@ -0,0 +1,245 @@
+"""Provide script-scene cross-reference index to validate node paths.
+
+Every scene is reduced to a set of its node paths, its unique nodes and
+instanced scenes, and scripts are mapped to scene nodes they are attached
+to using `ext_resource` script entries. Node path references of a script
+are then validated with hash lookups instead of launching the game.
+"""
+
+from collections.abc import Iterable, MutableMapping
+from contextlib import closing
+from pathlib import Path
+from typing import Final
+
+import godot_parser
+
+from node8.models.references import SceneReferences
+from node8.services.readahead import read_ahead
+from node8.services.symbols import (
+    RESOURCE_PREFIX,
+    SymbolIndex,
+    find_project_root,
+)
+
+ROOT_NODE_PATH: Final[str] = "."
+PARENT_NODE_PATH: Final[str] = ".."
+NODE_PATH_SEPARATOR: Final[str] = "/"
+UNIQUE_NODE_PREFIX: Final[str] = "%"
+UNIQUE_NAME_PROPERTY: Final[str] = "unique_name_in_owner"
+SCRIPT_RESOURCE_TYPE: Final[str] = "Script"
+
+
+def join_node_path(base: str, node_path: str) -> str | None:
+    """Join relative node path to base node path.
+
+    :param base: Node path relative to scene root, `.` for root.
+    :param node_path: Relative node path, may contain `..`.
+    :returns: Normalized node path relative to scene root, None if it
+        leaves the scene or is absolute.
+    """
+    if node_path.startswith(NODE_PATH_SEPARATOR):
+        return None
+    parts = [] if base == ROOT_NODE_PATH else base.split(NODE_PATH_SEPARATOR)
+    for part in node_path.split(NODE_PATH_SEPARATOR):
+        if part in {"", ROOT_NODE_PATH}:
+            continue
+        if part == PARENT_NODE_PATH:
+            if not parts:
+                return None
+            parts.pop()
+        else:
+            parts.append(part)
+    return NODE_PATH_SEPARATOR.join(parts) or ROOT_NODE_PATH
+
+
+def collect_references(scene: godot_parser.GDFile) -> SceneReferences:
+    """Collect node paths and script attachments of loaded scene.
+
+    :param scene: Loaded scene.
+    :returns: Scene references.
+    """
+    references = SceneReferences()
+    resources = {
+        resource.id: (resource.type, resource.path)
+        for resource in scene.get_ext_resources()
+    }
+    for node in scene.get_nodes():
+        node_path = ROOT_NODE_PATH
+        if node.parent is not None:
+            node_path = join_node_path(node.parent, node.name) or node.name
+        references.nodes.add(node_path)
+        if node.get(UNIQUE_NAME_PROPERTY):
+            references.unique_nodes[node.name] = node_path
+        if node.instance is not None and node.instance in resources:
+            references.instances[node_path] = resources[node.instance][1]
+        script = node.get("script")
+        if isinstance(script, godot_parser.ExtResource):
+            resource_type, resource_path = resources.get(script.id, ("", ""))
+            if resource_type == SCRIPT_RESOURCE_TYPE:
+                references.scripts.setdefault(resource_path, []).append(
+                    node_path,
+                )
+    return references
+
+
+class ReferenceIndex:
+    """Cross-reference index between scripts and scenes of a project.
+
+    Built once per run, scenes loaded by scene checks are added as they
+    are loaded and only the remaining scenes are loaded on refresh.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        symbols: SymbolIndex,
+        scenes: MutableMapping[str, SceneReferences] | None = None,
+    ) -> None:
+        """Initialize ReferenceIndex class.
+
+        :param root: Linted directory, resource paths are relative to
+            Godot project directory containing it.
+        :param symbols: Project symbol index with script node paths.
+        :param scenes: Mapping to keep scene references in, e.g. a record
+            store to keep them out of memory, a new dict if None.
+        """
+        self.root = find_project_root(root)
+        self.symbols = symbols
+        self.scenes: MutableMapping[str, SceneReferences] = (
+            {} if scenes is None else scenes
+        )
+        self._attachments: dict[str, list[tuple[str, str]]] | None = None
+
+    def key(self, path: Path) -> str:
+        """Get resource path of given file.
+
+        :param path: File path.
+        :returns: Resource path, e.g. `res://scenes/game.tscn`.
+        """
+        path = path.absolute()
+        if path.is_relative_to(self.root):
+            return RESOURCE_PREFIX + path.relative_to(self.root).as_posix()
+        return path.as_posix()
+
+    def add_scene(self, path: Path, scene: godot_parser.GDFile) -> None:
+        """Add loaded scene to index.
+
+        :param path: Scene file path.
+        :param scene: Loaded scene.
+        """
+        self.scenes[self.key(path)] = collect_references(scene)
+        self._attachments = None
+
+    def refresh(self, paths: Iterable[Path]) -> None:
+        """Load scenes not added to index yet.
+
+        Scenes that can not be loaded are skipped.
+
+        :param paths: All scenes of the project.
+        """
+        missing = (path for path in paths if self.key(path) not in self.scenes)
+        with closing(read_ahead(missing)) as scenes:
+            for path, contents in scenes:
+                if not isinstance(contents, str):
+                    continue
+                try:
+                    scene = godot_parser.parse(contents)
+                except Exception:  # noqa: BLE001, S112
+                    continue
+                self.add_scene(path, scene)
+
+    def attachments(self, script: Path) -> list[tuple[str, str]]:
+        """Get scene nodes given script is attached to.
+
+        :param script: Script file path.
+        :returns: Array of scene resource paths and node paths.
+        """
+        if self._attachments is None:
+            self._attachments = {}
+            for scene_key in sorted(self.scenes):
+                scripts = self.scenes[scene_key].scripts
+                for script_key, node_paths in scripts.items():
+                    self._attachments.setdefault(script_key, []).extend(
+                        (scene_key, node_path) for node_path in node_paths
+                    )
+        return self._attachments.get(self.key(script), [])
+
+    def resolve(
+        self,
+        scene_key: str,
+        base: str,
+        node_path: str,
+    ) -> bool | None:
+        """Check if node path refers to an existing scene node.
+
+        :param scene_key: Resource path of scene the script is used in.
+        :param base: Node path of the node the script is attached to.
+        :param node_path: Referenced node path, unique node paths are
+            prefixed with `%`.
+        :returns: True if node exists, False if it does not, None if it
+            can not be known, e.g. path leaves the scene.
+        """
+        scene = self.scenes.get(scene_key)
+        if scene is None:
+            return None
+        if node_path.startswith(UNIQUE_NODE_PREFIX):
+            name, _, node_path = node_path[1:].partition(NODE_PATH_SEPARATOR)
+            unique_path = self._find_unique(scene_key, name)
+            if unique_path is None:
+                return False
+            base = unique_path
+        target = join_node_path(base, node_path)
+        if target is None:
+            return None
+        return self._exists(scene_key, target, set())
+
+    def _find_unique(self, scene_key: str, name: str) -> str | None:
+        """Find node with unique name in scene or its base scenes.
+
+        :param scene_key: Resource path of scene.
+        :param name: Unique node name.
+        :returns: Node path relative to scene root, None if not found.
+        """
+        visited: set[str] = set()
+        scene = self.scenes.get(scene_key)
+        while scene is not None and scene_key not in visited:
+            visited.add(scene_key)
+            unique_path = scene.unique_nodes.get(name)
+            if unique_path is not None:
+                return unique_path
+            scene_key = scene.instances.get(ROOT_NODE_PATH, "")
+            scene = self.scenes.get(scene_key)
+        return None
+
+    def _exists(
+        self,
+        scene_key: str,
+        target: str,
+        visited: set[str],
+    ) -> bool | None:
+        """Check if node exists in scene or in scenes instanced by it.
+
+        :param scene_key: Resource path of scene.
+        :param target: Node path relative to scene root.
+        :param visited: Scenes already looked into.
+        :returns: True if node exists, False if it does not, None if it
+            can not be known.
+        """
+        scene = self.scenes.get(scene_key)
+        if scene is None or scene_key in visited:
+            return None
+        if target in scene.nodes:
+            return True
+        visited.add(scene_key)
+        parts = target.split(NODE_PATH_SEPARATOR)
+        for end in range(len(parts), 0, -1):
+            prefix = NODE_PATH_SEPARATOR.join(parts[:end])
+            instance = scene.instances.get(prefix)
+            if instance is not None:
+                rest = NODE_PATH_SEPARATOR.join(parts[end:]) or ROOT_NODE_PATH
+                return self._exists(instance, rest, visited)
+        # inherited scene, root node instances the base scene
+        base_scene = scene.instances.get(ROOT_NODE_PATH)
+        if base_scene is not None:
+            return self._exists(base_scene, target, visited)
+        return False
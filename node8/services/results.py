@@ -0,0 +1,161 @@
+"""Provide result file functions to store and merge lint errors."""
+
+from collections.abc import Iterable
+from pathlib import Path
+from typing import IO, Any
+
+from lark import Tree
+from pydantic import BaseModel, ValidationError
+
+from node8.models.errors import SceneError, ScriptError
+from node8.models.results import Results, SceneErrorRecord
+from node8.services.scene_table import SCENE_NODE_DATA
+from node8.services.scene_tree import SceneTree, get_subtree_path
+
+
+def to_scene_record(error: SceneError) -> SceneErrorRecord:
+    """Convert scene error to record without scene trees.
+
+    :param error: Scene error to convert.
+    :returns: Scene error record.
+    """
+    node_path = []
+    tree: Any = None
+    if isinstance(error.scene_tree, SceneTree) and isinstance(
+        error.error_tree,
+        SceneTree,
+    ):
+        tree = get_subtree_path(error.scene_tree, error.error_tree)
+    while isinstance(tree, SceneTree):
+        node_path.append(tree.node_meta)
+        tree = tree.children[0] if tree.children else None
+    return SceneErrorRecord(
+        error=error.error,
+        path=error.path,
+        node_path=node_path,
+    )
+
+
+def from_scene_record(record: SceneErrorRecord) -> SceneError:
+    """Convert scene error record back to scene error.
+
+    Scene tree of restored error only contains the path to errored node.
+
+    :param record: Scene error record to convert.
+    :returns: Scene error.
+    """
+    path_tree: SceneTree | None = None
+    error_tree: SceneTree | None = None
+    for meta in reversed(record.node_path):
+        children = [path_tree] if path_tree is not None else []
+        path_tree = SceneTree(SCENE_NODE_DATA, children, meta)
+        error_tree = error_tree or path_tree
+
+    empty_tree: Tree[Any] = Tree(SCENE_NODE_DATA, [])
+    return SceneError(
+        error=record.error,
+        path=record.path,
+        error_tree=error_tree or empty_tree,
+        scene_tree=path_tree or empty_tree,
+    )
+
+
+def _relative(path: Path, root: Path) -> Path:
+    """Get path relative to linted directory.
+
+    :param path: File path.
+    :param root: Linted directory.
+    :returns: Relative path, given path if it is not in linted directory.
+    """
+    try:
+        return path.relative_to(root)
+    except ValueError:
+        return path
+
+
+def dump_results(
+    path: Path,
+    script_errors: Iterable[ScriptError],
+    scene_errors: Iterable[SceneError],
+    root: Path,
+) -> None:
+    """Write lint errors to result file.
+
+    Errors are written one by one as they are iterated over, so they may
+    be read lazily from a spool. Paths are stored relative to linted
+    directory, so results of runs in different checkouts can be merged.
+
+    :param path: Result file path.
+    :param script_errors: Script errors to write.
+    :param scene_errors: Scene errors to write.
+    :param root: Linted directory.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open(mode="w", encoding="utf-8") as result_file:
+        result_file.write('{"script_errors":[')
+        _write_records(
+            result_file,
+            (
+                error.model_copy(
+                    update={"path": _relative(error.path, root)},
+                )
+                for error in script_errors
+            ),
+        )
+        result_file.write('],"scene_errors":[')
+        _write_records(
+            result_file,
+            (
+                to_scene_record(error).model_copy(
+                    update={"path": _relative(error.path, root)},
+                )
+                for error in scene_errors
+            ),
+        )
+        result_file.write("]}")
+
+
+def _write_records(result_file: IO[str], records: Iterable[BaseModel]) -> None:
+    """Write records as comma separated JSON objects.
+
+    :param result_file: Opened result file.
+    :param records: Records to write.
+    """
+    for index, record in enumerate(records):
+        if index:
+            result_file.write(",")
+        result_file.write(record.model_dump_json())
+
+
+def load_results(
+    paths: Iterable[Path],
+    root: Path,
+) -> tuple[list[ScriptError], list[SceneError]]:
+    """Read and combine lint errors of given result files.
+
+    :param paths: Result file paths.
+    :param root: Linted directory stored paths are resolved against.
+    :returns: Combined script errors and scene errors.
+    :raises OSError: If a result file can not be read.
+    :raises ValueError: If a result file is malformed.
+    """
+    script_errors: list[ScriptError] = []
+    scene_errors: list[SceneError] = []
+    for path in paths:
+        with path.open(mode="r", encoding="utf-8") as result_file:
+            try:
+                results = Results.model_validate_json(result_file.read())
+            except ValidationError as error:
+                message = f"invalid result file {path}: {error}"
+                raise ValueError(message) from error
+        script_errors.extend(
+            error.model_copy(update={"path": root / error.path})
+            for error in results.script_errors
+        )
+        scene_errors.extend(
+            from_scene_record(
+                record.model_copy(update={"path": root / record.path}),
+            )
+            for record in results.scene_errors
+        )
+    return script_errors, scene_errors
@@ -9,30 +9,58 @@ For example:
 Will be an error since using `get_node` is a bad practice.
 """
 
-from typing import Any, Final
+from collections.abc import Sequence
+from typing import Final
 
-from lark import Tree
+from lark import Token
 
 from node8.models.errors import Error, ScriptError
-from node8.services.visitors import Visitor
+from node8.models.patterns import PatternRule
+from node8.services.visitors import TokenVisitor
 
 GET_NODE_FOUND_CODENAME: Final[str] = "N001"
 GET_NODE_FOUND_MESSAGE: Final[str] = "`get_node` found"
 GET_NODE_FOUND_HELP: Final[str] = (
     "Replace with `@export` or unique names: `%Node2D`"
 )
+GET_NODE_FUNCTION: Final[str] = "get_node"
 
+DEPRECATED_CALL_CODENAME: Final[str] = "N002"
 
-class GetNodeFound(Visitor):
-    """N001 rule tree visitor."""
+OPEN_PAREN_TYPE: Final[str] = "LPAR"
+CLOSE_PAREN_TYPE: Final[str] = "RPAR"
+ATTRIBUTE_TYPE: Final[str] = "DOT"
+FUNCTION_TYPE: Final[str] = "FUNC"
+NOT_CALL_TYPES: Final[frozenset[str]] = frozenset(
+    (ATTRIBUTE_TYPE, FUNCTION_TYPE),
+)
+
+
+class GetNodeFound(TokenVisitor):
+    """N001 rule token visitor."""
+
+    codename = GET_NODE_FOUND_CODENAME
 
-    def standalone_call(self, tree: Tree[Any]) -> None:
-        """Walk tree and detect `get_node` calls.
+    def name(self, tokens: Sequence[Token], index: int) -> None:
+        """Detect standalone `get_node` calls.
 
-        :parma tree: Tree to walk.
+        Attribute calls like `node.get_node()` and declarations like
+        `func get_node()` are skipped.
+
+        :param tokens: Token stream being visited.
+        :param index: Index of name token in token stream.
         """
-        if tree.children[0] != "get_node":
+        token = tokens[index]
+        if token != GET_NODE_FUNCTION:
+            return
+        if index > 0 and tokens[index - 1].type in NOT_CALL_TYPES:
+            return
+        if index + 1 >= len(tokens):
+            return
+        if tokens[index + 1].type != OPEN_PAREN_TYPE:
             return
+
+        end_column = _get_call_end_column(tokens, index + 1)
         self.errors.append(
             ScriptError(
                 error=Error(
@@ -41,8 +69,46 @@ class GetNodeFound(Visitor):
                     help_message=GET_NODE_FOUND_HELP,
                 ),
                 path=self.path,
-                line=tree.meta.line,
-                column=tree.meta.column,
-                end_column=tree.meta.end_column,
+                line=token.line or 0,
+                column=token.column or 0,
+                end_column=end_column or token.end_column or 0,
             ),
         )
+
+
+def _get_call_end_column(tokens: Sequence[Token], start: int) -> int | None:
+    """Find end column of a call arguments list on the call line.
+
+    :param tokens: Token stream being visited.
+    :param start: Index of opening parenthesis token.
+    :returns: End column of closing parenthesis, None if not on same line.
+    """
+    line = tokens[start].line
+    depth = 0
+    for token in tokens[start:]:
+        if token.type == OPEN_PAREN_TYPE:
+            depth += 1
+        elif token.type == CLOSE_PAREN_TYPE:
+            depth -= 1
+            if depth == 0:
+                return token.end_column if token.line == line else None
+    return None
+
+
+PATTERN_RULES: Final[tuple[PatternRule, ...]] = (
+    PatternRule(
+        pattern="standalone_call(0=yield)",
+        message="deprecated `yield` found",
+        codename=DEPRECATED_CALL_CODENAME,
+        help_message="Replace with `await`",
+    ),
+    PatternRule(
+        pattern=(
+            "getattr_call(0.0=OS, 0.2=get_ticks_msec|get_ticks_usec, "
+            "0.2=$method)"
+        ),
+        message="deprecated `OS.$method` found",
+        codename=DEPRECATED_CALL_CODENAME,
+        help_message="Replace with `Time.$method`",
+    ),
+)
@@ -2,8 +2,9 @@
 from typing import Final
 
 from node8.models.errors import Error, SceneError
+from node8.services.scene_table import SCENE_NODE_DATA
 from node8.services.scene_tree import SceneTree
-from node8.services.visitors import SceneVisitor
+from node8.services.visitors import SceneTableRule
 
 SCENE_TOO_NESTED_CODENAME: Final[str] = "SC001"
 SCENE_TOO_NESTED_MESSAGE: Final[str] = "is too nested"
@@ -11,22 +12,30 @@ SCENE_TOO_NESTED_HELP: Final[str] = "Move nested nodes into a separate scene"
 
 
 
-class SceneTooNested(SceneVisitor):
-    """"""
+class SceneTooNested(SceneTableRule):
+    """SC001 rule scene table query."""
 
-    def scene_node(self, tree: SceneTree) -> None:
-        """"""
-        if tree.node_meta.depth > self.config.max_scene_indent:
+    codename = SCENE_TOO_NESTED_CODENAME
+
+    def validate_table(self) -> list[SceneError]:
+        """Find nodes nested deeper than allowed in all scenes.
+
+        :returns: List of errors found.
+        """
+        max_depth = self.config.max_scene_indent
+        for row in self.table.rows_deeper_than(max_depth, self.rows):
+            meta = self.table.get_meta(row)
             self.errors.append(SceneError(
                 error=Error(
                     codename=SCENE_TOO_NESTED_CODENAME,
                     message=(
-                        f"`{tree.node_meta.name}` {SCENE_TOO_NESTED_MESSAGE}"
-                        f" ({tree.node_meta.depth} > {self.config.max_scene_indent})"
+                        f"`{meta.name}` {SCENE_TOO_NESTED_MESSAGE}"
+                        f" ({meta.depth} > {max_depth})"
                     ),
                     help_message=SCENE_TOO_NESTED_HELP,
                 ),
-                path=self.path,
-                error_tree=tree,
-                scene_tree=self.scene_tree,
+                path=self.table.paths[self.table.scene_ids[row]],
+                error_tree=SceneTree(SCENE_NODE_DATA, [], meta),
+                scene_tree=self.table.get_path_tree(row),
             ))
+        return self.errors
@@ -0,0 +1,173 @@
+"""Linting failures.
+
+Files that could not be read, parsed or checked within their isolation
+limits will be errored instead of aborting the whole run.
+For example:
+>>> func foo(:
+>>>     pass
+
+Will be an error since the script can not be parsed.
+"""
+
+from pathlib import Path
+from typing import Any, Final
+
+from lark import Tree
+from lark.exceptions import LarkError, UnexpectedInput
+
+from node8.core.errors import (
+    IsolationError,
+    MemoryCapExceededError,
+    TimeBudgetExceededError,
+)
+from node8.models.errors import Error, SceneError, ScriptError
+
+READ_ERROR_CODENAME: Final[str] = "E902"
+READ_ERROR_MESSAGE: Final[str] = "file can not be read"
+
+TIME_BUDGET_CODENAME: Final[str] = "E903"
+TIME_BUDGET_MESSAGE: Final[str] = "time budget exceeded"
+TIME_BUDGET_HELP: Final[str] = (
+    "Split the file or raise `time_budget` in configuration"
+)
+
+MEMORY_CAP_CODENAME: Final[str] = "E904"
+MEMORY_CAP_MESSAGE: Final[str] = "memory cap exceeded"
+MEMORY_CAP_HELP: Final[str] = (
+    "Split the file or raise `memory_cap` in configuration"
+)
+
+CHECK_FAILED_CODENAME: Final[str] = "E905"
+CHECK_FAILED_MESSAGE: Final[str] = "file could not be checked"
+
+PARSE_ERROR_CODENAME: Final[str] = "E999"
+PARSE_ERROR_MESSAGE: Final[str] = "parse error"
+
+FIRST_LINE: Final[int] = 1
+FIRST_COLUMN: Final[int] = 1
+FAILURE_TREE_DATA: Final[str] = "failure"
+
+
+def _first_line(error: BaseException) -> str:
+    """Get first line of exception message.
+
+    :param error: Exception to describe.
+    :returns: First message line, exception name if message is empty.
+    """
+    lines = str(error).strip().splitlines()
+    return lines[0] if lines else type(error).__name__
+
+
+def read_error(path: Path, error: OSError | ValueError) -> ScriptError:
+    """Create E902 error for a script that could not be read.
+
+    :param path: Script file path.
+    :param error: Read exception.
+    :returns: Script error.
+    """
+    return ScriptError(
+        error=Error(
+            codename=READ_ERROR_CODENAME,
+            message=f"{READ_ERROR_MESSAGE}: {_first_line(error)}",
+        ),
+        path=path,
+        line=FIRST_LINE,
+        column=FIRST_COLUMN,
+        end_column=FIRST_COLUMN + 1,
+    )
+
+
+def parse_error(path: Path, error: LarkError) -> ScriptError:
+    """Create E999 error for a script that could not be parsed.
+
+    :param path: Script file path.
+    :param error: Lark parsing exception.
+    :returns: Script error located where parsing failed.
+    """
+    line = FIRST_LINE
+    column = FIRST_COLUMN
+    if isinstance(error, UnexpectedInput):
+        line = max(error.line, FIRST_LINE)
+        column = max(error.column, FIRST_COLUMN)
+    return ScriptError(
+        error=Error(
+            codename=PARSE_ERROR_CODENAME,
+            message=f"{PARSE_ERROR_MESSAGE}: {_first_line(error)}",
+        ),
+        path=path,
+        line=line,
+        column=column,
+        end_column=column + 1,
+    )
+
+
+def _isolation_error(error: IsolationError) -> Error:
+    """Create base error for an isolation failure.
+
+    :param error: Isolation exception.
+    :returns: Base lint error.
+    """
+    if isinstance(error, TimeBudgetExceededError):
+        return Error(
+            codename=TIME_BUDGET_CODENAME,
+            message=f"{TIME_BUDGET_MESSAGE}: {_first_line(error)}",
+            help_message=TIME_BUDGET_HELP,
+        )
+    if isinstance(error, MemoryCapExceededError):
+        return Error(
+            codename=MEMORY_CAP_CODENAME,
+            message=f"{MEMORY_CAP_MESSAGE}: {_first_line(error)}",
+            help_message=MEMORY_CAP_HELP,
+        )
+    return Error(
+        codename=CHECK_FAILED_CODENAME,
+        message=f"{CHECK_FAILED_MESSAGE}: {_first_line(error)}",
+    )
+
+
+def isolation_error(path: Path, error: IsolationError) -> ScriptError:
+    """Create error for a script that failed in isolation.
+
+    :param path: Script file path.
+    :param error: Isolation exception.
+    :returns: Script error.
+    """
+    return ScriptError(
+        error=_isolation_error(error),
+        path=path,
+        line=FIRST_LINE,
+        column=FIRST_COLUMN,
+        end_column=FIRST_COLUMN + 1,
+    )
+
+
+def check_error(path: Path, error: Exception) -> ScriptError:
+    """Create E905 error for a script that failed to be checked.
+
+    :param path: Script file path.
+    :param error: Exception raised while checking the script.
+    :returns: Script error.
+    """
+    return isolation_error(
+        path,
+        IsolationError(f"{type(error).__name__}: {_first_line(error)}"),
+    )
+
+
+def scene_parse_error(path: Path, error: Exception) -> SceneError:
+    """Create E999 error for a scene that could not be loaded.
+
+    :param path: Scene file path.
+    :param error: Scene loading exception.
+    :returns: Scene error without scene tree.
+    """
+    tree: Tree[Any] = Tree(FAILURE_TREE_DATA, [])
+    return SceneError(
+        error=Error(
+            codename=PARSE_ERROR_CODENAME,
+            message=f"{PARSE_ERROR_MESSAGE}: {_first_line(error)}",
+        ),
+        path=path,
+        error_tree=tree,
+        scene_tree=tree,
+    )
@@ -0,0 +1,231 @@
+"""GDScript naming rules.
+
+Names that clash across the project, refer to unknown types or do not
+follow Godot naming conventions will be errored.
+For example:
+>>> class_name player_controller
+>>> func MovePlayer() -> void:
+>>>     pass
+
+Will be an error since class names should be in PascalCase and function
+names in snake_case.
+"""
+
+import re
+from pathlib import Path
+from typing import Final
+
+from node8.models.errors import Error, ScriptError
+from node8.models.symbols import Symbol
+from node8.services.visitors import SymbolIndexRule
+
+DUPLICATE_CLASS_NAME_CODENAME: Final[str] = "NM001"
+DUPLICATE_CLASS_NAME_MESSAGE: Final[str] = "is also declared in"
+DUPLICATE_CLASS_NAME_HELP: Final[str] = "Rename one of the classes"
+
+UNKNOWN_TYPE_CODENAME: Final[str] = "NM002"
+UNKNOWN_TYPE_MESSAGE: Final[str] = "unknown type"
+UNKNOWN_TYPE_HELP: Final[str] = (
+    "Declare it with `class_name` or fix the reference"
+)
+
+CLASS_NAME_CASE_CODENAME: Final[str] = "NM003"
+CLASS_NAME_CASE_MESSAGE: Final[str] = "class name is not in PascalCase"
+
+FUNCTION_NAME_CASE_CODENAME: Final[str] = "NM004"
+FUNCTION_NAME_CASE_MESSAGE: Final[str] = "function name is not in snake_case"
+
+SIGNAL_NAME_CASE_CODENAME: Final[str] = "NM005"
+SIGNAL_NAME_CASE_MESSAGE: Final[str] = "signal name is not in snake_case"
+
+PASCAL_CASE_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"_?[A-Z][A-Za-z0-9]*",
+)
+SNAKE_CASE_PATTERN: Final[re.Pattern[str]] = re.compile(r"_*[a-z0-9_]*")
+
+
+def _symbol_error(
+    path: Path,
+    symbol: Symbol,
+    error: Error,
+    name: str | None = None,
+) -> ScriptError:
+    """Create script error located at given symbol.
+
+    :param path: Script file path.
+    :param symbol: Errored symbol.
+    :param error: Base lint error.
+    :param name: Unqualified symbol name, symbol name if None.
+    :returns: Script error.
+    """
+    name = name or symbol.name
+    return ScriptError(
+        error=error,
+        path=path,
+        line=symbol.line,
+        column=symbol.column,
+        end_column=symbol.column + len(name),
+    )
+
+
+class DuplicateClassName(SymbolIndexRule):
+    """NM001 rule symbol index query."""
+
+    codename = DUPLICATE_CLASS_NAME_CODENAME
+
+    def validate_index(self) -> list[ScriptError]:
+        """Find global class names declared by more than one script.
+
+        :returns: List of errors found.
+        """
+        for path, symbols in self.scripts():
+            if symbols.class_name is None:
+                continue
+            key = self.index.key(path)
+            others = [
+                other
+                for other in self.index.class_names[symbols.class_name.name]
+                if other != key
+            ]
+            if not others:
+                continue
+            self.errors.append(
+                _symbol_error(
+                    path,
+                    symbols.class_name,
+                    Error(
+                        codename=DUPLICATE_CLASS_NAME_CODENAME,
+                        message=(
+                            f"`{symbols.class_name.name}` "
+                            f"{DUPLICATE_CLASS_NAME_MESSAGE} "
+                            f"{', '.join(others)}"
+                        ),
+                        help_message=DUPLICATE_CLASS_NAME_HELP,
+                    ),
+                ),
+            )
+        return self.errors
+
+
+class UnknownType(SymbolIndexRule):
+    """NM002 rule symbol index query.
+
+    Engine classes are only known when `engine_api` is configured,
+    otherwise only references into project classes are checked.
+    """
+
+    codename = UNKNOWN_TYPE_CODENAME
+
+    def validate_index(self) -> list[ScriptError]:
+        """Find type references no script or engine class declares.
+
+        :returns: List of errors found.
+        """
+        for path, symbols in self.scripts():
+            for reference in symbols.type_references:
+                known = self.index.is_known_type(symbols, reference.name)
+                if known is not False:
+                    continue
+                self.errors.append(
+                    _symbol_error(
+                        path,
+                        reference,
+                        Error(
+                            codename=UNKNOWN_TYPE_CODENAME,
+                            message=(
+                                f"{UNKNOWN_TYPE_MESSAGE} `{reference.name}`"
+                            ),
+                            help_message=UNKNOWN_TYPE_HELP,
+                        ),
+                    ),
+                )
+        return self.errors
+
+
+class ClassNameCase(SymbolIndexRule):
+    """NM003 rule symbol index query."""
+
+    codename = CLASS_NAME_CASE_CODENAME
+
+    def validate_index(self) -> list[ScriptError]:
+        """Find global and inner class names not in PascalCase.
+
+        :returns: List of errors found.
+        """
+        for path, symbols in self.scripts():
+            names = [symbols.class_name] if symbols.class_name else []
+            names.extend(symbols.classes)
+            for symbol in names:
+                name = symbol.name.rpartition(".")[2]
+                if PASCAL_CASE_PATTERN.fullmatch(name):
+                    continue
+                self.errors.append(
+                    _symbol_error(
+                        path,
+                        symbol,
+                        Error(
+                            codename=CLASS_NAME_CASE_CODENAME,
+                            message=f"`{name}` {CLASS_NAME_CASE_MESSAGE}",
+                        ),
+                        name=name,
+                    ),
+                )
+        return self.errors
+
+
+class FunctionNameCase(SymbolIndexRule):
+    """NM004 rule symbol index query."""
+
+    codename = FUNCTION_NAME_CASE_CODENAME
+
+    def validate_index(self) -> list[ScriptError]:
+        """Find function names not in snake_case.
+
+        :returns: List of errors found.
+        """
+        for path, symbols in self.scripts():
+            for symbol in symbols.functions:
+                if SNAKE_CASE_PATTERN.fullmatch(symbol.name):
+                    continue
+                self.errors.append(
+                    _symbol_error(
+                        path,
+                        symbol,
+                        Error(
+                            codename=FUNCTION_NAME_CASE_CODENAME,
+                            message=(
+                                f"`{symbol.name}` {FUNCTION_NAME_CASE_MESSAGE}"
+                            ),
+                        ),
+                    ),
+                )
+        return self.errors
+
+
+class SignalNameCase(SymbolIndexRule):
+    """NM005 rule symbol index query."""
+
+    codename = SIGNAL_NAME_CASE_CODENAME
+
+    def validate_index(self) -> list[ScriptError]:
+        """Find signal names not in snake_case.
+
+        :returns: List of errors found.
+        """
+        for path, symbols in self.scripts():
+            for symbol in symbols.signals:
+                if SNAKE_CASE_PATTERN.fullmatch(symbol.name):
+                    continue
+                self.errors.append(
+                    _symbol_error(
+                        path,
+                        symbol,
+                        Error(
+                            codename=SIGNAL_NAME_CASE_CODENAME,
+                            message=(
+                                f"`{symbol.name}` {SIGNAL_NAME_CASE_MESSAGE}"
+                            ),
+                        ),
+                    ),
+                )
+        return self.errors
@@ -0,0 +1,72 @@
+"""GDScript node path rules.
+
+Node paths that do not exist in scenes the script is attached to will be
+errored.
+For example:
+>>> func _ready() -> void:
+>>>     $Sprite2D.hide()
+
+Will be an error if no scene using the script has a `Sprite2D` child.
+"""
+
+from typing import Final
+
+from node8.models.errors import Error, ScriptError
+from node8.services.visitors import SceneReferenceRule
+
+BROKEN_NODE_PATH_CODENAME: Final[str] = "NP001"
+BROKEN_NODE_PATH_MESSAGE: Final[str] = "node not found in"
+BROKEN_NODE_PATH_HELP: Final[str] = (
+    "Fix the node path or add the node to the scene"
+)
+
+
+class BrokenNodePath(SceneReferenceRule):
+    """NP001 rule cross-reference index query."""
+
+    codename = BROKEN_NODE_PATH_CODENAME
+
+    def validate_references(self) -> list[ScriptError]:
+        """Find node paths missing in scenes using the script.
+
+        Scripts not attached to any scene are skipped.
+
+        :returns: List of errors found.
+        """
+        for path in self.paths:
+            symbols = self.references.symbols.get(path)
+            attachments = self.references.attachments(path)
+            if symbols is None or not attachments:
+                continue
+            for node_path in symbols.node_paths:
+                missing = sorted(
+                    {
+                        scene_key
+                        for scene_key, base in attachments
+                        if self.references.resolve(
+                            scene_key,
+                            base,
+                            node_path.name,
+                        )
+                        is False
+                    },
+                )
+                if not missing:
+                    continue
+                self.errors.append(
+                    ScriptError(
+                        error=Error(
+                            codename=BROKEN_NODE_PATH_CODENAME,
+                            message=(
+                                f"`{node_path.name}` {BROKEN_NODE_PATH_MESSAGE}"
+                                f" {', '.join(missing)}"
+                            ),
+                            help_message=BROKEN_NODE_PATH_HELP,
+                        ),
+                        path=path,
+                        line=node_path.line,
+                        column=node_path.column,
+                        end_column=node_path.end_column,
+                    ),
+                )
+        return self.errors
@@ -8,8 +8,9 @@ For example:
 Will be an error since it misses documentation comments.
 """
 
+import io
 from pathlib import Path
-from typing import Any, Final
+from typing import Any, ClassVar, Final
 
 from lark import Token, Tree
 
@@ -29,29 +30,36 @@ FUNCTION_MISSING_DOCS_MESSAGE: Final[str] = (
 class LineTooLong:
     """E001 rule file parser."""
 
+    codename: ClassVar[str] = LINE_TOO_LONG_CODENAME
+
     def __init__(
         self,
         path: Path,
         config: Config | None = None,
+        contents: str | None = None,
     ) -> None:
         """Initialize LineTooLong class.
 
         :param path: Script file path.
         :param config: Linter configuration.
+        :param contents: Script contents, read from path if None.
         """
         config = config or Config()
 
         self.config = Config()
         self.errors: list[ScriptError] = []
         self.path = path
+        self.contents = contents
 
     def validate_lines(self) -> list[ScriptError]:
         """Check given path for line too long errors.
 
         :returns: List of errors found.
         """
-        with self.path.open(mode="r", encoding="utf-8") as script:
-            lines: list[str] = script.readlines()
+        if self.contents is None:
+            with self.path.open(mode="r", encoding="utf-8") as script:
+                self.contents = script.read()
+        lines: list[str] = io.StringIO(self.contents).readlines()
         for index, line in enumerate(map(str.rstrip, lines), start=1):
             if len(line) > self.config.line_length:
                 self.errors.append(
@@ -77,16 +85,18 @@ class LineTooLong:
         cls,
         path: Path,
         config: Config | None = None,
+        contents: str | None = None,
     ) -> list[ScriptError]:
         """Check given file for long lines without initializing class.
 
         :param path: Script file path.
         :param config: Linter configuration.
+        :param contents: Script contents, read from path if None.
         :returns: List of errors found.
         """
         config = config or Config()
 
-        checker = cls(path, config)
+        checker = cls(path, config, contents=contents)
 
         return checker.validate_lines()
 
@@ -94,6 +104,8 @@ class LineTooLong:
 class FunctionMissingDocstring(Visitor):
     """D001 rule tree visitor."""
 
+    codename = FUNCTION_MISSING_DOCS_CODENAME
+
     @classmethod
     def check(
         cls,
@@ -0,0 +1,132 @@
+"""Provide run history store to track linting performance over time.
+
+Metrics of every recorded run are appended to a JSON lines file in cache
+directory. Runs whose throughput dropped below a rolling median of
+previous runs are flagged as regressions.
+"""
+
+import statistics
+import time
+from collections import Counter
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Final
+
+from pydantic import ValidationError
+
+from node8.core.config import Config
+from node8.models.errors import SceneError, ScriptError
+from node8.models.runs import RunRecord
+from node8.services.metrics import get_peak_memory, rule_durations
+from node8.services.schedule import History
+
+RUNS_FILENAME: Final[str] = "runs.jsonl"
+
+
+def get_runs_path(root: Path, config: Config | None = None) -> Path:
+    """Get run history file of linted directory.
+
+    :param root: Linted directory.
+    :param config: Linter configuration.
+    :returns: Run history file path.
+    """
+    config = config or Config()
+    return root / config.cache_dir / RUNS_FILENAME
+
+
+def create_run(
+    started: float,
+    history: History,
+    errors: tuple[Iterable[ScriptError], Iterable[SceneError]],
+) -> RunRecord:
+    """Collect metrics of a finished run.
+
+    :param started: Run start as Unix timestamp.
+    :param history: Run history with recorded files and phases.
+    :param errors: Script errors and scene errors found.
+    :returns: Run record.
+    """
+    duration = time.time() - started
+    codenames: Counter[str] = Counter()
+    for found in errors:
+        codenames.update(error.error.codename for error in found)
+    return RunRecord(
+        started=started,
+        duration=duration,
+        phases={
+            phase: actual for phase, (_, actual) in history.makespans.items()
+        },
+        rules=dict(sorted(rule_durations.items())),
+        files=history.recorded,
+        files_per_second=history.recorded / duration if duration > 0 else 0.0,
+        peak_memory=get_peak_memory(),
+        errors=codenames.total(),
+        codenames=dict(sorted(codenames.items())),
+    )
+
+
+def append_run(path: Path, run: RunRecord) -> None:
+    """Append run record to run history file.
+
+    Run history that can not be written is skipped.
+
+    :param path: Run history file path.
+    :param run: Run record to append.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open(mode="a", encoding="utf-8") as runs:
+            runs.write(f"{run.model_dump_json()}\n")
+    except OSError:
+        return
+
+
+def load_runs(path: Path) -> list[RunRecord]:
+    """Read run records from run history file.
+
+    Lines that can not be parsed are skipped.
+
+    :param path: Run history file path.
+    :returns: Array of run records, oldest first.
+    """
+    records: list[RunRecord] = []
+    try:
+        with path.open(mode="r", encoding="utf-8") as runs:
+            for line in runs:
+                try:
+                    records.append(RunRecord.model_validate_json(line))
+                except ValidationError:
+                    continue
+    except OSError:
+        return []
+    return records
+
+
+def find_regressions(
+    runs: list[RunRecord],
+    window: int,
+    threshold: float,
+) -> list[float | None]:
+    """Compare throughput of every run to previous runs.
+
+    :param runs: Run records, oldest first.
+    :param window: Amount of previous runs baseline is a median of.
+    :param threshold: Relative throughput drop to flag, e.g. `0.2`.
+    :returns: Array of throughput drops of flagged runs, None for runs
+        without regression or without previous runs.
+    """
+    drops: list[float | None] = []
+    for index, run in enumerate(runs):
+        previous = [
+            other.files_per_second
+            for other in runs[max(index - window, 0) : index]
+            if other.files_per_second > 0
+        ]
+        drop: float | None = None
+        if previous:
+            baseline = statistics.median(previous)
+            relative = 1 - run.files_per_second / baseline
+            if relative > threshold:
+                drop = relative
+        drops.append(drop)
+    return drops
@@ -0,0 +1,214 @@
+"""Provide columnar scene node table for project-wide scene queries.
+
+Every node of every scene in a run is stored as one row of contiguous
+arrays instead of a tree of objects, so whole-project queries only walk
+flat integer columns.
+"""
+
+from array import array
+from collections import Counter
+from collections.abc import Iterable
+from itertools import pairwise
+from pathlib import Path
+from typing import Final
+
+import godot_parser
+
+from node8.services.scene_tree import SceneMeta, SceneTree
+
+NO_PARENT: Final[int] = -1
+SCENE_NODE_DATA: Final[str] = "scene_node"
+
+
+class SceneTable:
+    """Columnar table of scene nodes.
+
+    Rows of a scene are contiguous and stored in depth-first order, so
+    parent row always precedes its children rows.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty SceneTable."""
+        self.paths: list[Path] = []
+        self.scene_offsets: array[int] = array("L", [0])
+
+        self.scene_ids: array[int] = array("L")
+        self.parents: array[int] = array("l")
+        self.depths: array[int] = array("L")
+        self.type_ids: array[int] = array("L")
+        self.name_ids: array[int] = array("L")
+
+        self.strings: list[str] = []
+        self._string_ids: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Get amount of rows in table.
+
+        :returns: Amount of nodes of all scenes.
+        """
+        return len(self.scene_ids)
+
+    @property
+    def scene_count(self) -> int:
+        """Get amount of scenes in table.
+
+        :returns: Amount of scenes.
+        """
+        return len(self.paths)
+
+    def _intern(self, string: str) -> int:
+        """Get interned string id, interning string if needed.
+
+        :param string: String to intern.
+        :returns: Interned string id.
+        """
+        string_id = self._string_ids.get(string)
+        if string_id is None:
+            string_id = len(self.strings)
+            self._string_ids[string] = string_id
+            self.strings.append(string)
+        return string_id
+
+    def add_scene(self, path: Path, root: godot_parser.Node | None) -> int:
+        """Append scene nodes to table.
+
+        :param path: Scene file path.
+        :param root: Scene root node, None if scene has no nodes.
+        :returns: Id of added scene.
+        """
+        scene_id = len(self.paths)
+        self.paths.append(path)
+
+        stack: list[tuple[godot_parser.Node, int, int]] = []
+        if root is not None:
+            stack.append((root, NO_PARENT, 0))
+        while stack:
+            node, parent, depth = stack.pop()
+            row = len(self.scene_ids)
+            self.scene_ids.append(scene_id)
+            self.parents.append(parent)
+            self.depths.append(depth)
+            self.type_ids.append(self._intern(node.type or ""))
+            self.name_ids.append(self._intern(node.name))
+            stack.extend(
+                (child, row, depth + 1)
+                for child in reversed(node.get_children())
+            )
+
+        self.scene_offsets.append(len(self.scene_ids))
+        return scene_id
+
+    def add_scene_path(self, path: Path) -> int:
+        """Load scene file and append its nodes to table.
+
+        :param path: Scene file path.
+        :returns: Id of added scene.
+        """
+        scene = godot_parser.load(str(path))
+        with scene.use_tree() as tree:
+            return self.add_scene(path, tree.root)
+
+    @classmethod
+    def from_scene_paths(cls, paths: Iterable[Path]) -> "SceneTable":
+        """Build table from given scene files.
+
+        :param paths: Scene file paths.
+        :returns: SceneTable instance.
+        """
+        table = cls()
+        for path in paths:
+            table.add_scene_path(path)
+        return table
+
+    def scene_rows(self, scene_id: int) -> range:
+        """Get row range of given scene.
+
+        :param scene_id: Scene id.
+        :returns: Range of scene rows.
+        """
+        return range(
+            self.scene_offsets[scene_id],
+            self.scene_offsets[scene_id + 1],
+        )
+
+    def node_counts(self) -> list[int]:
+        """Get amount of nodes of every scene.
+
+        :returns: Array of node counts indexed by scene id.
+        """
+        return [end - start for start, end in pairwise(self.scene_offsets)]
+
+    def max_depths(self) -> list[int]:
+        """Get maximal node depth of every scene.
+
+        Scenes without nodes have depth of zero.
+
+        :returns: Array of maximal depths indexed by scene id.
+        """
+        depths = self.depths
+        return [
+            max(depths[start:end], default=0)
+            for start, end in pairwise(self.scene_offsets)
+        ]
+
+    def type_histogram(self, scene_id: int | None = None) -> Counter[str]:
+        """Count nodes of every node type.
+
+        :param scene_id: Scene to count types of, all scenes if None.
+        :returns: Counter of node types.
+        """
+        type_ids = self.type_ids
+        if scene_id is not None:
+            rows = self.scene_rows(scene_id)
+            type_ids = type_ids[rows.start : rows.stop]
+        return Counter(
+            {
+                self.strings[type_id]: count
+                for type_id, count in Counter(type_ids).items()
+            },
+        )
+
+    def rows_deeper_than(
+        self,
+        depth: int,
+        rows: range | None = None,
+    ) -> list[int]:
+        """Find rows of nodes nested deeper than given depth.
+
+        :param depth: Maximal allowed depth.
+        :param rows: Rows to search, all rows if None.
+        :returns: Array of row indices.
+        """
+        if rows is None:
+            rows = range(len(self))
+        depths = self.depths[rows.start : rows.stop]
+        return [
+            row
+            for row, node_depth in enumerate(depths, start=rows.start)
+            if node_depth > depth
+        ]
+
+    def get_meta(self, row: int) -> SceneMeta:
+        """Get scene node metadata of given row.
+
+        :param row: Row index.
+        :returns: Scene node metadata.
+        """
+        return SceneMeta(
+            name=self.strings[self.name_ids[row]],
+            node_type=self.strings[self.type_ids[row]],
+            depth=self.depths[row],
+        )
+
+    def get_path_tree(self, row: int) -> SceneTree:
+        """Build scene tree path from scene root to given row.
+
+        :param row: Row index.
+        :returns: Scene tree with single child on every level.
+        """
+        tree = SceneTree(SCENE_NODE_DATA, [], self.get_meta(row))
+        parent = self.parents[row]
+        while parent != NO_PARENT:
+            tree = SceneTree(SCENE_NODE_DATA, [tree], self.get_meta(parent))
+            parent = self.parents[parent]
+        return tree
@@ -1,52 +1,278 @@
-"""Provide Godot scene linting functions to check for rule violations."""
+"""Provide Godot scene linting functions to check for rule violations.
 
+Ignored codenames of a scene are resolved from config ignores, per-path
+`scene_ignores` globs and `noqa` metadata before the scene is parsed, and
+scenes no scene rule applies to are never loaded.
+"""
+
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import closing
+from fnmatch import fnmatch
 from pathlib import Path
+from typing import Final
+
+import godot_parser
 
 from node8.core.config import Config
 from node8.models.errors import SceneError
+from node8.models.results import SceneErrorRecord
+from node8.services.baseline import BaselineFilter
+from node8.services.metrics import timed
+from node8.services.noqa import get_ignores_scene
+from node8.services.readahead import ReadResult, read_ahead
+from node8.services.references import ReferenceIndex
+from node8.services.results import to_scene_record
+from node8.services.rules import failures
 from node8.services.rules.complexity import SceneTooNested
-from node8.services.scene_tree import SceneTree
+from node8.services.scene_table import SceneTable
+from node8.services.schedule import History, predict_makespan
+from node8.services.spool import Spool
+from node8.services.visitors import SceneTableRule
 
+SCENE_RULES: Final[tuple[type[SceneTableRule], ...]] = (SceneTooNested,)
 
-def _check_scene(
-    path: Path,
-    config: Config | None = None,
+SCENES_PHASE: Final[str] = "scenes"
+
+
+def _get_ignores(path: Path, root: Path, config: Config) -> set[str]:
+    """Get codenames ignored in scene by config and per-path globs.
+
+    :param path: Scene file path.
+    :param root: Linted directory globs are relative to.
+    :param config: Linter configuration.
+    :returns: Set of ignored codenames.
+    """
+    ignores = set(config.ignores)
+    relative = path.as_posix()
+    if path.is_relative_to(root):
+        relative = path.relative_to(root).as_posix()
+    for pattern, codenames in config.scene_ignores.items():
+        if fnmatch(relative, pattern):
+            ignores.update(codenames)
+    return ignores
+
+
+def _is_checked(ignores: set[str]) -> bool:
+    """Check if any scene rule applies despite given ignores.
+
+    :param ignores: Codenames ignored in a scene.
+    :returns: True if any scene rule is not ignored, False otherwise.
+    """
+    return any(rule.codename not in ignores for rule in SCENE_RULES)
+
+
+def _checked_scenes(
+    root: Path,
+    paths: Iterable[Path],
+    config: Config,
+    ignores: dict[Path, set[str]],
+) -> Iterator[Path]:
+    """Filter out scenes all scene rules are ignored in.
+
+    :param root: Linted directory.
+    :param paths: Scene file paths.
+    :param config: Linter configuration.
+    :param ignores: Ignored codenames by scene, filled for checked scenes.
+    :returns: Iterator over checked scene file paths.
+    """
+    for path in paths:
+        scene_ignores = _get_ignores(path, root, config)
+        if _is_checked(scene_ignores):
+            ignores[path] = scene_ignores
+            yield path
+
+
+def _check_table(
+    table: SceneTable,
+    config: Config,
+    ignores: dict[Path, set[str]],
+    scene_id: int | None = None,
+    baseline: BaselineFilter | None = None,
 ) -> list[SceneError]:
-    """Check given scene and return errors.
+    """Check scene table and return errors.
 
-    :param path: Path to scene.
+    :param table: Scene node table.
     :param config: Linter configuration.
+    :param ignores: Ignored codenames by scene.
+    :param scene_id: Scene to check, all scenes if None.
+    :param baseline: Filter of accepted errors, not returned.
     :returns: Array of scene errors.
     """
-    config = config or Config()
-
     errors: list[SceneError] = []
+    for rule in SCENE_RULES:
+        if rule.codename in config.ignores:
+            continue
+        with timed(rule.codename):
+            errors.extend(rule.check(table, config=config, scene_id=scene_id))
+    errors = [
+        error
+        for error in errors
+        if error.error.codename not in ignores.get(error.path, ())
+    ]
+    if baseline is not None:
+        errors = baseline.filter_scene_errors(errors)
+    return errors
 
-    tree: SceneTree | None = SceneTree.from_scene_path(path)
-    if tree is None:
-        return errors
 
-    errors.extend(SceneTooNested.check(path, tree, config=config))
+def _parse_error(
+    path: Path,
+    error: Exception,
+    ignores: set[str],
+    baseline: BaselineFilter | None = None,
+) -> list[SceneError]:
+    """Create errors for a scene that could not be loaded.
 
+    :param path: Scene file path.
+    :param error: Scene loading exception.
+    :param ignores: Codenames ignored in scene.
+    :param baseline: Filter of accepted errors, not returned.
+    :returns: Array of scene errors, empty if error is ignored.
+    """
+    if failures.PARSE_ERROR_CODENAME in ignores:
+        return []
+    errors = [failures.scene_parse_error(path, error)]
+    if baseline is not None:
+        errors = baseline.filter_scene_errors(errors)
     return errors
 
 
+def _load_scene(
+    path: Path,
+    contents: ReadResult,
+    table: SceneTable,
+    ignores: set[str],
+    references: ReferenceIndex | None = None,
+) -> int | None:
+    """Load scene file into scene table and cross-reference index.
+
+    Scene `noqa` metadata is added to ignored codenames before the scene
+    is parsed, scenes it silences all scene rules in are not loaded.
+
+    :param path: Scene file path.
+    :param contents: Scene file contents or read error.
+    :param table: Scene node table to append scene nodes to.
+    :param ignores: Codenames ignored in scene, updated with metadata.
+    :param references: Cross-reference index to add scene to.
+    :returns: Id of added scene, None if scene was not loaded.
+    :raises OSError: If scene file could not be read.
+    :raises UnicodeDecodeError: If scene file is not valid UTF-8.
+    """
+    if not isinstance(contents, str):
+        raise contents
+    noqa = get_ignores_scene(contents)
+    if noqa is not None:
+        ignores.update(noqa.ignores)
+        if noqa.ignore_all:
+            ignores.update(rule.codename for rule in SCENE_RULES)
+            ignores.add(failures.PARSE_ERROR_CODENAME)
+    if not _is_checked(ignores):
+        return None
+    scene = godot_parser.parse(contents)
+    with scene.use_tree() as tree:
+        scene_id = table.add_scene(path, tree.root)
+    if references is not None:
+        references.add_scene(path, scene)
+    return scene_id
+
+
 def check(
     path: Path,
     config: Config | None = None,
+    history: History | None = None,
+    paths: Iterable[Path] | None = None,
+    max_errors: int | None = None,
+    references: ReferenceIndex | None = None,
+    baseline: BaselineFilter | None = None,
+    spool: Spool[SceneErrorRecord] | None = None,
 ) -> list[SceneError]:
     """Lint given paths and return errors.
 
-    Will only check `.tscn` files.
+    Will only check `.tscn` files. Scenes are loaded longest first
+    according to given history and read ahead while previous ones are
+    loaded. Scenes that can not be loaded are reported as errors. When
+    maximal amount of errors is given, scenes are discovered lazily and
+    checked one by one until the amount is reached. Scenes every scene
+    rule is ignored in are skipped before they are read. When spool is given
+    without maximal amount of errors, every scene is checked in a table
+    of its own and its errors are moved to the spool as records, so no
+    scene nodes are kept once the scene is checked.
 
     :param path: Directory to check.
     :param config: Linter configuration.
-    :returns: Array of scene errors.
+    :param history: Durations of previous runs, updated with this run.
+    :param paths: Scenes to check, all scenes in directory if None.
+    :param max_errors: Amount of errors to stop checking at, None for all.
+    :param references: Cross-reference index to add loaded scenes to.
+    :param baseline: Filter of accepted errors, not counted or returned.
+    :param spool: Spool to move scene error records to.
+    :returns: Array of scene errors not moved to spool.
     """
     config = config or Config()
+    history = history or History(path)
+    if paths is None:
+        paths = path.rglob("*.tscn")
+    ignores: dict[Path, set[str]] = {}
+    paths = _checked_scenes(path, paths, config, ignores)
 
+    predicted = 0.0
+    if max_errors is None:
+        scheduled = history.order(paths)
+        paths = [scene_path for scene_path, _ in scheduled]
+        predicted = predict_makespan(cost for _, cost in scheduled)
+    start = time.perf_counter()
+
+    spool = spool if max_errors is None else None
     errors: list[SceneError] = []
-    for scene_path in path.rglob("*.tscn"):
-        errors.extend(_check_scene(scene_path, config=config))
+    table = SceneTable()
+    with closing(read_ahead(paths)) as contents:
+        for scene_path, scene_contents in contents:
+            scene_start = time.perf_counter()
+            try:
+                scene_id = _load_scene(
+                    scene_path,
+                    scene_contents,
+                    table,
+                    ignores[scene_path],
+                    references,
+                )
+            except Exception as error:  # noqa: BLE001
+                errors.extend(
+                    _parse_error(
+                        scene_path,
+                        error,
+                        ignores[scene_path],
+                        baseline=baseline,
+                    ),
+                )
+            else:
+                if scene_id is not None and (
+                    max_errors is not None or spool is not None
+                ):
+                    errors.extend(
+                        _check_table(
+                            table,
+                            config,
+                            ignores,
+                            scene_id,
+                            baseline=baseline,
+                        ),
+                    )
+            history.record(scene_path, time.perf_counter() - scene_start)
+            if max_errors is not None and len(errors) >= max_errors:
+                del errors[max_errors:]
+                break
+            if spool is not None:
+                spool.extend(map(to_scene_record, errors))
+                errors.clear()
+                table = SceneTable()
+
+    if max_errors is None and spool is None:
+        errors.extend(_check_table(table, config, ignores, baseline=baseline))
 
+    history.record_makespan(
+        SCENES_PHASE,
+        predicted,
+        time.perf_counter() - start,
+    )
     return errors
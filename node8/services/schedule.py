@@ -0,0 +1,176 @@
+"""Provide history-aware scheduling of per-file linting work.
+
+Files are ordered longest first using durations of previous runs, falling
+back to file size, so the biggest files never end up last in a run.
+"""
+
+import heapq
+import json
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Final
+
+from node8.core.config import Config
+
+HISTORY_FILENAME: Final[str] = "durations.json"
+DEFAULT_BYTES_PER_SECOND: Final[float] = 200_000.0
+
+
+class History:
+    """Per-file durations of previous linting runs.
+
+    Durations are keyed by file path relative to linted directory.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        durations: dict[str, float] | None = None,
+        history_path: Path | None = None,
+    ) -> None:
+        """Initialize History class.
+
+        :param root: Linted directory.
+        :param durations: Known file durations in seconds.
+        :param history_path: File to save durations to, None to not save.
+        """
+        self.root = root
+        self.durations: dict[str, float] = durations or {}
+        self.history_path = history_path
+        self.makespans: dict[str, tuple[float, float]] = {}
+        self.recorded = 0
+
+    @classmethod
+    def load(cls, root: Path, config: Config | None = None) -> "History":
+        """Load durations of previous runs from cache directory.
+
+        Unreadable history is treated as no history.
+
+        :param root: Linted directory.
+        :param config: Linter configuration.
+        :returns: History instance.
+        """
+        config = config or Config()
+        history_path = root / config.cache_dir / HISTORY_FILENAME
+        durations: dict[str, float] = {}
+        try:
+            with history_path.open(mode="r", encoding="utf-8") as history:
+                durations = {
+                    str(key): float(value)
+                    for key, value in json.load(history).items()
+                }
+        except (OSError, ValueError, AttributeError):
+            durations = {}
+        return cls(root, durations, history_path=history_path)
+
+    def save(self) -> None:
+        """Save durations to cache directory."""
+        if self.history_path is None:
+            return
+        try:
+            self.history_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.history_path.open(mode="w", encoding="utf-8") as history:
+                json.dump(self.durations, history, sort_keys=True)
+        except OSError:
+            return
+
+    def _key(self, path: Path) -> str:
+        """Get durations key of given path.
+
+        :param path: File path.
+        :returns: Path relative to linted directory.
+        """
+        if path.is_relative_to(self.root):
+            return path.relative_to(self.root).as_posix()
+        return path.as_posix()
+
+    def _bytes_per_second(self, suffix: str) -> float:
+        """Estimate linting throughput from known durations.
+
+        :param suffix: File suffix to estimate throughput of.
+        :returns: Processed bytes per second.
+        """
+        total_size = 0
+        total_duration = 0.0
+        for key, duration in self.durations.items():
+            if not key.endswith(suffix):
+                continue
+            try:
+                total_size += (self.root / key).stat().st_size
+            except OSError:
+                continue
+            total_duration += duration
+        if total_size <= 0 or total_duration <= 0:
+            return DEFAULT_BYTES_PER_SECOND
+        return total_size / total_duration
+
+    def estimate(self, path: Path, bytes_per_second: float) -> float:
+        """Estimate linting duration of given file.
+
+        :param path: File path.
+        :param bytes_per_second: Throughput to estimate unknown files with.
+        :returns: Estimated duration in seconds.
+        """
+        duration = self.durations.get(self._key(path))
+        if duration is not None:
+            return duration
+        try:
+            return path.stat().st_size / bytes_per_second
+        except OSError:
+            return 0.0
+
+    def order(self, paths: Iterable[Path]) -> list[tuple[Path, float]]:
+        """Order given files by estimated duration, longest first.
+
+        Ties keep discovery order.
+
+        :param paths: File paths.
+        :returns: Array of file paths with estimated durations.
+        """
+        rates: dict[str, float] = {}
+        costs: list[tuple[Path, float]] = []
+        for path in paths:
+            if path.suffix not in rates:
+                rates[path.suffix] = self._bytes_per_second(path.suffix)
+            costs.append((path, self.estimate(path, rates[path.suffix])))
+        costs.sort(key=lambda cost: cost[1], reverse=True)
+        return costs
+
+    def record(self, path: Path, duration: float) -> None:
+        """Record linting duration of given file.
+
+        :param path: File path.
+        :param duration: Duration in seconds.
+        """
+        self.durations[self._key(path)] = duration
+        self.recorded += 1
+
+    def record_makespan(
+        self,
+        phase: str,
+        predicted: float,
+        actual: float,
+    ) -> None:
+        """Record predicted and actual wall time of a linting phase.
+
+        :param phase: Phase name.
+        :param predicted: Predicted wall time in seconds.
+        :param actual: Actual wall time in seconds.
+        """
+        self.makespans[phase] = (predicted, actual)
+
+
+def predict_makespan(costs: Iterable[float], workers: int = 1) -> float:
+    """Predict wall time of running given costs in order on workers.
+
+    Every cost is assigned to the least loaded worker, the same way
+    a process pool picks up queued work.
+
+    :param costs: Ordered estimated durations.
+    :param workers: Amount of parallel workers.
+    :returns: Predicted wall time in seconds.
+    """
+    loads = [0.0] * max(workers, 1)
+    for cost in costs:
+        heapq.heapreplace(loads, loads[0] + cost)
+    return max(loads)
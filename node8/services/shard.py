@@ -0,0 +1,89 @@
+"""Provide deterministic partitioning of linted files between machines.
+
+Every machine discovers the same files and computes the same partition,
+so shards never overlap and together cover the whole project.
+"""
+
+import hashlib
+import heapq
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Final
+
+SHARD_SEPARATOR: Final[str] = "/"
+
+
+def parse_shard(spec: str) -> tuple[int, int]:
+    """Parse shard specification in `index/count` form.
+
+    Shard index starts from one.
+
+    :param spec: Shard specification, e.g. `3/8`.
+    :returns: Shard index and amount of shards.
+    :raises ValueError: If specification is invalid.
+    """
+    index_text, _, count_text = spec.partition(SHARD_SEPARATOR)
+    index = int(index_text)
+    count = int(count_text)
+    if count < 1 or not 1 <= index <= count:
+        msg: str = f"invalid shard: {spec}"
+        raise ValueError(msg)
+    return index, count
+
+
+def _path_hash(path: Path, root: Path) -> str:
+    """Get stable hash of path relative to linted directory.
+
+    :param path: File path.
+    :param root: Linted directory.
+    :returns: Hex digest of relative path.
+    """
+    relative = path.relative_to(root) if path.is_relative_to(root) else path
+    return hashlib.sha256(relative.as_posix().encode()).hexdigest()
+
+
+def _file_size(path: Path) -> int:
+    """Get file size, zero if file is unreadable.
+
+    :param path: File path.
+    :returns: File size in bytes.
+    """
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def select_shard(
+    paths: Iterable[Path],
+    index: int,
+    count: int,
+    root: Path,
+) -> list[Path]:
+    """Select files belonging to given shard.
+
+    Files are assigned biggest first to the least loaded shard, ties are
+    broken by path hash and shard index, so partition only depends on
+    relative paths and sizes of files.
+
+    :param paths: Discovered file paths.
+    :param index: Shard index, starting from one.
+    :param count: Amount of shards.
+    :param root: Linted directory.
+    :returns: Array of file paths of given shard in discovery order.
+    """
+    sizes = {path: _file_size(path) for path in paths}
+    sized = sorted(
+        sizes,
+        key=lambda path: (-sizes[path], _path_hash(path, root)),
+    )
+
+    loads = [(0, shard) for shard in range(1, count + 1)]
+    selected: set[Path] = set()
+    for path in sized:
+        load, shard = heapq.heappop(loads)
+        if shard == index:
+            selected.add(path)
+        heapq.heappush(loads, (load + sizes[path], shard))
+
+    return [path for path in sizes if path in selected]
@@ -0,0 +1,243 @@
+"""Provide error spool and record store to keep memory bounded.
+
+Errors are kept as compact records in memory up to a threshold, then
+sorted and spilled to a temporary file. Reading the spool merges spilled
+runs lazily, so only one record per run is held in memory at a time.
+Project indexes keep their records in a temporary file the same way and
+only hold a few recently used ones in memory.
+"""
+
+import heapq
+import os
+import tempfile
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, MutableMapping
+from types import TracebackType
+from typing import IO, Any, Final, Generic, TypeVar
+
+from pydantic import BaseModel
+
+RecordT = TypeVar("RecordT", bound=BaseModel)
+
+STORE_CACHE_SIZE: Final[int] = 8
+
+
+class Spool(Generic[RecordT]):  # noqa: UP046
+    """Sorted store of error records spilling to temporary files."""
+
+    def __init__(
+        self,
+        model: type[RecordT],
+        key: Callable[[RecordT], Any],
+        threshold: int | None = None,
+    ) -> None:
+        """Initialize empty Spool.
+
+        :param model: Record model class to restore spilled records with.
+        :param key: Sort key of records.
+        :param threshold: Amount of records to keep in memory before
+            spilling them, never spill if None.
+        """
+        self.model = model
+        self.key = key
+        self.threshold = threshold
+        self.records: list[RecordT] = []
+        self.runs: list[IO[str]] = []
+        self._count = 0
+
+    def __len__(self) -> int:
+        """Get amount of spooled records.
+
+        :returns: Amount of records in memory and spilled.
+        """
+        return self._count
+
+    def __iter__(self) -> Iterator[RecordT]:
+        """Iterate over spooled records in sort key order.
+
+        :returns: Iterator over records.
+        """
+        self.records.sort(key=self.key)
+        return heapq.merge(
+            *(self._read_run(run) for run in self.runs),
+            self.records,
+            key=self.key,
+        )
+
+    def __enter__(self) -> "Spool[RecordT]":
+        """Enter spool context.
+
+        :returns: The spool itself.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit spool context, removing spilled runs.
+
+        :param exc_type: Raised exception type.
+        :param exc_value: Raised exception.
+        :param traceback: Raised exception traceback.
+        """
+        self.close()
+
+    def extend(self, records: Iterable[RecordT]) -> None:
+        """Add records to spool, spilling them past threshold.
+
+        :param records: Records to add.
+        """
+        for record in records:
+            self.records.append(record)
+            self._count += 1
+            if self.threshold is not None and (
+                len(self.records) >= self.threshold
+            ):
+                self._spill()
+
+    def close(self) -> None:
+        """Drop all records and remove spilled runs."""
+        for run in self.runs:
+            run.close()
+        self.runs.clear()
+        self.records.clear()
+        self._count = 0
+
+    def _spill(self) -> None:
+        """Write records in memory to a new sorted run."""
+        self.records.sort(key=self.key)
+        run = tempfile.TemporaryFile(mode="w+", encoding="utf-8")  # noqa: SIM115
+        run.writelines(
+            f"{record.model_dump_json()}\n" for record in self.records
+        )
+        self.runs.append(run)
+        self.records.clear()
+
+    def _read_run(self, run: IO[str]) -> Iterator[RecordT]:
+        """Read records of a spilled run.
+
+        :param run: Spilled run file.
+        :returns: Iterator over records.
+        """
+        run.seek(0)
+        for line in run:
+            yield self.model.model_validate_json(line)
+
+
+class RecordStore(MutableMapping[str, RecordT]):
+    """Mapping of records kept in a temporary file.
+
+    Records are written as soon as they are set and read back on lookup,
+    only their offsets and a few recently used records stay in memory.
+    Looked up records are copies, set them again to change them.
+    """
+
+    def __init__(
+        self,
+        model: type[RecordT],
+        cache_size: int = STORE_CACHE_SIZE,
+    ) -> None:
+        """Initialize empty RecordStore.
+
+        :param model: Record model class to restore stored records with.
+        :param cache_size: Amount of recently used records kept in memory.
+        """
+        self.model = model
+        self.cache_size = cache_size
+        self.offsets: dict[str, int] = {}
+        self.cache: OrderedDict[str, RecordT] = OrderedDict()
+        self.file: IO[bytes] = tempfile.TemporaryFile()  # noqa: SIM115
+
+    def __getitem__(self, key: str) -> RecordT:
+        """Get stored record.
+
+        :param key: Record key.
+        :returns: Stored record.
+        """
+        record = self.cache.get(key)
+        if record is None:
+            self.file.seek(self.offsets[key])
+            record = self.model.model_validate_json(self.file.readline())
+        self._remember(key, record)
+        return record
+
+    def __setitem__(self, key: str, record: RecordT) -> None:
+        """Write record to store, replacing previous record of the key.
+
+        :param key: Record key.
+        :param record: Record to store.
+        """
+        self.offsets[key] = self.file.seek(0, os.SEEK_END)
+        self.file.write(f"{record.model_dump_json()}\n".encode())
+        self._remember(key, record)
+
+    def __delitem__(self, key: str) -> None:
+        """Drop stored record.
+
+        :param key: Record key.
+        """
+        del self.offsets[key]
+        self.cache.pop(key, None)
+
+    def __contains__(self, key: object) -> bool:
+        """Check if record is stored without reading it.
+
+        :param key: Record key.
+        :returns: True if record is stored, False otherwise.
+        """
+        return key in self.offsets
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over keys of stored records.
+
+        :returns: Iterator over keys in insertion order.
+        """
+        return iter(self.offsets)
+
+    def __len__(self) -> int:
+        """Get amount of stored records.
+
+        :returns: Amount of records.
+        """
+        return len(self.offsets)
+
+    def __enter__(self) -> "RecordStore[RecordT]":
+        """Enter store context.
+
+        :returns: The store itself.
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit store context, removing the temporary file.
+
+        :param exc_type: Raised exception type.
+        :param exc_value: Raised exception.
+        :param traceback: Raised exception traceback.
+        """
+        self.close()
+
+    def close(self) -> None:
+        """Drop all records and remove the temporary file."""
+        self.file.close()
+        self.offsets.clear()
+        self.cache.clear()
+
+    def _remember(self, key: str, record: RecordT) -> None:
+        """Keep record as most recently used, forgetting the oldest one.
+
+        :param key: Record key.
+        :param record: Record to keep.
+        """
+        self.cache[key] = record
+        self.cache.move_to_end(key)
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
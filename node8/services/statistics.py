@@ -0,0 +1,66 @@
+"""Provide statistics functions to summarize lint errors by location.
+
+Errors are counted as they are iterated over, so statistics never need
+source files nor every error in memory at once.
+"""
+
+from collections import Counter
+from collections.abc import Iterable
+from pathlib import Path
+
+from node8.models.errors import SceneError, ScriptError
+from node8.models.statistics import Statistics
+
+
+def _relative(path: Path, root: Path) -> Path:
+    """Get path relative to linted directory.
+
+    :param path: File path.
+    :param root: Linted directory.
+    :returns: Relative path, path itself if not in directory.
+    """
+    if path.is_relative_to(root):
+        return path.relative_to(root)
+    return path
+
+
+def _ordered(counter: Counter[str]) -> dict[str, int]:
+    """Order amounts from the most to the least, then by key.
+
+    :param counter: Amounts to order.
+    :returns: Ordered amounts.
+    """
+    return dict(sorted(counter.items(), key=lambda item: (-item[1], item[0])))
+
+
+def collect_statistics(
+    root: Path,
+    script_errors: Iterable[ScriptError],
+    scene_errors: Iterable[SceneError],
+) -> Statistics:
+    """Count errors by codename, file and directory.
+
+    :param root: Linted directory.
+    :param script_errors: Script errors to count.
+    :param scene_errors: Scene errors to count.
+    :returns: Error statistics.
+    """
+    codenames: Counter[str] = Counter()
+    files: Counter[Path] = Counter()
+    for errors in (script_errors, scene_errors):
+        for error in errors:
+            codenames[error.error.codename] += 1
+            files[error.path] += 1
+
+    file_amounts: Counter[str] = Counter()
+    directory_amounts: Counter[str] = Counter()
+    for path, amount in files.items():
+        relative = _relative(path, root)
+        file_amounts[relative.as_posix()] += amount
+        directory_amounts[relative.parent.as_posix()] += amount
+    return Statistics(
+        total=codenames.total(),
+        codenames=_ordered(codenames),
+        files=_ordered(file_amounts),
+        directories=_ordered(directory_amounts),
+    )
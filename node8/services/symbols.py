@@ -0,0 +1,657 @@
+"""Provide project-wide symbol index for cross-file rules.
+
+Symbols are collected from already parsed syntax trees, kept per script
+together with its contents digest and persisted in cache directory, so
+unchanged scripts are never parsed again just to know their symbols.
+Index is persisted one script per line, so it can be loaded into and
+saved from a record store without holding it in memory at once.
+"""
+
+import hashlib
+import json
+import re
+from collections import deque
+from collections.abc import Iterable, Iterator, MutableMapping
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Final
+
+from gdtoolkit.parser import parser  # type: ignore[import-untyped]
+from lark import Token, Tree
+from pydantic import ValidationError
+
+from node8.core.config import Config
+from node8.models.symbols import (
+    IndexedScript,
+    ScriptSymbols,
+    Symbol,
+    SymbolIndexHeader,
+)
+from node8.services import lexer
+from node8.services.noqa import get_ignores_tree
+from node8.services.readahead import read_ahead
+
+INDEX_FILENAME: Final[str] = "symbols.jsonl"
+INDEX_VERSION: Final[int] = 3
+
+PROJECT_FILENAME: Final[str] = "project.godot"
+AUTOLOAD_SECTION: Final[str] = "[autoload]"
+RESOURCE_PREFIX: Final[str] = "res://"
+
+TYPE_HINT_TYPE: Final[str] = lexer.DOTTED_NAME_TYPE
+TYPE_NAME_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)*",
+)
+
+CLASS_NAME_STATEMENTS: Final[frozenset[str]] = frozenset(
+    ("classname_stmt", "classname_extends_stmt"),
+)
+EXTENDS_STATEMENTS: Final[frozenset[str]] = frozenset(
+    ("extends_stmt", "classname_extends_stmt"),
+)
+FUNCTION_DEFINITIONS: Final[frozenset[str]] = frozenset(
+    ("func_def", "static_func_def"),
+)
+EXTENDS_KEYWORD: Final[str] = "EXTENDS"
+
+NODE_PATH_EXPRESSIONS: Final[frozenset[str]] = frozenset(
+    ("get_node", "unique_node_path"),
+)
+GET_NODE_FUNCTION: Final[str] = "get_node"
+UNIQUE_NODE_PREFIX: Final[str] = "%"
+STRING_TYPES: Final[frozenset[str]] = frozenset(
+    ("REGULAR_STRING", "LONG_STRING"),
+)
+
+# Variant types and GDScript keywords usable as types, known without
+# engine API description
+BUILTIN_TYPES: Final[frozenset[str]] = frozenset(
+    (
+        "void",
+        "Variant",
+        "bool",
+        "int",
+        "float",
+        "String",
+        "StringName",
+        "NodePath",
+        "Vector2",
+        "Vector2i",
+        "Vector3",
+        "Vector3i",
+        "Vector4",
+        "Vector4i",
+        "Rect2",
+        "Rect2i",
+        "Transform2D",
+        "Transform3D",
+        "Plane",
+        "Quaternion",
+        "AABB",
+        "Basis",
+        "Projection",
+        "Color",
+        "RID",
+        "Object",
+        "Callable",
+        "Signal",
+        "Dictionary",
+        "Array",
+        "PackedByteArray",
+        "PackedInt32Array",
+        "PackedInt64Array",
+        "PackedFloat32Array",
+        "PackedFloat64Array",
+        "PackedStringArray",
+        "PackedVector2Array",
+        "PackedVector3Array",
+        "PackedVector4Array",
+        "PackedColorArray",
+    ),
+)
+
+
+def get_digest(contents: str) -> str:
+    """Get digest of script contents.
+
+    :param contents: Script contents.
+    :returns: Hexadecimal digest.
+    """
+    return hashlib.blake2b(contents.encode()).hexdigest()
+
+
+def _to_symbol(token: Token) -> Symbol:
+    """Create symbol located at given token.
+
+    :param token: Lark token.
+    :returns: Symbol named after token.
+    """
+    line = token.line or 1
+    column = token.column or 1
+    return Symbol(
+        name=str(token),
+        line=line,
+        column=column,
+        end_column=token.end_column or column + len(token),
+    )
+
+
+def _first_name(tree: Tree[Any]) -> Token | None:
+    """Find first name token of given tree.
+
+    :param tree: Lark tree.
+    :returns: Name token, None if not found.
+    """
+    for token in tree.scan_values(lambda value: isinstance(value, Token)):
+        if token.type == lexer.NAME_TYPE:
+            return token  # type: ignore[no-any-return]
+    return None
+
+
+def _get_extends(tree: Tree[Any]) -> str | None:
+    """Get base class of `extends` statement.
+
+    :param tree: Extends statement tree.
+    :returns: Base class name or script path.
+    """
+    skip = tree.data == "classname_extends_stmt"
+    for token in tree.scan_values(lambda value: isinstance(value, Token)):
+        if skip and token.type != EXTENDS_KEYWORD:
+            continue
+        if token.type == EXTENDS_KEYWORD:
+            skip = False
+            continue
+        return str(token).strip("\"'")
+    return None
+
+
+def _collect_header(statement: Tree[Any], symbols: ScriptSymbols) -> None:
+    """Collect `class_name` and `extends` declarations of a script.
+
+    :param statement: Script statement tree.
+    :param symbols: Script symbols to add declarations to.
+    """
+    if statement.data in CLASS_NAME_STATEMENTS:
+        name = _first_name(statement)
+        if name is not None:
+            symbols.class_name = _to_symbol(name)
+    if statement.data in EXTENDS_STATEMENTS:
+        symbols.extends = _get_extends(statement)
+
+
+def _collect_class(
+    tree: Tree[Any],
+    prefix: str,
+    symbols: ScriptSymbols,
+) -> None:
+    """Collect declarations of a class body.
+
+    :param tree: Script or inner class tree.
+    :param prefix: Qualified name prefix of inner class, empty for script.
+    :param symbols: Script symbols to add declarations to.
+    """
+    for statement in tree.children:
+        if not isinstance(statement, Tree):
+            continue
+        kind = statement.data
+        if not prefix:
+            _collect_header(statement, symbols)
+        if kind == "class_def":
+            _collect_named(statement, prefix, symbols.classes)
+            inner_class = symbols.classes[-1].name
+            _collect_class(statement, f"{inner_class}.", symbols)
+        elif kind == "const_stmt" or (
+            kind == "enum_stmt"
+            and next(statement.find_data("enum_named"), None) is not None
+        ):
+            _collect_named(statement, prefix, symbols.types)
+        elif kind == "signal_stmt":
+            _collect_named(statement, "", symbols.signals)
+        elif kind in FUNCTION_DEFINITIONS:
+            header = next(statement.find_data("func_header"), None)
+            if header is not None:
+                _collect_named(header, "", symbols.functions)
+
+
+def _collect_named(
+    tree: Tree[Any],
+    prefix: str,
+    collected: list[Symbol],
+) -> None:
+    """Collect declaration named by the first name token of given tree.
+
+    :param tree: Declaration tree.
+    :param prefix: Qualified name prefix.
+    :param collected: Symbols to add declaration to.
+    """
+    node: Tree[Any] | Token = tree
+    while isinstance(node, Tree) and node.children:
+        node = node.children[0]
+    if isinstance(node, Token) and node.type == lexer.NAME_TYPE:
+        symbol = _to_symbol(node)
+        symbol.name = f"{prefix}{symbol.name}"
+        collected.append(symbol)
+
+
+def _get_literal_path(tree: Tree[Any]) -> str | None:
+    """Get node path of node path expression made of literals.
+
+    :param tree: `$`, `%` or `get_node` call expression tree.
+    :returns: Node path, unique node paths prefixed with `%`, None if
+        path is not a literal.
+    """
+    tokens: list[Token] = list(
+        tree.scan_values(lambda value: isinstance(value, Token)),
+    )
+    if tree.data == "standalone_call":
+        if len(tokens) != 2 or tokens[0] != GET_NODE_FUNCTION:  # noqa: PLR2004
+            return None
+        tokens = tokens[1:]
+        if tokens[0].type not in STRING_TYPES:
+            return None
+    parts = [
+        str(token).strip("\"'") if token.type in STRING_TYPES else str(token)
+        for token in tokens
+    ]
+    return "".join(parts)
+
+
+def _collect_node_paths(tree: Tree[Any], symbols: ScriptSymbols) -> None:
+    """Collect literal node paths the script refers to.
+
+    Inner classes are skipped, since their nodes are not the node the
+    script is attached to.
+
+    :param tree: Script syntax tree.
+    :param symbols: Script symbols to add node paths to.
+    """
+    stack: list[Tree[Any]] = [tree]
+    while stack:
+        subtree = stack.pop()
+        if subtree.data == "class_def":
+            continue
+        if subtree.data in NODE_PATH_EXPRESSIONS or (
+            subtree.data == "standalone_call"
+        ):
+            node_path = _get_literal_path(subtree)
+            if node_path is not None and not subtree.meta.empty:
+                symbols.node_paths.append(
+                    Symbol(
+                        name=node_path,
+                        line=subtree.meta.line,
+                        column=subtree.meta.column,
+                        end_column=(
+                            subtree.meta.end_column
+                            if subtree.meta.end_line == subtree.meta.line
+                            else subtree.meta.column + 1
+                        ),
+                    ),
+                )
+        stack.extend(
+            child
+            for child in reversed(subtree.children)
+            if isinstance(child, Tree)
+        )
+
+
+def collect_symbols(
+    tree: Tree[Any],
+    comment_tree: Tree[Any],
+    digest: str,
+) -> ScriptSymbols:
+    """Collect declared and referenced symbols of a script.
+
+    :param tree: Script syntax tree.
+    :param comment_tree: Script comment tree.
+    :param digest: Script contents digest.
+    :returns: Script symbols.
+    """
+    symbols = ScriptSymbols(
+        digest=digest,
+        noqa_ignores=get_ignores_tree(comment_tree),
+    )
+    _collect_class(tree, "", symbols)
+    _collect_node_paths(tree, symbols)
+    for token in tree.scan_values(
+        lambda value: isinstance(value, Token) and value.type == TYPE_HINT_TYPE,
+    ):
+        symbol = _to_symbol(token)
+        for match in TYPE_NAME_PATTERN.finditer(symbol.name):
+            symbols.type_references.append(
+                symbol.model_copy(
+                    update={
+                        "name": match.group(),
+                        "column": symbol.column + match.start(),
+                        "end_column": symbol.column + match.end(),
+                    },
+                ),
+            )
+    return symbols
+
+
+def _load_engine_types(config: Config) -> frozenset[str]:
+    """Load engine class names from configured engine API description.
+
+    Engine API description is generated by `godot --dump-extension-api`.
+
+    :param config: Linter configuration.
+    :returns: Engine class names, empty if not configured or unreadable.
+    """
+    if config.engine_api is None:
+        return frozenset()
+    try:
+        with Path(config.engine_api).open(mode="r", encoding="utf-8") as api:
+            description = json.load(api)
+        return frozenset(
+            str(entry["name"])
+            for section in ("builtin_classes", "classes", "native_structures")
+            for entry in description.get(section, [])
+        )
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return frozenset()
+
+
+def find_project_root(path: Path) -> Path:
+    """Find Godot project directory containing given path.
+
+    :param path: Linted file or directory.
+    :returns: Nearest directory with `project.godot` walking up from
+        given path, given path itself if there is none.
+    """
+    path = path.absolute()
+    for directory in (path, *path.parents):
+        if (directory / PROJECT_FILENAME).is_file():
+            return directory
+    return path
+
+
+def _load_autoloads(root: Path) -> dict[str, str]:
+    """Load autoload singletons of Godot project.
+
+    :param root: Godot project directory.
+    :returns: Autoload script or scene paths by singleton name.
+    """
+    autoloads: dict[str, str] = {}
+    try:
+        with (root / PROJECT_FILENAME).open(mode="r", encoding="utf-8") as file:
+            lines = file.read().splitlines()
+    except (OSError, UnicodeDecodeError):
+        return autoloads
+    in_section = False
+    for line in map(str.strip, lines):
+        if line.startswith("["):
+            in_section = line == AUTOLOAD_SECTION
+        elif in_section and "=" in line:
+            name, value = line.split("=", 1)
+            autoloads[name.strip()] = value.strip().strip('"').lstrip("*")
+    return autoloads
+
+
+class SymbolIndex:
+    """Project-wide index of script symbols.
+
+    Scripts are keyed by path relative to linted directory, resource
+    paths are resolved against Godot project directory containing it.
+    Lookup tables are derived from script symbols on first query after a
+    change.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        scripts: MutableMapping[str, ScriptSymbols] | None = None,
+        index_path: Path | None = None,
+        config: Config | None = None,
+    ) -> None:
+        """Initialize SymbolIndex class.
+
+        :param root: Linted directory.
+        :param scripts: Known script symbols, e.g. in a record store to
+            keep them out of memory, a new dict if None.
+        :param index_path: File to save index to, None to not save.
+        :param config: Linter configuration.
+        """
+        self.root = root
+        self.project_root = find_project_root(root)
+        self.scripts: MutableMapping[str, ScriptSymbols] = (
+            {} if scripts is None else scripts
+        )
+        self.index_path = index_path
+        self.engine_types = _load_engine_types(config or Config())
+        self.autoloads = _load_autoloads(self.project_root)
+        self.refreshed = False
+        self.failed: set[str] = set()
+        self._class_names: dict[str, list[str]] | None = None
+
+    @classmethod
+    def load(
+        cls,
+        root: Path,
+        config: Config | None = None,
+        scripts: MutableMapping[str, ScriptSymbols] | None = None,
+    ) -> "SymbolIndex":
+        """Load symbol index of previous runs from cache directory.
+
+        Unreadable or outdated index is treated as no index.
+
+        :param root: Linted directory.
+        :param config: Linter configuration.
+        :param scripts: Mapping to load script symbols into, a new dict
+            if None.
+        :returns: SymbolIndex instance.
+        """
+        config = config or Config()
+        index_path = root / config.cache_dir / INDEX_FILENAME
+        scripts = {} if scripts is None else scripts
+        try:
+            with index_path.open(mode="r", encoding="utf-8") as index:
+                header = SymbolIndexHeader.model_validate_json(index.readline())
+                if header.version == INDEX_VERSION:
+                    for line in index:
+                        entry = IndexedScript.model_validate_json(line)
+                        scripts[entry.key] = entry.symbols
+        except (OSError, ValidationError):
+            scripts.clear()
+        return cls(root, scripts, index_path=index_path, config=config)
+
+    def save(self) -> None:
+        """Save symbol index to cache directory."""
+        if self.index_path is None:
+            return
+        header = SymbolIndexHeader(version=INDEX_VERSION)
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.index_path.open(mode="w", encoding="utf-8") as index:
+                index.write(f"{header.model_dump_json()}\n")
+                for key, symbols in self.scripts.items():
+                    entry = IndexedScript(key=key, symbols=symbols)
+                    index.write(f"{entry.model_dump_json()}\n")
+        except OSError:
+            return
+
+    def key(self, path: Path) -> str:
+        """Get index key of given path.
+
+        :param path: Script file path.
+        :returns: Path relative to linted directory.
+        """
+        if path.is_relative_to(self.root):
+            return path.relative_to(self.root).as_posix()
+        return path.as_posix()
+
+    def resource_key(self, resource_path: str) -> str:
+        """Get index key of given resource path.
+
+        :param resource_path: Resource path, e.g. `res://player.gd`.
+        :returns: Path relative to linted directory.
+        """
+        path = self.project_root / resource_path.removeprefix(RESOURCE_PREFIX)
+        root = self.root.absolute()
+        if path.is_relative_to(root):
+            return path.relative_to(root).as_posix()
+        return path.as_posix()
+
+    def update(self, path: Path, symbols: ScriptSymbols | None) -> None:
+        """Replace symbols of given script.
+
+        Scripts that could not be checked during this run are dropped and
+        not parsed again on refresh, so a script that exceeded isolation
+        limits is never parsed without them.
+
+        :param path: Script file path.
+        :param symbols: Current script symbols, None if script failed.
+        """
+        key = self.key(path)
+        if symbols is None:
+            self.failed.add(key)
+            self.scripts.pop(key, None)
+        else:
+            self.scripts[key] = symbols
+        self._class_names = None
+
+    def refresh(
+        self,
+        paths: Iterable[Path],
+        updated: Iterable[Path] = (),
+    ) -> None:
+        """Bring index up to date with given project scripts.
+
+        Only scripts with changed digest are parsed, scripts are read
+        ahead while previous ones are parsed. Scripts that were removed,
+        failed during this run or can not be read or parsed are dropped
+        from index.
+
+        :param paths: All scripts of the project.
+        :param updated: Scripts already updated during this run.
+        """
+        known = {self.key(path) for path in updated} - self.failed
+        skipped = frozenset(known | self.failed)
+        with closing(
+            read_ahead(path for path in paths if self.key(path) not in skipped),
+        ) as scripts:
+            for path, contents in scripts:
+                if isinstance(contents, str):
+                    self._refresh_script(path, contents, known)
+        for key in self.scripts.keys() - known:
+            del self.scripts[key]
+        self._class_names = None
+        self.refreshed = True
+
+    def _refresh_script(
+        self,
+        path: Path,
+        contents: str,
+        known: set[str],
+    ) -> None:
+        """Update index entry of a script if its digest changed.
+
+        :param path: Script file path.
+        :param contents: Script contents.
+        :param known: Keys of scripts present in the project, the script is
+            added unless it can not be parsed or its symbols collected.
+        """
+        key = self.key(path)
+        digest = get_digest(contents)
+        symbols = self.scripts.get(key)
+        if symbols is not None and symbols.digest == digest:
+            known.add(key)
+            return
+        try:
+            comment_tree = parser.parse_comments(contents)
+            tree, _ = lexer.parse(contents)
+            symbols = collect_symbols(tree, comment_tree, digest)
+        except Exception:  # noqa: BLE001
+            return
+        known.add(key)
+        self.update(path, symbols)
+
+    def get(self, path: Path) -> ScriptSymbols | None:
+        """Get symbols of given script.
+
+        :param path: Script file path.
+        :returns: Script symbols, None if script is not indexed.
+        """
+        return self.scripts.get(self.key(path))
+
+    @property
+    def class_names(self) -> dict[str, list[str]]:
+        """Scripts declaring every global class name.
+
+        :returns: Script keys by declared `class_name`.
+        """
+        if self._class_names is None:
+            self._class_names = {}
+            for key in sorted(self.scripts):
+                class_name = self.scripts[key].class_name
+                if class_name is not None:
+                    self._class_names.setdefault(class_name.name, []).append(
+                        key,
+                    )
+        return self._class_names
+
+    def _base_scripts(self, symbols: ScriptSymbols) -> Iterator[ScriptSymbols]:
+        """Iterate over project scripts given script inherits from.
+
+        Every script declaring a duplicated base class name is a base.
+
+        :param symbols: Script symbols.
+        :returns: Iterator over base script symbols, nearest first.
+        """
+        visited: set[str] = set()
+        bases: deque[str | None] = deque([symbols.extends])
+        while bases:
+            base = bases.popleft()
+            if base is None:
+                continue
+            keys = (
+                [self.resource_key(base)]
+                if base.startswith(RESOURCE_PREFIX)
+                else self.class_names.get(base, [])
+            )
+            for key in keys:
+                if key in visited or key not in self.scripts:
+                    continue
+                visited.add(key)
+                yield self.scripts[key]
+                bases.append(self.scripts[key].extends)
+
+    def is_known_type(self, symbols: ScriptSymbols, name: str) -> bool | None:
+        """Resolve type reference made by given script.
+
+        References to engine classes can only be resolved when engine API
+        description is configured.
+
+        :param symbols: Symbols of referencing script.
+        :param name: Referenced type name, possibly qualified.
+        :returns: True if type is known, False if it is unknown, None if
+            it can not be resolved without engine API description.
+        """
+        head, _, rest = name.partition(".")
+        if head in BUILTIN_TYPES or head in self.autoloads:
+            return True
+        for scope in (symbols, *self._base_scripts(symbols)):
+            local_names = [
+                local.name for local in (*scope.classes, *scope.types)
+            ]
+            if any(
+                local == name or local.endswith(f".{name}")
+                for local in local_names
+            ):
+                return True
+            if head in local_names:
+                # members of local constants, e.g. preloaded scripts, are
+                # not resolved
+                return True
+        declaring = self.class_names.get(head)
+        if declaring:
+            return not rest or any(
+                local.name == rest
+                for key in declaring
+                for local in (
+                    *self.scripts[key].classes,
+                    *self.scripts[key].types,
+                )
+            )
+        if head in self.engine_types:
+            return True
+        return False if self.engine_types else None
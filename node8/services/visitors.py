@@ -1,14 +1,22 @@
 """Provide base tree visitor classes to use in linting rule implementations."""
 
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar, Generic, TypeVar
 
-from lark import Tree
+from lark import Token, Tree
 from lark.visitors import Visitor_Recursive
 
 from node8.core.config import Config
 from node8.models.errors import SceneError, ScriptError
+from node8.models.symbols import ScriptSymbols
+from node8.services.references import ReferenceIndex
+from node8.services.scene_table import SceneTable
 from node8.services.scene_tree import SceneTree
+from node8.services.symbols import SymbolIndex
+
+ErrorT = TypeVar("ErrorT", ScriptError, SceneError)
 
 
 class Visitor(Visitor_Recursive[Tree[Any]]):
@@ -17,6 +25,8 @@ class Visitor(Visitor_Recursive[Tree[Any]]):
     Walks GDScript syntax tree and appends rule violations when found.
     """
 
+    codename: ClassVar[str]
+
     def __init__(
         self,
         path: Path,
@@ -36,6 +46,20 @@ class Visitor(Visitor_Recursive[Tree[Any]]):
         self.config = config or Config()
         self.errors: list[ScriptError] = []
 
+    def _call_userfunc(self, tree: Tree[Any]) -> object:
+        """Call rule method named after tree rule, if any.
+
+        Attributes sharing a name with a tree rule, e.g. `path` of
+        `$Node/Path` expressions, are not called.
+
+        :param tree: Visited tree.
+        :returns: Rule method result.
+        """
+        handler = getattr(self, tree.data, None)
+        if not callable(handler):
+            return self.__default__(tree)  # type: ignore[no-untyped-call]
+        return handler(tree)
+
     @classmethod
     def check(
         cls,
@@ -56,9 +80,68 @@ class Visitor(Visitor_Recursive[Tree[Any]]):
         return visitor.errors
 
 
+class TokenVisitor:
+    """Base visitor class for lexical rule visitors.
+
+    Walks GDScript token stream and appends rule violations when found.
+    Tokens are dispatched to methods named after lowercased token type,
+    e.g. `NAME` token is passed to `name` method.
+    """
+
+    codename: ClassVar[str]
+
+    def __init__(
+        self,
+        path: Path,
+        config: Config | None = None,
+    ) -> None:
+        """Initialize TokenVisitor class.
+
+        :param path: Script file path.
+        :param config: Linter configuration.
+        """
+        self.path = path
+        self.config = config or Config()
+        self.errors: list[ScriptError] = []
+
+    def visit(self, tokens: Sequence[Token]) -> None:
+        """Visit every token of given token stream.
+
+        :param tokens: Token stream to visit.
+        """
+        for index, token in enumerate(tokens):
+            handler: Callable[[Sequence[Token], int], None] | None = getattr(
+                self,
+                token.type.lower(),
+                None,
+            )
+            if handler is not None:
+                handler(tokens, index)
+
+    @classmethod
+    def check(
+        cls,
+        path: Path,
+        tokens: Sequence[Token],
+        config: Config | None = None,
+    ) -> list[ScriptError]:
+        """Visit given token stream without initializing class.
+
+        :param path: Script file path.
+        :param tokens: Token stream to visit.
+        :param config: Linter configuration.
+        :returns: List of errors found.
+        """
+        visitor = cls(path, config=config)
+        visitor.visit(tokens)
+        return visitor.errors
+
+
 class SceneVisitor(Visitor_Recursive[SceneTree]):
     """"""
 
+    codename: ClassVar[str]
+
     def __init__(
         self,
         path: Path,
@@ -94,3 +177,176 @@ class SceneVisitor(Visitor_Recursive[SceneTree]):
         visitor = cls(path, tree, config=config)
         visitor.visit(tree)
         return visitor.errors
+
+
+class IndexRule(ABC, Generic[ErrorT]):  # noqa: UP046
+    """Base rule class for rules querying project-wide indexes.
+
+    Subclasses implement the query of their index as an abstract method,
+    so a rule missing it can not be instantiated.
+    """
+
+    codename: ClassVar[str]
+
+    def __init__(self, config: Config | None = None) -> None:
+        """Initialize IndexRule class.
+
+        :param config: Linter configuration.
+        """
+        self.config = config or Config()
+        self.errors: list[ErrorT] = []
+
+
+class SceneTableRule(IndexRule[SceneError]):
+    """Base rule class for project-wide scene rules.
+
+    Queries columnar scene node table of all scenes at once instead of
+    visiting every scene tree.
+    """
+
+    def __init__(
+        self,
+        table: SceneTable,
+        config: Config | None = None,
+        scene_id: int | None = None,
+    ) -> None:
+        """Initialize SceneTableRule class.
+
+        :param table: Scene node table.
+        :param config: Linter configuration.
+        :param scene_id: Scene to query, all scenes if None.
+        """
+        super().__init__(config)
+        self.table = table
+        self.rows = range(len(table))
+        if scene_id is not None:
+            self.rows = table.scene_rows(scene_id)
+
+    @abstractmethod
+    def validate_table(self) -> list[SceneError]:
+        """Query scene table rows for rule violations.
+
+        :returns: List of errors found.
+        """
+
+    @classmethod
+    def check(
+        cls,
+        table: SceneTable,
+        config: Config | None = None,
+        scene_id: int | None = None,
+    ) -> list[SceneError]:
+        """Query given table without initializing class.
+
+        :param table: Scene node table.
+        :param config: Linter configuration.
+        :param scene_id: Scene to query, all scenes if None.
+        :returns: List of errors found.
+        """
+        rule = cls(table, config=config, scene_id=scene_id)
+        return rule.validate_table()
+
+
+class SymbolIndexRule(IndexRule[ScriptError]):
+    """Base rule class for cross-file script rules.
+
+    Queries project symbol index instead of parsing other scripts.
+    """
+
+    def __init__(
+        self,
+        index: SymbolIndex,
+        paths: Iterable[Path],
+        config: Config | None = None,
+    ) -> None:
+        """Initialize SymbolIndexRule class.
+
+        :param index: Project symbol index.
+        :param paths: Scripts to report errors in.
+        :param config: Linter configuration.
+        """
+        super().__init__(config)
+        self.index = index
+        self.paths = list(paths)
+
+    def scripts(self) -> Iterator[tuple[Path, ScriptSymbols]]:
+        """Iterate over indexed scripts to report errors in.
+
+        :returns: Iterator over script paths and symbols.
+        """
+        for path in self.paths:
+            symbols = self.index.get(path)
+            if symbols is not None:
+                yield path, symbols
+
+    @abstractmethod
+    def validate_index(self) -> list[ScriptError]:
+        """Query symbol index for rule violations.
+
+        :returns: List of errors found.
+        """
+
+    @classmethod
+    def check(
+        cls,
+        index: SymbolIndex,
+        paths: Iterable[Path],
+        config: Config | None = None,
+    ) -> list[ScriptError]:
+        """Query given index without initializing class.
+
+        :param index: Project symbol index.
+        :param paths: Scripts to report errors in.
+        :param config: Linter configuration.
+        :returns: List of errors found.
+        """
+        rule = cls(index, paths, config=config)
+        return rule.validate_index()
+
+
+class SceneReferenceRule(IndexRule[ScriptError]):
+    """Base rule class for script rules depending on scenes.
+
+    Queries script-scene cross-reference index instead of loading scenes
+    the script is used in.
+    """
+
+    def __init__(
+        self,
+        references: ReferenceIndex,
+        paths: Iterable[Path],
+        config: Config | None = None,
+    ) -> None:
+        """Initialize SceneReferenceRule class.
+
+        :param references: Script-scene cross-reference index.
+        :param paths: Scripts to report errors in.
+        :param config: Linter configuration.
+        """
+        super().__init__(config)
+        self.references = references
+        self.paths = list(paths)
+
+    @abstractmethod
+    def validate_references(self) -> list[ScriptError]:
+        """Query cross-reference index for rule violations.
+
+        :returns: List of errors found.
+        """
+
+    @classmethod
+    def check(
+        cls,
+        references: ReferenceIndex,
+        paths: Iterable[Path],
+        config: Config | None = None,
+    ) -> list[ScriptError]:
+        """Query given index without initializing class.
+
+        :param references: Script-scene cross-reference index.
+        :param paths: Scripts to report errors in.
+        :param config: Linter configuration.
+        :returns: List of errors found.
+        """
+        rule = cls(references, paths, config=config)
+        return rule.validate_references()
@@ -0,0 +1,125 @@
+"""Provide shared fixtures of linter tests."""
+
+import shutil
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Final
+
+import pytest
+
+from node8.cli import check
+
+TESTDATA: Final[Path] = Path(__file__).parent.parent / "testdata"
+TEST_PROJECT: Final[Path] = TESTDATA / "test_project"
+DEEP_NESTING: Final[int] = 3000
+
+BENCHMARKS_OPTION: Final[str] = "--benchmarks"
+BENCHMARK_MARKER: Final[str] = "benchmark"
+BENCHMARK_REPEAT: Final[int] = 5
+
+Measure = Callable[[Callable[[], object]], float]
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add option to run benchmarks.
+
+    :param parser: Pytest option parser.
+    """
+    parser.addoption(
+        BENCHMARKS_OPTION,
+        action="store_true",
+        default=False,
+        help="run benchmarks, skipped by default",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config,
+    items: list[pytest.Item],
+) -> None:
+    """Skip benchmarks unless asked to run them.
+
+    :param config: Pytest configuration.
+    :param items: Collected tests.
+    """
+    if config.getoption(BENCHMARKS_OPTION):
+        return
+    skip = pytest.mark.skip(reason=f"needs {BENCHMARKS_OPTION} option")
+    for item in items:
+        if BENCHMARK_MARKER in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture
+def measure() -> Measure:
+    """Get function measuring best wall time of a benchmarked function.
+
+    :returns: Function taking benchmarked function, returning seconds.
+    """
+
+    def best_of(func: Callable[[], object]) -> float:
+        timings: list[float] = []
+        for _ in range(BENCHMARK_REPEAT):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    return best_of
+
+
+@pytest.fixture
+def run_cli(monkeypatch: pytest.MonkeyPatch) -> Callable[..., int]:
+    """Get function running the CLI with given arguments.
+
+    :param monkeypatch: Pytest monkeypatch.
+    :returns: Function taking CLI arguments, returning exit code.
+    """
+
+    def run(*args: str) -> int:
+        monkeypatch.setattr(sys, "argv", ["node8", *args])
+        try:
+            check()
+        except SystemExit as exit_error:
+            return int(exit_error.code or 0)
+        return 0
+
+    return run
+
+
+@pytest.fixture
+def testdata() -> Path:
+    """Get directory of test data.
+
+    :returns: Test data directory.
+    """
+    return TESTDATA
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Copy test Godot project to a temporary directory.
+
+    :param tmp_path: Temporary directory.
+    :returns: Root of copied project.
+    """
+    root = tmp_path / "project"
+    shutil.copytree(TEST_PROJECT, root)
+    return root
+
+
+@pytest.fixture
+def deep_script(tmp_path: Path) -> Path:
+    """Write script nested deeper than the recursion limit.
+
+    :param tmp_path: Temporary directory.
+    :returns: Script path.
+    """
+    script = tmp_path / "deep.gd"
+    script.write_text(
+        f"var x = {'(' * DEEP_NESTING}1{')' * DEEP_NESTING}\n",
+        encoding="utf-8",
+    )
+    return script
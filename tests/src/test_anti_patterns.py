@@ -0,0 +1,142 @@
+"""Test GDScript anti-pattern rules."""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Final
+
+import pytest
+from lark import Tree
+
+from node8.core.config import Config
+from node8.services import gdscript, lexer
+from node8.services.rules.anti_patterns import (
+    DEPRECATED_CALL_CODENAME,
+    GET_NODE_FOUND_CODENAME,
+    GetNodeFound,
+)
+
+BENCHMARK_COPIES: Final[int] = 200
+
+Location = tuple[int, int]
+
+
+def _tree_locations(tree: Tree[Any]) -> list[Location]:
+    """Find `get_node` calls the way the former tree rule did.
+
+    :param tree: Script syntax tree.
+    :returns: Sorted call locations.
+    """
+    return sorted(
+        (call.meta.line, call.meta.column)
+        for call in tree.find_data("standalone_call")
+        if call.children[0] == "get_node"
+    )
+
+
+def _token_locations(contents: str) -> list[Location]:
+    """Find `get_node` calls with token rule.
+
+    :param contents: Script contents.
+    :returns: Sorted call locations.
+    """
+    errors = GetNodeFound.check(Path("script.gd"), lexer.tokenize(contents))
+    return sorted((error.line, error.column) for error in errors)
+
+
+def test_get_node_token_rule_matches_tree_rule(testdata: Path) -> None:
+    contents = (testdata / "scripts" / "get_node.gd").read_text(
+        encoding="utf-8",
+    )
+    tree, _ = lexer.parse(contents)
+
+    assert _token_locations(contents) == _tree_locations(tree)
+
+
+def test_get_node_declarations_are_skipped() -> None:
+    contents = (
+        "func get_node(path: NodePath) -> Node:\n"
+        "\treturn super.get_node(path)\n"
+    )
+
+    assert _token_locations(contents) == []
+
+
+def test_get_node_single_line_call_is_highlighted() -> None:
+    contents = 'func _ready() -> void:\n\tvar node = get_node("Node2D")\n'
+
+    errors = GetNodeFound.check(Path("script.gd"), lexer.tokenize(contents))
+
+    assert [(error.column, error.end_column) for error in errors] == [
+        (13, 31),
+    ]
+
+
+def test_deprecated_calls_are_reported(tmp_path: Path) -> None:
+    script = tmp_path / "deprecated.gd"
+    script.write_text(
+        "func _ready() -> void:\n"
+        "\tvar start = OS.get_ticks_msec()\n"
+        "\tyield(get_tree(), 'idle_frame')\n",
+        encoding="utf-8",
+    )
+
+    errors = gdscript.check_contents(
+        script,
+        script.read_text(encoding="utf-8"),
+        config=Config(),
+    )
+
+    deprecated = [
+        error
+        for error in errors
+        if error.error.codename == DEPRECATED_CALL_CODENAME
+    ]
+    assert [error.line for error in deprecated] == [2, 3]
+    assert "Time.get_ticks_msec" in str(deprecated[0].error.help_message)
+
+
+def test_get_node_can_be_ignored(testdata: Path) -> None:
+    script = testdata / "scripts" / "get_node.gd"
+    config = Config(ignores=[GET_NODE_FOUND_CODENAME])
+
+    errors = gdscript.check_contents(
+        script,
+        script.read_text(encoding="utf-8"),
+        config=config,
+    )
+
+    assert GET_NODE_FOUND_CODENAME not in {
+        error.error.codename for error in errors
+    }
+
+
+@pytest.mark.benchmark
+def test_benchmark_token_tier_against_tree_tier(
+    testdata: Path,
+    measure: Callable[[Callable[[], object]], float],
+) -> None:
+    contents = (testdata / "scripts" / "get_node.gd").read_text(
+        encoding="utf-8",
+    )
+    _, _, body = contents.partition("\n")
+    contents = "extends Node\n" + "\n".join(
+        body.replace("func ", f"func copy{copy}_")
+        for copy in range(BENCHMARK_COPIES)
+    )
+    lexer.warm_up()
+
+    def token_tier() -> list[Location]:
+        return _token_locations(contents)
+
+    def tree_tier() -> list[Location]:
+        tree, _ = lexer.parse(contents)
+        return _tree_locations(tree)
+
+    token_seconds = measure(token_tier)
+    tree_seconds = measure(tree_tier)
+    lines = contents.count("\n")
+    print(
+        f"\n{lines} lines: token tier {lines / token_seconds:.0f} lines/s, "
+        f"tree tier {lines / tree_seconds:.0f} lines/s",
+    )
+    assert token_seconds < tree_seconds
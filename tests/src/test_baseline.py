@@ -0,0 +1,63 @@
+"""Test baseline files and filtering."""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Final
+
+import pytest
+
+from node8.services.baseline import DEFAULT_BASELINE, _LineCache
+
+USAGE_ERROR: Final[int] = 2
+
+
+def test_baseline_accepts_current_errors(
+    project: Path,
+    run_cli: Callable[..., int],
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    baseline = project / DEFAULT_BASELINE
+
+    assert run_cli(str(project)) == 1
+    assert run_cli("--write-baseline", str(baseline), str(project)) == 0
+    capsys.readouterr()
+
+    assert run_cli("--baseline", str(baseline), str(project)) == 0
+    assert "Found" not in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("contents", [None, "", "{}", '{"version": "x"}'])
+def test_unloadable_baseline_is_usage_error(
+    project: Path,
+    run_cli: Callable[..., int],
+    capsys: pytest.CaptureFixture[str],
+    contents: str | None,
+) -> None:
+    baseline = project / DEFAULT_BASELINE
+    if contents is not None:
+        baseline.write_text(contents, encoding="utf-8")
+
+    assert run_cli("--baseline", str(baseline), str(project)) == USAGE_ERROR
+    assert "can not load baseline" in capsys.readouterr().err
+
+
+def test_line_cache_drops_least_recently_used(tmp_path: Path) -> None:
+    scripts = [tmp_path / f"{index}.gd" for index in range(3)]
+    for index, script in enumerate(scripts):
+        script.write_text(f"var  x{index} =  1\n", encoding="utf-8")
+    lines = _LineCache(size=2)
+
+    assert lines.get(scripts[0], 1) == "var x0 = 1"
+    assert lines.get(scripts[1], 1) == "var x1 = 1"
+    assert lines.get(scripts[0], 2) == ""
+    assert lines.get(scripts[2], 1) == "var x2 = 1"
+
+    assert list(lines.lines) == [scripts[0], scripts[2]]
+
+
+def test_line_cache_only_splits_on_line_feeds(tmp_path: Path) -> None:
+    script = tmp_path / "script.gd"
+    script.write_text('var x = "\f\v\u2028"\nvar y = 1\n', encoding="utf-8")
+    lines = _LineCache()
+
+    assert lines.get(script, 2) == "var y = 1"
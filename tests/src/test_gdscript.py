@@ -0,0 +1,67 @@
+"""Test GDScript linting of single scripts and whole projects."""
+
+from pathlib import Path
+
+from node8.core.config import Config
+from node8.services import gdscript
+from node8.services.rules import failures
+
+
+def _codenames(path: Path, config: Config | None = None) -> list[str]:
+    """Lint directory of given path and get found codenames.
+
+    :param path: Directory to lint.
+    :param config: Linter configuration.
+    :returns: Sorted codenames of found errors.
+    """
+    return sorted(
+        error.error.codename
+        for error in gdscript.check(path, config=config or Config())
+    )
+
+
+def test_deep_nesting_is_reported_in_process(deep_script: Path) -> None:
+    assert _codenames(deep_script.parent) == [failures.CHECK_FAILED_CODENAME]
+
+
+def test_deep_nesting_does_not_stop_other_scripts(
+    project: Path,
+    deep_script: Path,
+) -> None:
+    (project / "scripts" / deep_script.name).write_text(
+        deep_script.read_text(encoding="utf-8"),
+        encoding="utf-8",
+    )
+
+    errors = gdscript.check(project, config=Config())
+
+    assert {error.path.name for error in errors} >= {
+        deep_script.name,
+        "player.gd",
+    }
+
+
+def test_invalid_utf8_is_reported(tmp_path: Path) -> None:
+    (tmp_path / "binary.gd").write_bytes(b"var x = '\xff\xfe'\n")
+
+    assert _codenames(tmp_path) == [failures.READ_ERROR_CODENAME]
+
+
+def test_syntax_error_is_reported(tmp_path: Path) -> None:
+    (tmp_path / "broken.gd").write_text(
+        "func foo(:\n\tpass\n",
+        encoding="utf-8",
+    )
+
+    errors = gdscript.check(tmp_path, config=Config())
+
+    assert [error.error.codename for error in errors] == [
+        failures.PARSE_ERROR_CODENAME,
+    ]
+    assert errors[0].line == 1
+
+
+def test_failures_can_be_ignored(deep_script: Path) -> None:
+    config = Config(ignores=[failures.CHECK_FAILED_CODENAME])
+
+    assert _codenames(deep_script.parent, config) == []
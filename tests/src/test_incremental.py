@@ -0,0 +1,138 @@
+"""Test function-level incremental script linting."""
+
+from pathlib import Path
+from typing import Final
+
+import pytest
+
+from node8.core.config import Config
+from node8.models.errors import ScriptError
+from node8.services import gdscript
+from node8.services.incremental import Block, IncrementalLinter, split_blocks
+
+SCRIPT_PATH: Final[Path] = Path("player.gd")
+SCRIPT: Final[str] = """extends Node
+
+var speed = 1
+
+
+## Docs.
+func _ready() -> void:
+\tprint(get_node("A"))
+
+
+func _process(delta: float) -> void:
+\tvar label = get_node("B")
+\tprint(label, delta)
+"""
+EDITED_SCRIPT: Final[str] = SCRIPT.replace(
+    "## Docs.\n",
+    "## Docs.\n## More docs.\n",
+).replace('\tprint(get_node("A"))\n', '\tprint(get_node("A"))\n\tpass\n')
+
+
+def _locations(errors: list[ScriptError]) -> list[tuple[str, int, int]]:
+    """Get codenames and locations of given errors.
+
+    :param errors: Script errors.
+    :returns: Array of codenames, lines and columns.
+    """
+    return [
+        (error.error.codename, error.line, error.column) for error in errors
+    ]
+
+
+@pytest.fixture
+def checked_blocks(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Record start lines of blocks checked by incremental linters.
+
+    :param monkeypatch: Pytest monkeypatch.
+    :returns: Array of start lines of checked blocks, in check order.
+    """
+    starts: list[int] = []
+    check_block = IncrementalLinter._check_block  # noqa: SLF001
+
+    def record(
+        linter: IncrementalLinter,
+        path: Path,
+        block: Block,
+    ) -> list[ScriptError]:
+        starts.append(block.start)
+        return check_block(linter, path, block)
+
+    monkeypatch.setattr(IncrementalLinter, "_check_block", record)
+    return starts
+
+
+def test_split_blocks_keeps_leading_comments() -> None:
+    blocks = split_blocks(SCRIPT)
+
+    assert [block.start for block in blocks] == [1, 3, 6, 11]
+    assert blocks[2].contents.startswith("## Docs.\nfunc _ready()")
+    assert "".join(block.contents for block in blocks) == SCRIPT
+
+
+def test_incremental_check_matches_whole_check() -> None:
+    errors = IncrementalLinter().check(SCRIPT_PATH, SCRIPT)
+
+    assert _locations(errors) == _locations(
+        gdscript.check_contents(SCRIPT_PATH, SCRIPT, Config()),
+    )
+    assert _locations(errors) == [("N001", 8, 8), ("N001", 12, 14)]
+
+
+def test_unchanged_blocks_are_reused_and_shifted(
+    checked_blocks: list[int],
+) -> None:
+    linter = IncrementalLinter()
+    linter.check(SCRIPT_PATH, SCRIPT)
+    checked_blocks.clear()
+
+    errors = linter.check(SCRIPT_PATH, EDITED_SCRIPT)
+
+    assert checked_blocks == [6]
+    assert _locations(errors) == [("N001", 9, 8), ("N001", 14, 14)]
+    assert _locations(errors) == _locations(
+        gdscript.check_contents(SCRIPT_PATH, EDITED_SCRIPT, Config()),
+    )
+
+
+def test_unparsable_block_falls_back_to_whole_check(
+    checked_blocks: list[int],
+) -> None:
+    broken = SCRIPT.replace("-> void:\n\tvar", "-> void\n\tvar")
+    linter = IncrementalLinter()
+    linter.check(SCRIPT_PATH, SCRIPT)
+    checked_blocks.clear()
+
+    errors = linter.check(SCRIPT_PATH, broken)
+
+    assert checked_blocks == [11]
+    assert _locations(errors) == _locations(
+        gdscript.check_contents(SCRIPT_PATH, broken, Config()),
+    )
+    assert [error.error.codename for error in errors] == ["E999"]
+    assert len(linter.blocks[SCRIPT_PATH]) == 1
+
+
+def test_ignored_parse_error_falls_back_to_whole_check() -> None:
+    broken = SCRIPT.replace("-> void:\n\tvar", "-> void\n\tvar")
+    config = Config(ignores=["E999"])
+
+    errors = IncrementalLinter(config).check(SCRIPT_PATH, broken)
+
+    assert errors == gdscript.check_contents(SCRIPT_PATH, broken, config)
+    assert errors == []
+
+
+def test_only_line_feeds_split_lines() -> None:
+    script = SCRIPT.replace('"A"', '"A\f\v\u2028"').replace(
+        "delta)",
+        f"delta)  # {'x' * 80}",
+    )
+
+    blocks = split_blocks(script)
+    errors = IncrementalLinter().check(SCRIPT_PATH, script)
+
+    assert [block.start for block in blocks] == [1, 3, 6, 11]
+    assert ("E001", 13, 80) in _locations(errors)
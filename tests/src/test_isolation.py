@@ -0,0 +1,118 @@
+"""Test isolated script checks with time budget and memory cap."""
+
+import re
+import sys
+from pathlib import Path
+from typing import Any, Final
+
+import pytest
+from lark import Token, Tree
+
+from node8.core.config import Config
+from node8.services import gdscript, lexer
+from node8.services.rules import failures
+
+SLOW_FUNCTIONS: Final[int] = 3000
+TIME_BUDGET: Final[float] = 0.5
+HUNGRY_MARKER: Final[str] = "# hungry"
+MEMORY_MARGIN: Final[int] = 64
+BYTES_IN_MEGABYTE: Final[int] = 1024 * 1024
+VIRTUAL_MEMORY_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r"VmSize:\s+(\d+) kB",
+)
+SCRIPT: Final[str] = "extends Node\n\n\nfunc Bad() -> void:\n\tpass\n"
+
+
+def _check_offending(
+    root: Path,
+    offending: str,
+    config: Config,
+) -> tuple[list[tuple[str, str]], list[tuple[str, str]]]:
+    """Check offending script followed by ordinary scripts.
+
+    :param root: Directory to write scripts to.
+    :param offending: Contents of the offending script.
+    :param config: Linter configuration.
+    :returns: Script names and codenames of errors of ordinary scripts
+        checked alone, and of all scripts checked with configuration.
+    """
+    paths = [root / f"script{index}.gd" for index in range(3)]
+    for path in paths[1:]:
+        path.write_text(SCRIPT, encoding="utf-8")
+    expected = _check(root, paths[1:], Config())
+    paths[0].write_text(offending, encoding="utf-8")
+    return expected, _check(root, paths, config)
+
+
+def _check(
+    root: Path,
+    paths: list[Path],
+    config: Config,
+) -> list[tuple[str, str]]:
+    """Check given scripts.
+
+    :param root: Linted directory.
+    :param paths: Scripts to check, in order.
+    :param config: Linter configuration.
+    :returns: Array of script names and codenames of errors.
+    """
+    return [
+        (error.path.name, error.error.codename)
+        for error in gdscript.check(root, config=config, paths=paths)
+    ]
+
+
+def _virtual_memory() -> int:
+    """Get virtual memory size of this process.
+
+    :returns: Virtual memory size in megabytes.
+    """
+    status = Path("/proc/self/status").read_text(encoding="utf-8")
+    match = VIRTUAL_MEMORY_PATTERN.search(status)
+    assert match is not None
+    return int(match.group(1)) // 1024
+
+
+def test_time_budget_is_reported(tmp_path: Path) -> None:
+    slow = "extends Node\n" + "".join(
+        f"\n\nfunc f{index}() -> void:\n\tprint({index})\n"
+        for index in range(SLOW_FUNCTIONS)
+    )
+    expected, errors = _check_offending(
+        tmp_path,
+        slow,
+        Config(time_budget=TIME_BUDGET),
+    )
+
+    assert errors[0] == ("script0.gd", failures.TIME_BUDGET_CODENAME)
+    assert errors[1:] == expected
+    assert expected
+
+
+@pytest.mark.skipif(
+    sys.platform != "linux",
+    reason="needs forked workers and address space limit",
+)
+def test_memory_cap_is_reported(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    memory_cap = _virtual_memory() + MEMORY_MARGIN
+    parse = lexer.parse
+
+    def hungry(code: str) -> tuple[Tree[Any], list[Token]]:
+        if code.startswith(HUNGRY_MARKER):
+            bytearray(memory_cap * BYTES_IN_MEGABYTE)
+        return parse(code)
+
+    monkeypatch.setattr(lexer, "parse", hungry)
+
+    expected, errors = _check_offending(
+        tmp_path,
+        f"{HUNGRY_MARKER}\n{SCRIPT}",
+        Config(memory_cap=memory_cap),
+    )
+
+    assert errors[0] == ("script0.gd", failures.MEMORY_CAP_CODENAME)
+    assert errors[1:] == expected
+    assert expected
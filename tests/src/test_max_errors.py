@@ -0,0 +1,107 @@
+"""Test early exit at maximal amount of errors."""
+
+from collections.abc import Callable, Iterator
+from itertools import cycle, islice
+from pathlib import Path
+from typing import Final
+
+import pytest
+
+from node8.core.config import Config
+from node8.services import gdscript
+from node8.services.schedule import History
+
+SCRIPTS: Final[int] = 6
+MAX_ERRORS: Final[int] = 3
+DISCOVERABLE: Final[int] = 1000
+
+
+@pytest.fixture
+def dirty(tmp_path: Path) -> Path:
+    """Write scripts with two errors each.
+
+    :param tmp_path: Temporary directory.
+    :returns: Directory with scripts.
+    """
+    for index in range(SCRIPTS):
+        (tmp_path / f"{index}.gd").write_text(
+            f'extends Node\n\n\nfunc _ready() -> void:\n\tget_node("A{index}")'
+            f'\n\tget_node("B{index}")\n',
+            encoding="utf-8",
+        )
+    return tmp_path
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_check_stops_at_max_errors(dirty: Path, jobs: int) -> None:
+    history = History(dirty)
+
+    errors = gdscript.check(
+        dirty,
+        config=Config(),
+        jobs=jobs,
+        history=history,
+        max_errors=MAX_ERRORS,
+    )
+
+    assert len(errors) == MAX_ERRORS
+    assert history.recorded < SCRIPTS
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_check_stops_discovery_at_max_errors(dirty: Path, jobs: int) -> None:
+    discovered: list[Path] = []
+
+    def discover() -> Iterator[Path]:
+        scripts = sorted(dirty.glob("*.gd"))
+        for script_path in islice(cycle(scripts), DISCOVERABLE):
+            discovered.append(script_path)
+            yield script_path
+
+    errors = gdscript.check(
+        dirty,
+        config=Config(),
+        jobs=jobs,
+        paths=discover(),
+        max_errors=MAX_ERRORS,
+    )
+
+    assert len(errors) == MAX_ERRORS
+    assert len(discovered) < DISCOVERABLE
+
+
+def test_check_without_max_errors_checks_all(dirty: Path) -> None:
+    history = History(dirty)
+
+    errors = gdscript.check(dirty, config=Config(), history=history)
+
+    assert len(errors) == SCRIPTS * 2
+    assert history.recorded == SCRIPTS
+
+
+@pytest.mark.parametrize(
+    ("args", "reported"),
+    [
+        (("--fail-fast",), "Found 1 errors."),
+        (("--max-errors", str(MAX_ERRORS)), f"Found {MAX_ERRORS} errors."),
+        ((), f"Found {SCRIPTS * 2} errors."),
+    ],
+)
+def test_cli_reports_at_most_max_errors(
+    dirty: Path,
+    run_cli: Callable[..., int],
+    capsys: pytest.CaptureFixture[str],
+    args: tuple[str, ...],
+    reported: str,
+) -> None:
+    assert run_cli(*args, str(dirty)) == 1
+    assert reported in capsys.readouterr().out
+
+
+def test_cli_succeeds_without_errors(
+    tmp_path: Path,
+    run_cli: Callable[..., int],
+) -> None:
+    (tmp_path / "clean.gd").write_text("extends Node\n", encoding="utf-8")
+
+    assert run_cli("--fail-fast", str(tmp_path)) == 0
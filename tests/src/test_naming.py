@@ -0,0 +1,133 @@
+"""Test GDScript naming rules."""
+
+import json
+from pathlib import Path
+from typing import Final
+
+import pytest
+
+from node8.core.config import Config
+from node8.services import gdscript
+
+PROJECT: Final[str] = '[autoload]\n\nEvents="*res://events.gd"\n'
+ENGINE_API: Final[dict[str, list[dict[str, str]]]] = {
+    "classes": [{"name": "Node"}],
+    "builtin_classes": [{"name": "float"}, {"name": "String"}],
+}
+SCRIPTS: Final[dict[str, str]] = {
+    "events.gd": "extends Node\n",
+    "player.gd": "class_name Player\nextends Node\n\nvar speed: float\n",
+    "player_state.gd": (
+        "class_name Player\nextends Node\n\nclass State:\n\tvar name: String\n"
+    ),
+    "user.gd": (
+        "extends Player\n\n"
+        "var state: Player.State\n"
+        "var inherited: State\n"
+        "var events: Events\n"
+        "var local: Local\n"
+        "var missing: Missing\n"
+        "var missing_inner: Player.Missing\n\n"
+        "class Local:\n\tvar owner: Node\n"
+    ),
+    "names.gd": (
+        "class_name bad_name\nextends Node\n\n"
+        "signal HitTaken\nsignal hit_taken\n\n"
+        "class inner_class:\n\tpass\n\n"
+        "class _Private:\n\tpass\n\n\n"
+        "func MovePlayer() -> void:\n\tpass\n\n\n"
+        "func _move_player() -> void:\n\tpass\n"
+    ),
+}
+
+
+@pytest.fixture
+def naming_project(tmp_path: Path) -> Path:
+    """Write project breaking naming rules, with engine API description.
+
+    :param tmp_path: Temporary directory.
+    :returns: Project directory.
+    """
+    (tmp_path / "project.godot").write_text(PROJECT, encoding="utf-8")
+    (tmp_path / "api.json").write_text(
+        json.dumps(ENGINE_API),
+        encoding="utf-8",
+    )
+    for name, contents in SCRIPTS.items():
+        (tmp_path / name).write_text(contents, encoding="utf-8")
+    return tmp_path
+
+
+def _check(root: Path, config: Config) -> list[tuple[str, str, int, str]]:
+    """Check project, keeping naming errors.
+
+    :param root: Project directory.
+    :param config: Linter configuration.
+    :returns: Array of codenames, script names, lines and messages.
+    """
+    return [
+        (error.error.codename, error.path.name, error.line, error.error.message)
+        for error in gdscript.check(root, config=config)
+        if error.error.codename.startswith("NM")
+    ]
+
+
+def test_duplicate_class_names_are_reported(naming_project: Path) -> None:
+    errors = _check(naming_project, Config())
+
+    assert [error for error in errors if error[0] == "NM001"] == [
+        (
+            "NM001",
+            "player_state.gd",
+            1,
+            "`Player` is also declared in player.gd",
+        ),
+        (
+            "NM001",
+            "player.gd",
+            1,
+            "`Player` is also declared in player_state.gd",
+        ),
+    ]
+
+
+def test_unknown_types_are_reported(naming_project: Path) -> None:
+    config = Config(engine_api=str(naming_project / "api.json"))
+
+    errors = _check(naming_project, config)
+
+    assert [error for error in errors if error[0] == "NM002"] == [
+        ("NM002", "user.gd", 7, "unknown type `Missing`"),
+        ("NM002", "user.gd", 8, "unknown type `Player.Missing`"),
+    ]
+
+
+def test_unknown_types_need_engine_api(naming_project: Path) -> None:
+    errors = _check(naming_project, Config())
+
+    assert [error for error in errors if error[0] == "NM002"] == [
+        ("NM002", "user.gd", 8, "unknown type `Player.Missing`"),
+    ]
+
+
+def test_names_not_in_convention_case_are_reported(
+    naming_project: Path,
+) -> None:
+    errors = _check(naming_project, Config(ignores=["NM001", "NM002"]))
+
+    assert errors == [
+        ("NM003", "names.gd", 1, "`bad_name` class name is not in PascalCase"),
+        (
+            "NM003",
+            "names.gd",
+            7,
+            "`inner_class` class name is not in PascalCase",
+        ),
+        (
+            "NM004",
+            "names.gd",
+            14,
+            "`MovePlayer` function name is not in snake_case",
+        ),
+        ("NM005", "names.gd", 4, "`HitTaken` signal name is not in snake_case"),
+    ]
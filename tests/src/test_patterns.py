@@ -0,0 +1,140 @@
+"""Test declarative tree-pattern rules."""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Final
+
+import pytest
+
+from node8.core.config import Config
+from node8.models.patterns import PatternRule
+from node8.services import gdscript, lexer
+from node8.services.patterns import PatternTable, parse_pattern, validate_rules
+
+USAGE_ERROR: Final[int] = 2
+SCRIPT: Final[str] = """extends Node
+
+
+func _ready() -> void:
+\tprint("ready")
+\tprints("a", "b")
+\tOS.alert("hi")
+"""
+TOKEN_RULES_ONLY: Final[list[str]] = [
+    "D001",
+    "NM001",
+    "NM002",
+    "NM003",
+    "NM004",
+    "NM005",
+    "NP001",
+]
+BAN: Final[PatternRule] = PatternRule(
+    pattern="standalone_call(0=print|prints, 0=$name)",
+    message="`$name` found",
+    codename="B100",
+    help_message="Remove `$name`",
+)
+
+
+def test_parse_pattern() -> None:
+    pattern = parse_pattern("getattr_call(0.0=OS, -1.2=alert|crash, 0=$call)")
+
+    assert pattern.node_type == "getattr_call"
+    assert pattern.constraints == {
+        (0, 0): frozenset(("OS",)),
+        (-1, 2): frozenset(("alert", "crash")),
+    }
+    assert pattern.captures == {"call": (0,)}
+
+
+@pytest.mark.parametrize("pattern", ["", "call(", "call(x=1)", "call(0=)"])
+def test_invalid_pattern_is_rejected(pattern: str) -> None:
+    rule = PatternRule(pattern=pattern, message="found")
+
+    with pytest.raises(ValueError, match="invalid"):
+        validate_rules([rule])
+    with pytest.raises(ValueError, match="invalid"):
+        PatternTable([rule])
+
+
+def test_pattern_table_reports_matches() -> None:
+    tree, _ = lexer.parse(SCRIPT)
+    errors = PatternTable([BAN]).check(Path("ban.gd"), tree)
+
+    assert [
+        (error.error.message, error.error.help_message, error.line)
+        for error in errors
+    ] == [
+        ("`print` found", "Remove `print`", 5),
+        ("`prints` found", "Remove `prints`", 6),
+    ]
+
+
+def test_configured_bans_are_checked(tmp_path: Path) -> None:
+    script = tmp_path / "ban.gd"
+    script.write_text(SCRIPT, encoding="utf-8")
+
+    errors = gdscript.check(tmp_path, config=Config(bans=[BAN]))
+
+    assert [error.error.codename for error in errors] == ["B100", "B100"]
+    assert (
+        gdscript.check(
+            tmp_path,
+            config=Config(bans=[BAN], ignores=["B100"]),
+        )
+        == []
+    )
+
+
+def test_invalid_configured_ban_is_usage_error(
+    tmp_path: Path,
+    run_cli: Callable[..., int],
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    (tmp_path / "gdproject.toml").write_text(
+        '[node8]\nbans = [{pattern = "call(x=1)", message = "found"}]\n',
+        encoding="utf-8",
+    )
+
+    assert run_cli(str(tmp_path)) == USAGE_ERROR
+    assert "invalid ban" in capsys.readouterr().err
+
+
+def test_pattern_table_may_match_scripts_with_token_values() -> None:
+    tree_types = lexer.get_tree_types()
+    nested = PatternRule(pattern="standalone_call(0=getattr_call)", message="")
+
+    assert PatternTable([BAN], tree_types).may_match(SCRIPT)
+    assert not PatternTable([BAN], tree_types).may_match("extends Node\n")
+    assert PatternTable([nested], tree_types).may_match("extends Node\n")
+    assert PatternTable([BAN]).may_match("extends Node\n")
+    assert not PatternTable([], tree_types).may_match(SCRIPT)
+
+
+def test_scripts_no_pattern_can_match_are_not_parsed(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    (tmp_path / "ban.gd").write_text(SCRIPT, encoding="utf-8")
+    (tmp_path / "clean.gd").write_text(
+        SCRIPT.replace("print", "push_warning"),
+        encoding="utf-8",
+    )
+    parsed: list[str] = []
+    parse = lexer.parse
+
+    def record(code: str) -> tuple[Any, ...]:
+        parsed.append(code)
+        return parse(code)
+
+    monkeypatch.setattr(lexer, "parse", record)
+    config = Config(bans=[BAN], ignores=TOKEN_RULES_ONLY)
+
+    errors = gdscript.check(tmp_path, config=config)
+
+    assert [(error.path.name, error.line) for error in errors] == [
+        ("ban.gd", 5),
+        ("ban.gd", 6),
+    ]
+    assert parsed == [SCRIPT]
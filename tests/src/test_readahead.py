@@ -0,0 +1,174 @@
+"""Test read-ahead file reading and decoding."""
+
+import codecs
+import os
+import sys
+import time
+from collections.abc import Callable, Generator, Iterable, Iterator
+from pathlib import Path
+from typing import Final
+
+import pytest
+
+from node8.core.config import Config
+from node8.services import gdscript
+from node8.services.readahead import (
+    MMAP_THRESHOLD,
+    ReadResult,
+    read_ahead,
+    read_text,
+    try_read_text,
+)
+
+CONTENTS: Final[str] = 'extends Node\n\nfunc _ready() -> void:\n\tprint("ok")\n'
+INVALID_LINE: Final[bytes] = b"# caf\xe9\n"
+BENCHMARK_FILES: Final[int] = 1000
+BENCHMARK_REPEAT: Final[int] = 5
+WARM_TOLERANCE: Final[float] = 1.1
+
+
+def test_read_text_skips_byte_order_mark(tmp_path: Path) -> None:
+    path = tmp_path / "bom.gd"
+    path.write_bytes(codecs.BOM_UTF8 + CONTENTS.encode())
+
+    assert read_text(path) == CONTENTS
+
+
+def test_read_text_translates_newlines(tmp_path: Path) -> None:
+    path = tmp_path / "crlf.gd"
+    path.write_bytes(CONTENTS.replace("\n", "\r\n").encode() + b"pass\r")
+
+    assert read_text(path) == f"{CONTENTS}pass\n"
+
+
+def test_read_text_maps_large_files(tmp_path: Path) -> None:
+    path = tmp_path / "large.gd"
+    repeat = MMAP_THRESHOLD // len(CONTENTS) + 1
+    contents = CONTENTS * repeat
+    path.write_bytes(codecs.BOM_UTF8 + contents.replace("\n", "\r\n").encode())
+
+    assert path.stat().st_size >= MMAP_THRESHOLD
+    assert read_text(path) == contents
+
+
+def test_read_text_rejects_invalid_utf8(tmp_path: Path) -> None:
+    path = tmp_path / "latin.gd"
+    path.write_bytes(INVALID_LINE)
+
+    assert isinstance(try_read_text(path), UnicodeDecodeError)
+    assert isinstance(try_read_text(tmp_path / "missing.gd"), OSError)
+
+
+def test_read_text_rejects_large_invalid_utf8(tmp_path: Path) -> None:
+    path = tmp_path / "latin.gd"
+    repeat = MMAP_THRESHOLD // len(INVALID_LINE) + 1
+    path.write_bytes(INVALID_LINE * repeat)
+
+    assert path.stat().st_size >= MMAP_THRESHOLD
+    assert isinstance(try_read_text(path), UnicodeDecodeError)
+    assert [error.error.codename for error in gdscript.check(tmp_path)] == [
+        "E902",
+    ]
+
+
+@pytest.mark.parametrize("reader", ["prefetch", "threads"])
+def test_read_ahead_keeps_order(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    reader: str,
+) -> None:
+    if reader == "threads":
+        monkeypatch.delattr(os, "posix_fadvise", raising=False)
+    paths = [tmp_path / f"{index}.gd" for index in range(10)]
+    for index, path in enumerate(paths):
+        path.write_text(f"# {index}\n", encoding="utf-8")
+    paths.insert(1, tmp_path / "missing.gd")
+
+    results = list(read_ahead(paths, workers=3, depth=2))
+
+    assert [path for path, _ in results] == paths
+    assert isinstance(results.pop(1)[1], OSError)
+    assert [contents for _, contents in results] == [
+        f"# {index}\n" for index in range(10)
+    ]
+
+
+def _evict(paths: list[Path]) -> None:
+    """Drop given files from page cache.
+
+    :param paths: Files to evict.
+    """
+    for path in paths:
+        with path.open(mode="rb") as file:
+            os.fsync(file.fileno())
+            os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def _read_sequentially(
+    paths: Iterable[Path],
+    *args: object,
+) -> Generator[tuple[Path, ReadResult]]:
+    """Read files one after another, without reading ahead.
+
+    :param paths: Files to read.
+    :param args: Ignored read-ahead options.
+    :returns: Iterator over file paths and their contents or read errors.
+    """
+    for path in paths:
+        yield path, try_read_text(path)
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(sys.platform != "linux", reason="needs posix_fadvise")
+def test_benchmark_cold_and_warm_cache(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    paths = [tmp_path / f"script{index}.gd" for index in range(BENCHMARK_FILES)]
+    for path in paths:
+        path.write_text(CONTENTS, encoding="utf-8")
+    config = Config()
+
+    def lint(
+        reader: Callable[..., Iterator[tuple[Path, ReadResult]]],
+        *,
+        cold: bool,
+    ) -> tuple[float, float]:
+        stalls: list[float] = []
+
+        def timed(
+            *args: object,
+        ) -> Generator[tuple[Path, ReadResult]]:
+            results = reader(*args)
+            while True:
+                start = time.perf_counter()
+                result = next(results, None)
+                stalls.append(time.perf_counter() - start)
+                if result is None:
+                    return
+                yield result
+
+        monkeypatch.setattr(gdscript, "read_ahead", timed)
+        best_total, best_stall = float("inf"), float("inf")
+        for _ in range(BENCHMARK_REPEAT):
+            if cold:
+                _evict(paths)
+            stalls.clear()
+            start = time.perf_counter()
+            gdscript.check(tmp_path, config=config, paths=paths)
+            best_total = min(best_total, time.perf_counter() - start)
+            best_stall = min(best_stall, sum(stalls))
+        return best_total, best_stall
+
+    warm_sequential, _ = lint(_read_sequentially, cold=False)
+    warm_ahead, _ = lint(read_ahead, cold=False)
+    cold_sequential, stall_sequential = lint(_read_sequentially, cold=True)
+    cold_ahead, stall_ahead = lint(read_ahead, cold=True)
+    print(
+        f"\ncold cache: sequential {cold_sequential:.3f}s "
+        f"({stall_sequential:.3f}s reading), read-ahead {cold_ahead:.3f}s "
+        f"({stall_ahead:.3f}s reading); warm cache: sequential "
+        f"{warm_sequential:.3f}s, read-ahead {warm_ahead:.3f}s",
+    )
+    assert stall_ahead < stall_sequential
+    assert warm_ahead <= warm_sequential * WARM_TOLERANCE
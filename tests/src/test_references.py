@@ -0,0 +1,63 @@
+"""Test script-scene cross-reference index and node path rule."""
+
+from pathlib import Path
+
+import pytest
+
+from node8.services import gdscript
+from node8.services.references import ReferenceIndex, join_node_path
+from node8.services.symbols import SymbolIndex, find_project_root
+
+
+def _check_references(root: Path) -> list[tuple[str, str, int]]:
+    """Validate node paths of scripts in given directory.
+
+    :param root: Linted directory.
+    :returns: Array of codenames, script names and lines of errors.
+    """
+    references = ReferenceIndex(root, SymbolIndex(root))
+    return [
+        (error.error.codename, error.path.name, error.line)
+        for error in gdscript.check_references(root, references)
+    ]
+
+
+@pytest.mark.parametrize(
+    ("base", "node_path", "expected"),
+    [
+        (".", "A/B", "A/B"),
+        ("A/B", "../C", "A/C"),
+        ("A", "..", "."),
+        (".", "..", None),
+        (".", "/root/A", None),
+    ],
+)
+def test_join_node_path(
+    base: str,
+    node_path: str,
+    expected: str | None,
+) -> None:
+    assert join_node_path(base, node_path) == expected
+
+
+def test_project_root_is_found_above_linted_directory(project: Path) -> None:
+    scripts = project / "scripts"
+
+    assert find_project_root(scripts) == project
+    assert find_project_root(project.parent) == project.parent
+    assert (
+        ReferenceIndex(scripts, SymbolIndex(scripts)).key(
+            scripts / "player.gd",
+        )
+        == "res://scripts/player.gd"
+    )
+
+
+def test_broken_node_path_is_reported(project: Path) -> None:
+    assert _check_references(project) == [("NP001", "player.gd", 17)]
+
+
+def test_broken_node_path_is_reported_in_subdirectory(project: Path) -> None:
+    assert _check_references(project / "scripts") == [
+        ("NP001", "player.gd", 17),
+    ]
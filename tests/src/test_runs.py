@@ -0,0 +1,76 @@
+"""Test run history store and throughput regression detection."""
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Final
+
+import pytest
+
+from node8.models.runs import RunRecord
+from node8.services.runs import (
+    append_run,
+    find_regressions,
+    get_runs_path,
+    load_runs,
+)
+
+WINDOW: Final[int] = 3
+THRESHOLD: Final[float] = 0.2
+RECORDED_RUNS: Final[int] = 2
+
+
+def _runs(*throughputs: float) -> list[RunRecord]:
+    """Create run records of given throughputs.
+
+    :param throughputs: Files per second of every run, oldest first.
+    :returns: Array of run records.
+    """
+    return [
+        RunRecord(started=index, duration=1.0, files_per_second=throughput)
+        for index, throughput in enumerate(throughputs)
+    ]
+
+
+def test_regressions_are_flagged_against_rolling_median() -> None:
+    drops = find_regressions(
+        _runs(100, 100, 90, 70, 100, 0, 100),
+        window=WINDOW,
+        threshold=THRESHOLD,
+    )
+
+    assert drops[:3] == [None, None, None]
+    assert drops[3] == pytest.approx(0.3)
+    assert drops[4] is None
+    assert drops[5] == pytest.approx(1.0)
+    assert drops[6] is None
+
+
+def test_runs_are_appended_and_loaded(tmp_path: Path) -> None:
+    path = get_runs_path(tmp_path)
+    runs = _runs(10, 20)
+    for run in runs:
+        append_run(path, run)
+    with path.open(mode="a", encoding="utf-8") as runs_file:
+        runs_file.write("{not a run\n")
+
+    assert load_runs(path) == runs
+    assert load_runs(tmp_path / "missing.jsonl") == []
+
+
+def test_cli_records_runs_and_flags_regressions(
+    project: Path,
+    run_cli: Callable[..., int],
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    for _ in range(RECORDED_RUNS):
+        run_cli("--record", str(project))
+    path = get_runs_path(project)
+
+    recorded = load_runs(path)
+    assert len(recorded) == RECORDED_RUNS
+    assert all(run.files > 0 and run.errors > 0 for run in recorded)
+    assert "scripts" in recorded[0].phases
+    capsys.readouterr()
+
+    append_run(path, recorded[-1].model_copy(update={"files_per_second": 0}))
+    assert run_cli("stats", str(project)) == 1
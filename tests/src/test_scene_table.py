@@ -0,0 +1,57 @@
+"""Test columnar scene node table and scene table rules."""
+
+from pathlib import Path
+
+import pytest
+
+from node8.core.config import Config
+from node8.models.errors import SceneError
+from node8.services.rules.complexity import SceneTooNested
+from node8.services.scene_table import SceneTable
+from node8.services.visitors import SceneTableRule
+
+
+@pytest.fixture
+def table(testdata: Path) -> SceneTable:
+    """Build scene table of test project scenes.
+
+    :param testdata: Test data directory.
+    :returns: Scene table of `game`, `player` and `shitty_node` scenes.
+    """
+    scenes = testdata / "test_project" / "scenes"
+    return SceneTable.from_scene_paths(sorted(scenes.glob("*.tscn")))
+
+
+def test_scene_table_queries(table: SceneTable) -> None:
+    assert [path.name for path in table.paths] == [
+        "game.tscn",
+        "player.tscn",
+        "shitty_node.tscn",
+    ]
+    assert table.node_counts() == [10, 4, 3]
+    assert table.max_depths() == [5, 1, 1]
+    assert table.type_histogram(1)["Sprite2D"] == 1
+
+
+def test_scene_too_nested_queries_table(table: SceneTable) -> None:
+    errors = SceneTooNested.check(table, Config())
+
+    assert [error.error.message for error in errors] == [
+        "`Node2D` is too nested (4 > 3)",
+        "`What` is too nested (5 > 3)",
+    ]
+    assert SceneTooNested.check(table, Config(), scene_id=1) == []
+    assert SceneTooNested.check(table, Config(max_scene_indent=5)) == []
+
+
+def test_scene_table_rule_needs_query() -> None:
+    class Incomplete(SceneTableRule):
+        codename = "SC999"
+
+    class Complete(Incomplete):
+        def validate_table(self) -> list[SceneError]:
+            return self.errors
+
+    with pytest.raises(TypeError, match="validate_table"):
+        Incomplete.check(SceneTable())
+    assert Complete.check(SceneTable()) == []
@@ -0,0 +1,109 @@
+"""Test scene checks and scene suppressions."""
+
+from pathlib import Path
+from typing import Final
+
+import godot_parser
+import pytest
+
+from node8.core.config import Config
+from node8.services import scenes
+
+GAME_NODE: Final[str] = '[node name="game" type="Node2D"]\n'
+BROKEN_SCENE: Final[str] = '[gd_scene format=3]\n\n[node name="Broken"\n'
+
+
+@pytest.fixture
+def parsed(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record contents of scenes parsed by scene checks.
+
+    :param monkeypatch: Pytest monkeypatch.
+    :returns: Array of parsed scene contents, in parse order.
+    """
+    contents: list[str] = []
+    parse = godot_parser.parse
+
+    def record(scene_contents: str) -> godot_parser.GDFile:
+        contents.append(scene_contents)
+        return parse(scene_contents)
+
+    monkeypatch.setattr(godot_parser, "parse", record)
+    return contents
+
+
+def _check(project: Path, config: Config) -> list[tuple[str, str]]:
+    """Check scenes of given project.
+
+    :param project: Project directory.
+    :param config: Linter configuration.
+    :returns: Array of codenames and scene names of errors.
+    """
+    return sorted(
+        (error.error.codename, error.path.name)
+        for error in scenes.check(project, config=config)
+    )
+
+
+def _add_noqa(scene: Path, value: str) -> None:
+    """Add `noqa` metadata to root node of scene.
+
+    :param scene: Scene file path.
+    :param value: Metadata value, e.g. `"SC001"` or `true`.
+    """
+    contents = scene.read_text(encoding="utf-8")
+    scene.write_text(
+        contents.replace(GAME_NODE, f"{GAME_NODE}metadata/noqa = {value}\n"),
+        encoding="utf-8",
+    )
+
+
+def test_nested_scene_is_reported(project: Path, parsed: list[str]) -> None:
+    assert _check(project, Config()) == [
+        ("SC001", "game.tscn"),
+        ("SC001", "game.tscn"),
+    ]
+    assert len(parsed) == len(list(project.rglob("*.tscn")))
+
+
+def test_ignored_rules_skip_loading(project: Path, parsed: list[str]) -> None:
+    assert _check(project, Config(ignores=["SC001"])) == []
+    assert parsed == []
+
+
+def test_scene_ignores_skip_matching_scenes(
+    project: Path,
+    parsed: list[str],
+) -> None:
+    config = Config(scene_ignores={"scenes/g*.tscn": ["SC001"]})
+
+    assert _check(project, config) == []
+    assert len(parsed) == len(list(project.rglob("*.tscn"))) - 1
+    assert not any(GAME_NODE in contents for contents in parsed)
+
+
+@pytest.mark.parametrize("value", ['"SC001"', '"E999, SC001"', "true"])
+def test_noqa_metadata_skips_parsing(
+    project: Path,
+    parsed: list[str],
+    value: str,
+) -> None:
+    _add_noqa(project / "scenes" / "game.tscn", value)
+
+    assert _check(project, Config()) == []
+    assert not any(GAME_NODE in contents for contents in parsed)
+
+
+def test_unloadable_scene_is_reported(project: Path) -> None:
+    broken = project / "scenes" / "broken.tscn"
+    broken.write_text(BROKEN_SCENE, encoding="utf-8")
+    config = Config(scene_ignores={"scenes/broken.tscn": ["E999"]})
+
+    assert _check(project, Config()).count(("E999", "broken.tscn")) == 1
+    assert _check(project, config).count(("E999", "broken.tscn")) == 0
+    assert _check(project, Config(ignores=["SC001"])) == []
+
+    broken.write_text(
+        BROKEN_SCENE.replace("\n\n", "\n\nmetadata/noqa = true\n"),
+        encoding="utf-8",
+    )
+    assert _check(project, Config()).count(("E999", "broken.tscn")) == 0
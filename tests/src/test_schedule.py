@@ -0,0 +1,95 @@
+"""Test history-aware longest-first scheduling."""
+
+from pathlib import Path
+
+import pytest
+
+from node8.core.config import Config
+from node8.services import gdscript
+from node8.services.gdscript import SCRIPTS_PHASE
+from node8.services.schedule import (
+    DEFAULT_BYTES_PER_SECOND,
+    History,
+    predict_makespan,
+)
+
+
+def _write_sized(root: Path, sizes: dict[str, int]) -> list[Path]:
+    """Write files of given sizes.
+
+    :param root: Directory to write files to.
+    :param sizes: File sizes in bytes by file name.
+    :returns: Array of written file paths in given order.
+    """
+    paths: list[Path] = []
+    for name, size in sizes.items():
+        path = root / name
+        path.write_bytes(b"#" * size)
+        paths.append(path)
+    return paths
+
+
+def test_unknown_files_are_ordered_by_size(tmp_path: Path) -> None:
+    small, large, same = _write_sized(
+        tmp_path,
+        {"small.gd": 10, "large.gd": 1000, "same.gd": 10},
+    )
+
+    order = History(tmp_path).order([small, large, same])
+
+    assert [path for path, _ in order] == [large, small, same]
+
+
+def test_unknown_files_are_estimated_with_known_throughput(
+    tmp_path: Path,
+) -> None:
+    slow, large, scene = _write_sized(
+        tmp_path,
+        {"slow.gd": 10, "large.gd": 40, "large.tscn": 40},
+    )
+    history = History(tmp_path, {"slow.gd": 5.0})
+
+    order = history.order([slow, scene, large])
+
+    assert [path for path, _ in order] == [large, slow, scene]
+    assert [cost for _, cost in order] == pytest.approx(
+        [20.0, 5.0, 40 / DEFAULT_BYTES_PER_SECOND],
+    )
+
+
+def test_history_is_saved_and_loaded(project: Path) -> None:
+    history = History.load(project)
+    gdscript.check(project, config=Config(), history=history)
+    history.save()
+
+    loaded = History.load(project)
+
+    assert loaded.durations.keys() == {
+        path.relative_to(project).as_posix() for path in project.rglob("*.gd")
+    }
+    assert SCRIPTS_PHASE in history.makespans
+
+
+def test_unreadable_history_is_no_history(project: Path) -> None:
+    history_path = project / Config().cache_dir / "durations.json"
+    history_path.parent.mkdir()
+    history_path.write_text("[1, 2]", encoding="utf-8")
+
+    assert History.load(project).durations == {}
+
+
+@pytest.mark.parametrize(
+    ("costs", "workers", "expected"),
+    [
+        ([4.0, 3.0, 2.0, 1.0], 1, 10.0),
+        ([4.0, 3.0, 2.0, 1.0], 2, 5.0),
+        ([1.0, 1.0, 4.0], 2, 5.0),
+        ([], 4, 0.0),
+    ],
+)
+def test_predict_makespan(
+    costs: list[float],
+    workers: int,
+    expected: float,
+) -> None:
+    assert predict_makespan(costs, workers) == expected
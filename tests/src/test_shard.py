@@ -0,0 +1,121 @@
+"""Test shard partitioning and merging of shard results."""
+
+import shutil
+from collections.abc import Callable
+from pathlib import Path
+from typing import Final
+
+import pytest
+
+from node8.services.results import load_results
+from node8.services.shard import parse_shard, select_shard
+
+SHARDS: Final[int] = 3
+USAGE_ERROR: Final[int] = 2
+
+
+def test_parse_shard() -> None:
+    assert parse_shard("3/8") == (3, 8)
+    for spec in ("0/8", "9/8", "1/0", "1", "a/b"):
+        with pytest.raises(ValueError, match="invalid"):
+            parse_shard(spec)
+
+
+def test_shards_partition_files(tmp_path: Path) -> None:
+    paths: list[Path] = []
+    for index in range(20):
+        path = tmp_path / f"{index}.gd"
+        path.write_bytes(b"#" * (index * 100 + 1))
+        paths.append(path)
+
+    shards = [
+        select_shard(paths, index, SHARDS, tmp_path)
+        for index in range(1, SHARDS + 1)
+    ]
+
+    assert sorted(path for shard in shards for path in shard) == sorted(paths)
+    assert all(shard == sorted(shard, key=paths.index) for shard in shards)
+    loads = [sum(path.stat().st_size for path in shard) for shard in shards]
+    assert max(loads) - min(loads) <= max(path.stat().st_size for path in paths)
+
+
+def test_shards_do_not_depend_on_location(tmp_path: Path) -> None:
+    names = [f"{index}.gd" for index in range(10)]
+    roots = [tmp_path / "a", tmp_path / "b" / "nested"]
+    for root in roots:
+        root.mkdir(parents=True)
+        for name in names:
+            (root / name).write_text(name, encoding="utf-8")
+
+    selected = [
+        [
+            path.name
+            for path in select_shard(
+                [root / name for name in reversed(names)],
+                2,
+                SHARDS,
+                root,
+            )
+        ]
+        for root in roots
+    ]
+
+    assert selected[0] == selected[1]
+
+
+def test_merged_shards_match_single_run(
+    project: Path,
+    tmp_path: Path,
+    run_cli: Callable[..., int],
+    capsys: pytest.CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    checkout = tmp_path / "checkout"
+    shutil.copytree(project, checkout)
+    monkeypatch.chdir(project)
+    single_code = run_cli(str(project))
+    single_output = capsys.readouterr().out
+
+    results = [
+        tmp_path / f"shard{index}.json" for index in range(1, SHARDS + 1)
+    ]
+    for index, result in enumerate(results, start=1):
+        root = project if index == 1 else checkout
+        assert (
+            run_cli(
+                "--shard",
+                f"{index}/{SHARDS}",
+                "-o",
+                str(result),
+                str(root),
+            )
+            == 0
+        )
+    capsys.readouterr()
+    script_errors, scene_errors = load_results(results, project)
+    merge_code = run_cli("merge", *map(str, results))
+
+    assert script_errors
+    assert scene_errors
+    assert all(
+        error.path.is_relative_to(project)
+        for error in [*script_errors, *scene_errors]
+    )
+    assert str(project) not in results[0].read_text(encoding="utf-8")
+    assert merge_code == single_code == 1
+    assert capsys.readouterr().out == single_output
+
+
+@pytest.mark.parametrize("contents", [None, "", "{", '{"script_errors": 1}'])
+def test_unloadable_results_are_usage_error(
+    tmp_path: Path,
+    run_cli: Callable[..., int],
+    capsys: pytest.CaptureFixture[str],
+    contents: str | None,
+) -> None:
+    result = tmp_path / "shard.json"
+    if contents is not None:
+        result.write_text(contents, encoding="utf-8")
+
+    assert run_cli("merge", str(result)) == USAGE_ERROR
+    assert "can not load results" in capsys.readouterr().err
@@ -0,0 +1,189 @@
+"""Test error spool, record store and low memory mode."""
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Final
+
+import pytest
+
+from node8.models.errors import Error, ScriptError
+from node8.models.references import SceneReferences
+from node8.models.symbols import ScriptSymbols
+from node8.services.spool import RecordStore, Spool
+from node8.services.symbols import SymbolIndex
+
+GROUPS: Final[int] = 10
+NODES_PER_GROUP: Final[int] = 30
+ERRORED_LINES: Final[int] = 2000
+SMALL_PROJECT: Final[int] = 8
+LARGE_PROJECT: Final[int] = 32
+BYTES_IN_KILOBYTE: Final[int] = 1024
+ALLOWED_GROWTH: Final[float] = 1.1
+EXPECTED_GROWTH: Final[float] = 1.5
+SPILL_THRESHOLD: Final[int] = 3
+PEAK_MEMORY_SCRIPT: Final[str] = """
+import atexit, pathlib, sys
+from node8.cli import check
+atexit.register(lambda: sys.stderr.write(
+    pathlib.Path("/proc/self/status").read_text(encoding="utf-8"),
+))
+check()
+"""
+PEAK_MEMORY_PATTERN: Final[re.Pattern[str]] = re.compile(r"VmHWM:\s+(\d+) kB")
+
+
+def _script_error(path: str, line: int) -> ScriptError:
+    """Create script error at given location.
+
+    :param path: Script file path.
+    :param line: Errored line.
+    :returns: Script error.
+    """
+    return ScriptError(
+        error=Error(codename="N001", message="found"),
+        path=Path(path),
+        line=line,
+        column=1,
+        end_column=2,
+    )
+
+
+def test_spool_sorts_spilled_runs() -> None:
+    errors = [_script_error(f"{index % 3}.gd", index) for index in range(10)]
+
+    with Spool(
+        ScriptError,
+        lambda error: error.line,
+        threshold=SPILL_THRESHOLD,
+    ) as spool:
+        spool.extend(reversed(errors))
+
+        assert len(spool.runs) == len(errors) // SPILL_THRESHOLD
+        assert len(spool) == len(errors)
+        assert list(spool) == errors
+
+
+def test_record_store_reads_evicted_records() -> None:
+    with RecordStore(SceneReferences, cache_size=1) as store:
+        store["res://a.tscn"] = SceneReferences(nodes={".", "A"})
+        store["res://b.tscn"] = SceneReferences(nodes={"."})
+        store["res://a.tscn"] = SceneReferences(nodes={".", "A", "B"})
+
+        assert list(store.cache) == ["res://a.tscn"]
+        assert store["res://b.tscn"].nodes == {"."}
+        assert store["res://a.tscn"].nodes == {".", "A", "B"}
+        assert list(store) == ["res://a.tscn", "res://b.tscn"]
+
+        del store["res://b.tscn"]
+
+        assert "res://b.tscn" not in store
+        assert store.get("res://b.tscn") is None
+
+
+def test_symbol_index_loads_into_record_store(project: Path) -> None:
+    index = SymbolIndex.load(project)
+    index.refresh(project.rglob("*.gd"))
+    index.save()
+
+    with RecordStore(ScriptSymbols) as store:
+        loaded = SymbolIndex.load(project, scripts=store)
+
+        assert loaded.scripts is store
+        assert dict(store) == dict(index.scripts)
+
+
+def _write_project(root: Path, scenes: int) -> None:
+    """Write Godot project of given amount of large scenes.
+
+    Every script has a long comment on most of its lines, so errors
+    outnumber spill threshold of low memory mode in any project.
+
+    :param root: Project directory.
+    :param scenes: Amount of scenes, each with its own script.
+    """
+    (root / "scripts").mkdir(parents=True)
+    (root / "scenes").mkdir()
+    (root / "project.godot").write_text("config_version=5\n", encoding="utf-8")
+    for scene in range(scenes):
+        (root / "scripts" / f"node{scene}.gd").write_text(
+            "extends Node\n\n\nfunc _ready() -> void:\n"
+            f"\tprint($Missing{scene})\n"
+            + "".join(
+                f"# {line:04d} {'x' * 100}\n" for line in range(ERRORED_LINES)
+            ),
+            encoding="utf-8",
+        )
+        lines = [
+            "[gd_scene load_steps=2 format=3]",
+            (
+                '[ext_resource type="Script" '
+                f'path="res://scripts/node{scene}.gd" id="1"]'
+            ),
+            '[node name="Root" type="Node2D"]\nscript = ExtResource("1")',
+        ]
+        for group in range(GROUPS):
+            lines.append(f'[node name="Group{group}" type="Node2D" parent="."]')
+            lines.extend(
+                f'[node name="Node{node}" type="Sprite2D" '
+                f'parent="Group{group}"]\nposition = Vector2({node}, {group})'
+                for node in range(NODES_PER_GROUP)
+            )
+        (root / "scenes" / f"scene{scene}.tscn").write_text(
+            "\n\n".join(lines),
+            encoding="utf-8",
+        )
+
+
+def _peak_memory(root: Path, *args: str) -> float:
+    """Lint given project in a new process and get its peak memory.
+
+    Peak is read from `/proc` by the linting process itself, since
+    resource usage of a child includes peak of the forked test process.
+    Errors are summarized instead of rendered to keep the run short.
+
+    :param root: Project directory.
+    :param args: Additional CLI arguments.
+    :returns: Peak resident set size in megabytes.
+    """
+    process = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-c",
+            PEAK_MEMORY_SCRIPT,
+            "--statistics",
+            "json",
+            *args,
+            str(root),
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=False,
+    )
+    match = PEAK_MEMORY_PATTERN.search(process.stderr)
+    assert match is not None, process.stderr
+    return int(match.group(1)) / BYTES_IN_KILOBYTE
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(sys.platform != "linux", reason="needs /proc")
+def test_benchmark_low_memory_peak_memory(tmp_path: Path) -> None:
+    small = tmp_path / "small"
+    large = tmp_path / "large"
+    _write_project(small, SMALL_PROJECT)
+    _write_project(large, LARGE_PROJECT)
+
+    small_peak = _peak_memory(small, "--low-memory")
+    large_peak = _peak_memory(large, "--low-memory")
+    small_default_peak = _peak_memory(small)
+    large_default_peak = _peak_memory(large)
+    print(
+        f"\npeak memory with low memory: {SMALL_PROJECT} scenes "
+        f"{small_peak:.1f} MB, {LARGE_PROJECT} scenes {large_peak:.1f} MB; "
+        f"without: {SMALL_PROJECT} scenes {small_default_peak:.1f} MB, "
+        f"{LARGE_PROJECT} scenes {large_default_peak:.1f} MB",
+    )
+    assert large_peak <= small_peak * ALLOWED_GROWTH
+    assert large_default_peak >= small_default_peak * EXPECTED_GROWTH
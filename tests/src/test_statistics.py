@@ -0,0 +1,82 @@
+"""Test error statistics summary mode."""
+
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Final
+
+import pytest
+
+from node8 import cli
+from node8.models.errors import Error, ScriptError
+from node8.models.statistics import Statistics
+from node8.services.statistics import collect_statistics
+
+LOCATIONS: Final[tuple[tuple[str, str], ...]] = (
+    ("N001", "a/x.gd"),
+    ("N001", "a/x.gd"),
+    ("N002", "a/y.gd"),
+    ("N001", "b/z.gd"),
+    ("B001", "w.gd"),
+)
+
+
+def _script_errors(root: Path) -> Iterator[ScriptError]:
+    """Iterate over script errors in a few files and directories.
+
+    :param root: Linted directory.
+    :returns: Iterator over script errors.
+    """
+    for codename, path in LOCATIONS:
+        yield ScriptError(
+            error=Error(codename=codename, message="found"),
+            path=root / path,
+            line=1,
+            column=1,
+            end_column=2,
+        )
+
+
+def test_statistics_are_ordered_by_amount(tmp_path: Path) -> None:
+    statistics = collect_statistics(tmp_path, _script_errors(tmp_path), [])
+
+    assert statistics.total == len(LOCATIONS)
+    assert list(statistics.codenames.items()) == [
+        ("N001", 3),
+        ("B001", 1),
+        ("N002", 1),
+    ]
+    assert list(statistics.files.items()) == [
+        ("a/x.gd", 2),
+        ("a/y.gd", 1),
+        ("b/z.gd", 1),
+        ("w.gd", 1),
+    ]
+    assert list(statistics.directories.items()) == [
+        ("a", 3),
+        (".", 1),
+        ("b", 1),
+    ]
+
+
+def test_cli_statistics_skip_error_rendering(
+    project: Path,
+    run_cli: Callable[..., int],
+    capsys: pytest.CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    run_cli(str(project))
+    reported = capsys.readouterr().out
+
+    def fail(*args: object, **kwargs: object) -> int:
+        pytest.fail("errors were rendered")
+
+    monkeypatch.setattr(cli, "print_errors", fail)
+
+    assert run_cli("--statistics", "json", str(project)) == 1
+    statistics = Statistics.model_validate_json(capsys.readouterr().out)
+    assert f"Found {statistics.total} errors." in reported
+    assert sum(statistics.files.values()) == statistics.total
+    assert all(not Path(file).is_absolute() for file in statistics.files)
+
+    assert run_cli("--statistics", "--top", "1", str(project)) == 1
+    assert "N001" in capsys.readouterr().out
@@ -0,0 +1,42 @@
+"""Test project symbol index."""
+
+from pathlib import Path
+
+from node8.core.config import Config
+from node8.services import gdscript
+from node8.services.rules import failures
+from node8.services.symbols import SymbolIndex
+
+
+def test_refresh_indexes_changed_scripts(project: Path) -> None:
+    index = SymbolIndex(project)
+    index.refresh(project.rglob("*.gd"))
+
+    symbols = index.get(project / "scripts" / "player.gd")
+    assert symbols is not None
+    assert index.refreshed
+
+
+def test_refresh_skips_failed_scripts(project: Path) -> None:
+    script = project / "scripts" / "player.gd"
+    index = SymbolIndex(project)
+    index.update(script, None)
+    index.refresh(project.rglob("*.gd"))
+
+    assert index.get(script) is None
+    assert index.get(project / "scripts" / "shitty_node.gd") is not None
+
+
+def test_refresh_drops_scripts_symbols_fail_on(deep_script: Path) -> None:
+    index = SymbolIndex(deep_script.parent)
+    index.refresh([deep_script])
+
+    assert index.get(deep_script) is None
+
+
+def test_isolated_failure_is_not_parsed_again(deep_script: Path) -> None:
+    errors = gdscript.check(deep_script.parent, config=Config(), jobs=2)
+
+    assert [error.error.codename for error in errors] == [
+        failures.CHECK_FAILED_CODENAME,
+    ]
@@ -0,0 +1,25 @@
+extends Node
+
+
+func get_node_or_default(path: NodePath) -> Node:
+	return get_node(path) if has_node(path) else self
+
+
+func get_node(path: NodePath) -> Node:
+	return super.get_node(path)
+
+
+static func get_node_count() -> int:
+	return 0
+
+
+func _ready() -> void:
+	var sprite: Sprite2D = get_node("Sprite2D")
+	get_node("Label").text = "ready"
+	$Label.get_node("Shadow").visible = false
+	add_child(get_node(^"Child").duplicate())
+	var callback := func(): return get_node("Lazy")
+	callback.call()
+	sprite.visible = get_node(
+		"Flag"
+	).visible